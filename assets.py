@@ -0,0 +1,284 @@
+"""
+assets.py
+
+Wspólny bufor (cache) grafik używanych przez sprite'y gry.
+
+Zamiast wczytywać plik PNG z dysku przy tworzeniu każdej asteroidy,
+UFO, power-upa czy wybuchu, klasy proszą moduł o gotową powierzchnię
+(`pygame.Surface`). Kluczem wpisu jest krotka *(ścieżka, rozmiar, flagi)*,
+więc ten sam obrazek przeskalowany do innego rozmiaru to osobny wpis,
+a obrazek bazowy (bez skalowania) jest współdzielony przez wszystkie
+warianty.
+
+Zakres odpowiedzialności
+---------------------------
+* leniwe wczytywanie i skalowanie grafik (`image()`),
+* cięcie arkuszy animacji na klatki, z przycięciem i skalą (`frames()`),
+* wstępne ładowanie znanych zasobów przed rozgrywką (`preload()`),
+* manifest wszystkich grafik gry (`IMAGES`, `OPAQUE_IMAGES`) - wczytuje
+  go równolegle `loader.AssetLoader`, a gotowe powierzchnie trafiają
+  do bufora przez `store()`,
+* wczytanie gotowych wariantów z atlasu (`load_atlas()`) - atlas buduje
+  offline `build_atlas.py`, a przy starcie czytane są tylko dwa pliki,
+* ograniczenie rozmiaru bufora - najdawniej używane wpisy są usuwane (LRU),
+* liczniki trafień/chybień pozwalające sprawdzić, czy gra sięga na dysk,
+* obrócone wersje grafik w skwantowanych kątach (`rotated()`), dzięki
+  czemu rysowanie statku, płomieni i pocisków to tylko odczyt i blit.
+
+Zwracane powierzchnie są współdzielone - klasy nie mogą ich modyfikować
+(rysować po nich); wolno je jedynie blit-ować lub transformować do kopii.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+import pygame
+from config import config
+from constants import ROTATION_STEP, ROTATION_CACHE_MB
+
+# --- flagi wpisu ---------------------------------------------------------- #
+ALPHA  = 1   # convert_alpha() zamiast convert()
+SMOOTH = 2   # smoothscale zamiast scale przy zmianie rozmiaru
+
+
+# --- manifest grafik ------------------------------------------------------ #
+def _pngs(directory: str) -> tuple[str, ...]:
+    # ścieżki w tej samej postaci co w kodzie sprite'ów ("assets/…/x.png")
+    return tuple(sorted(p.as_posix() for p in Path(directory).glob("*.png")))
+
+
+IMAGES = (
+    *_pngs("assets/asteroid"),
+    *_pngs("assets/powerup"),
+    "assets/player.png",
+    "assets/laser.png",
+    "assets/ufo.png",
+    "assets/thruster_flame_sheet.png",
+    "assets/explosion_sprite_sheet_fixed.png",
+)
+OPAQUE_IMAGES = ("assets/background.png",)    # bez kanału alfa – convert()
+
+# --- atlas (`build_atlas.py`) ---------------------------------------------- #
+ATLAS_IMAGE = "assets/atlas.png"
+ATLAS_INDEX = "assets/atlas.json"
+ATLAS_VERSION = 2
+
+
+def atlas_index(path: str = ATLAS_INDEX) -> dict | None:
+    """Indeks atlasu lub None, gdy atlasu nie ma albo jest starszy od źródeł.
+
+    Świeżość sprawdzana jest po czasach modyfikacji zapisanych przy budowie
+    (`os.stat` - bez czytania samych plików)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != ATLAS_VERSION:
+            return None
+        for source, mtime in index["sources"].items():
+            if os.stat(source).st_mtime_ns != mtime:
+                return None
+    except (OSError, ValueError, KeyError):
+        return None
+    return index
+
+
+class AssetCache:
+    """Bufor powierzchni z limitem wpisów i prostymi statystykami.
+
+    Parametry
+    ---------
+    max_entries : int
+        Maksymalna liczba przechowywanych wpisów; po jej przekroczeniu
+        usuwany jest najdawniej użyty wpis.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------
+    def _get(self, key):
+        # Zwraca wpis (oznaczając go jako ostatnio użyty) lub None.
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def _put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    # ------------------------------------------------------------
+    def image(self, path: str, size: tuple[int, int] | None = None,
+              flags: int = ALPHA) -> pygame.Surface:
+        """Zwraca obrazek z pliku *path*, opcjonalnie przeskalowany do *size*."""
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, flags)
+        surf = self._get(key)
+        if surf is not None:
+            return surf
+
+        if size is None:
+            # wczytanie z dysku – jedyne miejsce, w którym bufor czyta plik
+            self.disk_loads += 1
+            raw = pygame.image.load(path)
+            surf = raw.convert_alpha() if flags & ALPHA else raw.convert()
+        else:
+            base = self.image(path, None, flags & ALPHA)
+            scale = pygame.transform.smoothscale if flags & SMOOTH else pygame.transform.scale
+            surf = scale(base, size)
+        return self._put(key, surf)
+
+    def frames(self, path: str, frame_size: tuple[int, int] | None, count: int,
+               flags: int = ALPHA, trim: int | None = None,
+               scale: float = 1.0) -> tuple[pygame.Surface, ...]:
+        """Tnie poziomy arkusz animacji na *count* klatek o rozmiarze *frame_size*
+        (None - arkusz dzielony po równo: szerokość / *count* × wysokość).
+
+        *trim* przycina każdą klatkę do obszaru pikseli o alfie ≥ *trim*
+        (usuwa pustą ramkę), *scale* skaluje klatki po przycięciu."""
+        key = (path, ("frames", frame_size and tuple(frame_size), count, trim, scale), flags)
+        frames = self._get(key)
+        if frames is not None:
+            return frames
+
+        sheet = self.image(path, None, flags)
+        fw, fh = frame_size or (sheet.get_width() // count, sheet.get_height())
+        frames = tuple(sheet.subsurface((i * fw, 0, fw, fh)) for i in range(count))
+        if trim is not None:
+            frames = tuple(f.subsurface(f.get_bounding_rect(min_alpha=trim)) for f in frames)
+        if scale != 1.0:
+            frames = tuple(pygame.transform.scale(f, (int(f.get_width() * scale),
+                                                      int(f.get_height() * scale)))
+                           for f in frames)
+        return self._put(key, frames)
+
+    def store(self, path: str, raw: pygame.Surface, flags: int = ALPHA) -> None:
+        """Przyjmuje obrazek wczytany poza buforem (np. w wątku ładującym).
+
+        Konwersja formatu odbywa się tutaj – na wątku głównym."""
+        key = (path, None, flags & ALPHA)
+        if key not in self._entries:
+            self.disk_loads += 1
+            self._put(key, raw.convert_alpha() if flags & ALPHA else raw.convert())
+
+    def load_atlas(self, sheet: pygame.Surface, index: dict) -> None:
+        """Wpisuje do bufora wszystkie warianty z atlasu (`build_atlas.py`).
+
+        *sheet* to wczytany plik atlasu, *index* - jego indeks; wpisy są
+        wycinkami (`subsurface`) jednej powierzchni, bez kopiowania pikseli."""
+        sheet = sheet.convert_alpha()
+        self.disk_loads += 1
+        for entry in index["entries"]:
+            rects = [sheet.subsurface(rect) for rect in entry["rects"]]
+            if "frames" in entry:
+                size, count, trim, scale = entry["frames"]
+                key = (entry["path"], ("frames", size and tuple(size), count, trim, scale),
+                       entry["flags"])
+                self._put(key, tuple(rects))
+            else:
+                size = entry["size"] and tuple(entry["size"])
+                self._put((entry["path"], size, entry["flags"]), rects[0])
+
+    def entries(self) -> dict:
+        """Kopia wszystkich wpisów bufora (klucz → powierzchnia lub krotka klatek)."""
+        return dict(self._entries)
+
+    def preload(self, paths, flags: int = ALPHA) -> None:
+        """Wczytuje z wyprzedzeniem podane pliki (bez skalowania)."""
+        for path in paths:
+            self.image(path, None, flags)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Liczniki bufora – przydatne przy profilowaniu i w benchmarkach."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_loads": self.disk_loads,
+            "evictions": self.evictions,
+        }
+
+
+class RotationCache:
+    """Obrócone kopie powierzchni dla kątów co *step* stopni.
+
+    Kopie tworzone są leniwie, przy pierwszym użyciu danego kąta. Łączny
+    rozmiar pikseli jest ograniczony budżetem pamięci – po jego przekroczeniu
+    usuwane są najdawniej użyte kopie.
+
+    Parametry
+    ---------
+    step : float
+        Rozdzielczość kątowa w stopniach (np. 1 lub 2).
+    budget_mb : float
+        Maksymalny rozmiar przechowywanych powierzchni w MB.
+    """
+
+    def __init__(self, step: float = ROTATION_STEP, budget_mb: float = ROTATION_CACHE_MB):
+        self.hits = 0
+        self.misses = 0
+        self.configure(step, budget_mb)
+
+    def configure(self, step: float, budget_mb: float) -> None:
+        """Ustawia krok kąta i budżet pamięci; dotychczasowe kopie są usuwane."""
+        self.step = step
+        self.steps = max(1, round(360 / step))
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.used = 0
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def get(self, surface: pygame.Surface, angle: float) -> pygame.Surface:
+        """Zwraca *surface* obróconą o *angle* stopni (jak `pygame.transform.rotate`),
+        z kątem zaokrąglonym do najbliższej wielokrotności `step`."""
+        index = round(angle / self.step) % self.steps
+        key = (surface, index)
+        entries = self._entries
+        rotated = entries.get(key)
+        if rotated is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return rotated
+
+        self.misses += 1
+        rotated = entries[key] = pygame.transform.rotate(surface, index * self.step)
+        self.used += rotated.get_bytesize() * rotated.get_width() * rotated.get_height()
+        while self.used > self.budget and len(entries) > 1:
+            _, old = entries.popitem(last=False)
+            self.used -= old.get_bytesize() * old.get_width() * old.get_height()
+        return rotated
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self.used,
+                "hits": self.hits, "misses": self.misses}
+
+
+# Wspólne instancje używane przez wszystkie moduły gry.
+cache = AssetCache()
+rotations = RotationCache()
+# parametry bufora obrotów ustawione przez `config` (np. `--set ROTATION_STEP=1`)
+config.on_change(("ROTATION_STEP", "ROTATION_CACHE_MB"),
+                 lambda: rotations.configure(ROTATION_STEP, ROTATION_CACHE_MB))
+
+# Skróty dla najczęstszych wywołań
+image = cache.image
+frames = cache.frames
+preload = cache.preload
+store = cache.store
+rotated = rotations.get
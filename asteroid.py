@@ -2,46 +2,49 @@
 asteroid.py
 
 Moduł odpowiedzialny za definicję klasy Asteroid,
-która dziedziczy po klasie CircleShape i reprezentuje
+która dziedziczy po lekkiej encji `Entity` i reprezentuje
 pojedynczą asteroidę poruszającą się po ekranie.
-Zawiera logikę inicjalizacji grafiki, poruszania się,
+Zawiera logikę wyboru wariantu grafiki, poruszania się,
 dzielenia na mniejsze fragmenty oraz naliczania punktów.
+Samo rysowanie wykonuje `renderer.EntityRenderer`.
 '''
 
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
-import pygame
-from utils import CircleShape
+from entities import Entity
 from constants import *
-import random
+from pool import Pooled
+from sim import rng
 
 
-class Asteroid(CircleShape):
-    # Klasa Asteroid odpowiada za tworzenie, rysowanie i
+class Asteroid(Pooled, Entity):
+    # Klasa Asteroid odpowiada za tworzenie i
     # zarządzanie zachowaniem pojedynczej asteroidy.
+    __slots__ = ()
 
     LARGE_ASTEROIDS = ["assets/asteroid/large_asteroid_1.png", "assets/asteroid/large_asteroid_2.png", "assets/asteroid/large_asteroid_3.png"]
     MEDIUM_ASTEROIDS = ["assets/asteroid/medium_asteroid_1.png", "assets/asteroid/medium_asteroid_2.png", "assets/asteroid/medium_asteroid_3.png"]
     SMALL_ASTEROIDS = ["assets/asteroid/small_asteroid_1.png", "assets/asteroid/small_asteroid_2.png", "assets/asteroid/small_asteroid_3.png"]
 
     def __init__(self, x, y, radius):
-        # Konstruktor przyjmuje początkową pozycję i promień,
-        # ustala odpowiedni obrazek oraz kierunek ruchu.
+        # Konstruktor przyjmuje początkową pozycję i promień
+        # oraz losuje wariant grafiki (rodzaj encji).
         super().__init__(x, y, radius)
-        
+        self.kind = self._random_kind()
+
+    def reset(self, x, y, radius):
+        # Przywraca asteroidę z puli (`pool.py`) – nowy rozmiar i wariant.
+        super().reset(x, y, radius)
+        self.kind = self._random_kind()
+
+    def _random_kind(self):
+        # Losuje wariant grafiki odpowiedni do rozmiaru asteroidy
+        # (ścieżkę pliku – powierzchnię dobiera renderer).
         if self.radius > ASTEROID_MIN_RADIUS * 2:
-            image_path = random.choice(self.LARGE_ASTEROIDS)
+            return rng.choice(self.LARGE_ASTEROIDS)
         elif self.radius > ASTEROID_MIN_RADIUS:
-            image_path = random.choice(self.MEDIUM_ASTEROIDS)
+            return rng.choice(self.MEDIUM_ASTEROIDS)
         else:
-            image_path = random.choice(self.SMALL_ASTEROIDS)
-
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.radius * 2, self.radius * 2))
-        self.rect = self.image.get_rect(center=(x, y))
-   
-    def draw(self, screen):
-        # Rysuje asteroidę na przekazanym ekranie w jej aktualnej pozycji.
-        screen.blit(self.image, self.rect.topleft)
+            return rng.choice(self.SMALL_ASTEROIDS)
 
     def update(self, dt):
         # Aktualizuje pozycję asteroidy i stosuje efekt zawijania ekranu.
@@ -55,7 +58,6 @@ class Asteroid(CircleShape):
             self.position.y = SCREEN_HEIGHT + self.radius
         elif self.position.y > SCREEN_HEIGHT + self.radius:
             self.position.y = -self.radius
-        self.rect.center = self.position
 
     def split(self):
         # Jeśli asteroida jest wystarczająco duża, rozdziela ją na dwie mniejsze,
@@ -64,9 +66,9 @@ class Asteroid(CircleShape):
         if self.radius <= ASTEROID_MIN_RADIUS:
             return
         
-        asteroid_1 = Asteroid(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS)
-        asteroid_2 = Asteroid(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS)
-        asteroid_spread = random.uniform(20, 50)
+        asteroid_1 = Asteroid.spawn(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS)
+        asteroid_2 = Asteroid.spawn(self.position.x, self.position.y, self.radius - ASTEROID_MIN_RADIUS)
+        asteroid_spread = rng.uniform(20, 50)
         asteroid_1.velocity = self.velocity.rotate(asteroid_spread) * 1.2
         asteroid_2.velocity = self.velocity.rotate(-asteroid_spread) * 1.2
 
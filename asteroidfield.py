@@ -4,6 +4,8 @@ asteroidfield.py
 Zarządza "ruchem ulicznym" asteroid pojawiających się na planszy.
 Klasa `AsteroidField` pełni rolę prostego _factory_ - w określonych
 odstępach czasu tworzy i umieszcza w grze obiekty klasy `Asteroid`.
+Kolejne spawny i koniec efektu Threat są zdarzeniami w kolejce gry
+(`events.py`) - pole nie jest odpytywane w każdej klatce.
 
 Główne zadania modułu:
 - wyznaczanie pozycji i kierunku startowego dla każdej nowej asteroidy,
@@ -12,24 +14,27 @@ Główne zadania modułu:
 """
 
 import pygame
-import random
+from sim import rng
 from asteroid import Asteroid
 from constants import *
 
 
-class AsteroidField(pygame.sprite.Sprite):
+class AsteroidField:
     """
-    Kontener sprite'ów Pygame odpowiedzialny za generowanie kolejnych asteroid.
+    Generator kolejnych asteroid.
     
     Parametry składowe:
     --------------------
-    spawn_timer : float
-        Licznik odmierzający czas do kolejnego spawnu.
+    events : EventQueue
+        Kolejka zdarzeń gry (przypisywana przez `Game._bind`).
     spawn_mult : float
         Mnożnik przyspieszający lub spowalniający generowanie (np. po aktywacji power-upa).
-    _threat_timer : float
-        Pozostały czas działania efektu Threat.
+    _spawn : Event
+        Zaplanowany następny spawn.
+    _threat_end : Event | None
+        Zaplanowany koniec efektu Threat.
     """
+    events = None
     edges = [
         # Każdy wpis opisuje jedną krawędź ekranu:
         # [
@@ -60,43 +65,65 @@ class AsteroidField(pygame.sprite.Sprite):
 
     def __init__(self):
         # Inicjalizacja pól wewnętrznych
-        pygame.sprite.Sprite.__init__(self, self.containers)
-        self.spawn_timer   = 0.0
-        self.spawn_mult    = 1.0      # 1 → normalnie
-        self._threat_timer = 0.0
+        self._spawn       = None
+        self._threat_end  = None
+        self.reset()
 
-    def trigger_threat(self, duration: float = PU_DURATION[PU_THREAT]) -> None:
+    def reset(self) -> None:
+        # Przywraca stan początkowy (restart gry bez tworzenia nowego pola).
+        events = self.events
+        events.cancel(self._spawn)
+        events.cancel(self._threat_end)
+        self.spawn_mult   = 1.0      # 1 → normalnie
+        self._threat_end  = None
+        self._spawn = events.schedule(ASTEROID_SPAWN_RATE, self._spawn_next)
+
+    def trigger_threat(self, duration: float | None = None) -> None:
         # Aktywuje lub przedłuża działanie power‑up'a Threat zwiększającego liczbę asteroid.
-        self.spawn_mult   = ASTEROID_SPAWN_BOOST
-        self._threat_timer += duration
+        duration = PU_DURATION[PU_THREAT] if duration is None else duration
+        events = self.events
+        end = self._threat_end
+        if end is not None and end.callback is not None:
+            events.cancel(end)
+            until = end.time + duration     # kolejny Threat wydłuża trwający
+        else:
+            until = events.clock.now() + duration
+        self._set_mult(ASTEROID_SPAWN_BOOST)
+        self._threat_end = events.at(until, self._end_threat)
+
+    def _end_threat(self) -> None:
+        self._threat_end = None
+        self._set_mult(1.0)
+
+    def _set_mult(self, mult: float) -> None:
+        # Nowe tempo obowiązuje od razu: pozostała część odstępu
+        # do następnego spawnu skraca się (lub wydłuża) proporcjonalnie.
+        if mult == self.spawn_mult:
+            return
+        events = self.events
+        remaining = (self._spawn.time - events.clock.now()) * self.spawn_mult / mult
+        events.cancel(self._spawn)
+        self._spawn = events.schedule(remaining, self._spawn_next)
+        self.spawn_mult = mult
 
     def spawn(self, radius, position, velocity):
         # Pomocnicza metoda tworząca nową asteroidę i ustawiająca jej prędkość.
-        asteroid = Asteroid(position.x, position.y, radius)
+        asteroid = Asteroid.spawn(position.x, position.y, radius)
         asteroid.velocity = velocity
 
-    def update(self, dt):
+    def _spawn_next(self):
         """
-        Wywoływana co klatkę - zlicza upływ czasu,
-        a gdy zajdzie potrzeba generuje kolejną asteroidę.
-
-        Parametr
-        --------
-        dt (delta time) : float
-            Czas (w sekundach) jaki minął od ostatniego wywołania.
+        Zdarzenie spawnu - generuje asteroidę na losowej krawędzi ekranu
+        i planuje następną za `ASTEROID_SPAWN_RATE / spawn_mult` sekund
+        (licząc od czasu tego spawnu, nie od bieżącej klatki).
         """
-        self.spawn_timer += dt * self.spawn_mult
-        if self.spawn_timer > ASTEROID_SPAWN_RATE:
-            self.spawn_timer = 0
+        due = self._spawn.time
+        self._spawn = self.events.at(due + ASTEROID_SPAWN_RATE / self.spawn_mult, self._spawn_next)
 
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
-            velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
-            self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
-        if self._threat_timer > 0:
-            self._threat_timer -= dt
-            if self._threat_timer <= 0:
-                self.spawn_mult = 1.0
\ No newline at end of file
+        edge = rng.choice(self.edges)
+        speed = rng.randint(40, 100)
+        velocity = edge[0] * speed
+        velocity = velocity.rotate(rng.randint(-30, 30))
+        position = edge[1](rng.uniform(0, 1))
+        kind = rng.randint(1, ASTEROID_KINDS)
+        self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
\ No newline at end of file
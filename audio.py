@@ -6,14 +6,36 @@ wczytywanie plików dźwiękowych oraz
 udostępnienie pomocniczych funkcji do odtwarzania
 efektów dźwiękowych (SFX) i muzyki w tle.
 Wszystkie ścieżki dźwiękowe trzymane są wewnątrz katalogu
-`assets/sound` i ładowane są przy starcie modułu.
+`assets/sound`. Import modułu niczego nie wczytuje - mikser startuje
+przy pierwszym użyciu (`init()`), a efekty dekoduje w tle `loader.py`.
+
+`play_sfx`, `intro`, `theme` i `stop_music` niczego nie odtwarzają od
+razu - zgłaszają żądanie do wspólnego planisty `scheduler`. Pętla klatki
+wywołuje raz `update()`, które:
+
+• scala powtórzenia tego samego efektu w klatce i w oknie `SFX_MERGE_MS`
+  (seria Bullet Nova czy łańcuch wybuchów to jeden dźwięk, nie dziesiątki),
+• uruchamia efekty w kolejności priorytetów (`SFX_RULES`) z limitem
+  głosów na efekt (po jego przekroczeniu nowy dźwięk zastępuje najstarszy
+  głos tego efektu) i wspólnym limitem `SFX_VOICES` kanałów - pełny
+  mikser oddaje kanał efektu o niższym priorytecie albo odrzuca nowy dźwięk,
+• przekazuje wątkowi muzyki (`music.py`) tylko ostatnie żądane przejście
+  utworu - ładowanie i przenikanie nie zatrzymują klatki.
+
+Praca miksera w klatce jest więc ograniczona: najwyżej jedno `play()` na
+rodzaj efektu i jedna zmiana utworu, niezależnie od liczby zdarzeń.
+Poza pętlą z `update()` (tryb headless) żądania tylko się sumują.
 """
 
+import time
 from pathlib import Path
 import pygame
+from constants import SFX_VOICES, SFX_MERGE_MS
+from music import MUSIC_CHANNELS, MusicWorker
 
-pygame.mixer.init(frequency=44_100, size=-16, channels=2, buffer=512)
-# Inicjalizacja miksera – częstotliwość 44,1 kHz, 16‑bit, stereo, bufor 512 próbek
+pygame.mixer.pre_init(frequency=44_100, size=-16, channels=2, buffer=512)
+# Parametry miksera – 44,1 kHz, 16‑bit, stereo, bufor 512 próbek. Sam mikser
+# uruchamia `init()` (lub `pygame.init()`), a nie import modułu.
 
 SND_DIR = Path(__file__).resolve().parent / "assets" / "sound"
 # Bazowy katalog z plikami .wav/.mp3
@@ -22,40 +44,189 @@ def _p(name: str) -> str:
     # Funkcja pomocnicza – konwertuje nazwę pliku audio na absolutną ścieżkę, aby Pygame mógł ją otworzyć
     return str(SND_DIR / name)
 
-SFX = {
-    "laser":     pygame.mixer.Sound(_p("laser.wav")),
-    "explosion": pygame.mixer.Sound(_p("explosion.wav")),
-    "game_over": pygame.mixer.Sound(_p("game_over.wav")),
-    "powerup": pygame.mixer.Sound(_p("powerup.wav")),
+SFX_FILES = {
+    "laser":     "laser.wav",
+    "explosion": "explosion.wav",
+    "game_over": "game_over.wav",
+    "powerup":   "powerup.wav",
 }
-# Słownik gotowych efektów dźwiękowych – kluczem jest opisowa nazwa używana w kodzie gry.
+# Manifest efektów dźwiękowych – kluczem jest opisowa nazwa używana w kodzie gry.
+
+SFX_RULES = {
+    # nazwa:      (priorytet, maks. głosów tego efektu)
+    "game_over": (3, 1),
+    "powerup":   (2, 2),
+    "explosion": (1, 3),
+    "laser":     (0, 3),
+}
+# Reguły planisty – efekt o wyższym priorytecie może zabrać kanał niższemu.
+
+SFX: dict[str, pygame.mixer.Sound] = {}
+# Wczytane efekty; wypełnia je `loader.AssetLoader` w tle (lub `play_sfx` przy pierwszym użyciu).
 
 DEFAULT_SFX_VOL   = 0.5   # 0.0 – 1.0
 DEFAULT_MUSIC_VOL = 1.0   # 0.0 – 1.0
-# Domyślne poziomy głośności ustawiane tuż po załadowaniu wszystkich efektów.
+# Domyślne poziomy głośności efektów i muzyki.
+
+NEXT_TRACK = {"intro.mp3": "theme.mp3"}
+# Utwór, który po danym wejdzie przez przenikanie – wątek muzyki dekoduje go z wyprzedzeniem.
 
-for snd in SFX.values():
+music = MusicWorker(DEFAULT_MUSIC_VOL)
+# Wątek muzyki (uruchamiany przy pierwszym poleceniu).
+
+def init() -> None:
+    # Leniwa inicjalizacja miksera – wywoływana przed pierwszym dźwiękiem.
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+        # pierwsze kanały należą do muzyki (przenikanie), pozostałe do efektów
+        pygame.mixer.set_num_channels(MUSIC_CHANNELS + SFX_VOICES)
+        pygame.mixer.set_reserved(MUSIC_CHANNELS)
+        pygame.mixer.music.set_volume(DEFAULT_MUSIC_VOL)
+        # Głośność muzyki w tle (ścieżki mp3) ustawiana niezależnie od SFX.
+
+def load_sfx(name: str) -> pygame.mixer.Sound:
+    # Dekoduje efekt z manifestu – bezpieczne w wątku roboczym (mikser musi działać).
+    snd = pygame.mixer.Sound(_p(SFX_FILES[name]))
     snd.set_volume(DEFAULT_SFX_VOL)
-# Ustaw jednakową głośność dla każdego załadowanego efektu.
+    return snd
+
+def _sound(name: str) -> pygame.mixer.Sound | None:
+    # Efekt z bufora `SFX`; nie wczytany z wyprzedzeniem – dekodowany teraz.
+    snd = SFX.get(name)
+    if snd is None and name in SFX_FILES:
+        init()
+        snd = SFX[name] = load_sfx(name)
+    return snd
+
+def _play_music(file: str | None) -> None:
+    # Zleca wątkowi muzyki przełączenie utworu w tle (None – cisza); nie blokuje.
+    if file is None:
+        if pygame.mixer.get_init():
+            music.stop()
+        return
+    init()
+    following = NEXT_TRACK.get(file)
+    music.play(_p(file), prefetch=following and _p(following))
+
+
+class AudioScheduler:
+    """Zbiera żądania dźwięków z klatki i wykonuje je raz na klatkę (`flush`).
 
-pygame.mixer.music.set_volume(DEFAULT_MUSIC_VOL)
-# Głośność muzyki w tle (ścieżki mp3) ustawiana niezależnie od SFX.
+    Parametry
+    ---------
+    rules : dict
+        Nazwa efektu → (priorytet, maks. liczba głosów); domyślnie `SFX_RULES`.
+    clock : callable
+        Źródło czasu w sekundach (okno scalania); domyślnie `time.perf_counter`.
+    """
+
+    def __init__(self, rules: dict | None = None, clock=time.perf_counter):
+        self.rules = SFX_RULES if rules is None else rules
+        self.clock = clock
+        self._pending: dict[str, int] = {}      # nazwa → liczba żądań od ostatniego `flush`
+        self._music = None                      # ostatnie żądane przejście muzyki
+        self._last: dict[str, float] = {}       # nazwa → chwila ostatniego startu
+        self._channels: list = []               # kanały miksera (po `init()`)
+        self._playing: list = []                # nazwa efektu na kanale o tym samym indeksie
+        self._started: list = []                # chwila startu efektu na kanale
+        self.counters = dict.fromkeys(("requested", "merged", "replaced", "stolen",
+                                       "dropped", "played", "music"), 0)
+
+    # ------------------------------------------------------------
+    def sfx(self, name: str) -> None:
+        """Zgłasza efekt do odtworzenia w najbliższym `flush`."""
+        self._pending[name] = self._pending.get(name, 0) + 1
+
+    def music(self, file: str | None) -> None:
+        """Zgłasza zmianę utworu (None – cisza); liczy się ostatnie żądanie przed `flush`."""
+        self._music = (file,)
+
+    def clear(self) -> None:
+        """Porzuca niewykonane żądania."""
+        self._pending.clear()
+        self._music = None
+
+    # ------------------------------------------------------------
+    def flush(self) -> None:
+        """Wykonuje żądania zebrane od poprzedniego wywołania (raz na klatkę)."""
+        if self._music is not None:
+            (file,), self._music = self._music, None
+            _play_music(file)
+            self.counters["music"] += 1
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        counters = self.counters
+        requested = sum(pending.values())
+        counters["requested"] += requested
+        counters["merged"] += requested - len(pending)
+        if not pygame.mixer.get_init():
+            init()
+        if len(self._channels) != pygame.mixer.get_num_channels() - MUSIC_CHANNELS:
+            self._channels = [pygame.mixer.Channel(i)       # bez kanałów muzyki
+                              for i in range(MUSIC_CHANNELS, pygame.mixer.get_num_channels())]
+            self._playing = [None] * len(self._channels)
+            self._started = [0.0] * len(self._channels)
+
+        now = self.clock()
+        rules = self.rules
+        for name in sorted(pending, key=lambda n: -rules.get(n, (0, 1))[0]):
+            if now - self._last.get(name, -1.0) < SFX_MERGE_MS / 1000:
+                counters["merged"] += 1         # ten sam dźwięk dopiero co ruszył
+                continue
+            snd = _sound(name)
+            if snd is not None and self._start(name, snd, now):
+                self._last[name] = now
+
+    def _start(self, name: str, snd, now: float) -> bool:
+        rules = self.rules
+        priority, limit = rules.get(name, (0, 1))
+        channels, playing, started = self._channels, self._playing, self._started
+        busy = [ch.get_busy() for ch in channels]
+        own = [i for i, b in enumerate(busy) if b and playing[i] == name]
+        if len(own) >= limit:
+            # limit głosów efektu – nowy dźwięk zastępuje najstarszy głos tego efektu
+            slot = min(own, key=started.__getitem__)
+            self.counters["replaced"] += 1
+        else:
+            slot = next((i for i, b in enumerate(busy) if not b), None)
+        if slot is None:
+            # pełny mikser – najstarszy efekt o najniższym priorytecie, jeśli niższym niż nowy
+            slot = min(range(len(channels)),
+                       key=lambda i: (rules.get(playing[i], (0, 1))[0], started[i]))
+            if rules.get(playing[slot], (0, 1))[0] >= priority:
+                self.counters["dropped"] += 1
+                return False
+            self.counters["stolen"] += 1
+        channels[slot].play(snd)        # `play` przerywa poprzedni dźwięk kanału
+        playing[slot], started[slot] = name, now
+        self.counters["played"] += 1
+        return True
+
+    def stats(self) -> dict:
+        return dict(self.counters)
+
+
+# Wspólny planista dźwięków gry.
+scheduler = AudioScheduler()
 
 def play_sfx(name: str) -> None:
-    # Odtwórz pojedynczy efekt dźwiękowy na podstawie jego klucza z słownika SFX.
-    # Jeśli dźwięk nie istnieje (błędny klucz) funkcja nie robi nic.
-    if snd := SFX.get(name):
-        snd.play()
-
-def _play_music(file: str, loop: int = -1) -> None:
-    # Wewnętrzna funkcja przełączająca aktualny utwór w tle.
-    # `loop=-1` oznacza nieskończone zapętlenie.
-    pygame.mixer.music.stop()
-    pygame.mixer.music.load(_p(file))
-    pygame.mixer.music.play(loop)
+    # Zgłoś efekt dźwiękowy na podstawie jego klucza z słownika SFX (odtwarza `update()`).
+    # Jeśli dźwięk nie istnieje (błędny klucz) nic nie zostanie odtworzone.
+    scheduler.sfx(name)
+
+def update() -> None:
+    # Wykonuje żądania dźwięków zebrane w tej klatce – wywoływane raz na klatkę.
+    scheduler.flush()
+
+def shutdown() -> None:
+    # Kończy wątek muzyki i zamyka mikser (przed `pygame.quit()`).
+    music.shutdown()
+    if pygame.mixer.get_init():
+        pygame.mixer.quit()
 
 # Poniższe jednolinijkowce ułatwiają zmianę aktualnej ścieżki poprzez jednoznacznie
 # nazwane wywołania w pozostałych modułach gry.
-def intro()      -> None: _play_music("intro.mp3")
-def theme()      -> None: _play_music("theme.mp3")
-def stop_music() -> None: pygame.mixer.music.stop()
+def intro()      -> None: scheduler.music("intro.mp3")
+def theme()      -> None: scheduler.music("theme.mp3")
+def stop_music() -> None: scheduler.music(None)
@@ -0,0 +1,357 @@
+"""
+bench.py
+
+Zestaw benchmarków pętli gry uruchamianych bez okna.
+
+Każdy scenariusz buduje prawdziwą rozgrywkę (`game.Game`) i sztucznie
+ją obciąża - np. kumuluje efekt Threat, raz po raz odpala Bullet Nova
+czy zasypuje planszę wybuchami. Dla każdej klatki mierzony jest czas
+trzech faz pętli głównej:
+
+• update    - spawny, ruch obiektów i animacje wybuchów,
+• collision - wszystkie testy kolizji (`Game.collide`),
+• draw      - render tła, sprite'ów i HUD-u (na niewidoczny ekran).
+
+Raport zawiera średnią oraz percentyle p50/p95/p99 [ms], a osobny,
+krótszy przebieg pod `tracemalloc` - szczyt pamięci zajętej w trakcie
+klatki ponad stan sprzed niej (`peak_kb_per_frame`) i przyrost pamięci
+po klatce (`retained_kb_per_frame`). Szczyt to pamięć chwilowa: klatka,
+która kolejno tworzy i zwalnia wiele małych obiektów, wykaże niewiele -
+to nie jest suma wszystkich alokacji.
+Wyniki zapisywane są w JSON, dzięki czemu można je porównać z wcześniejszym
+przebiegiem i przerwać CI, gdy któraś faza zwolni ponad zadany próg.
+
+`--scaling` mierzy osobno skalowanie kroku `EntityStore` i przydziału do
+komórek siatki (`parallel.py`) od 1 do N wątków na dużej liczbie obiektów
+i sprawdza, że wynik jest identyczny z przebiegiem szeregowym.
+
+Przykład::
+
+    python bench.py --output base.json
+    python bench.py --compare base.json --threshold 1.25
+    python bench.py --scaling 1 2 4 8
+"""
+
+import headless     # najpierw – ustawia sterowniki SDL "dummy"
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import pygame
+import sim
+from constants import *
+from asteroid import Asteroid
+from collisions import SpatialHash
+from entitystore import EntityStore, CULL, WRAP
+from game import Game
+from parallel import ChunkPool, FREE_THREADED
+from inputs import RandomInput
+from shots import Shot
+from utils import Explosion
+
+PHASES = ("update", "collision", "draw")
+
+
+# -------------- scenariusze --------------
+# Każdy scenariusz to para funkcji: `setup(game)` wywoływana raz po
+# utworzeniu gry oraz `frame(game, i)` wywoływana przed każdą klatką.
+
+def _noop(game, i=None):
+    pass
+
+
+def _threat_setup(game):
+    for _ in range(5):      # pięć nałożonych power-upów Threat
+        game.asteroid_field.trigger_threat()
+
+
+def _nova_frame(game, i):
+    if i % 15 == 0:
+        game.player.fire_nova()
+
+
+def _many_asteroids_setup(game):
+    rng = sim.rng
+    for _ in range(1000):
+        position = pygame.Vector2(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+        velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+        game.asteroid_field.spawn(ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS),
+                                  position, velocity)
+
+
+def _explosion_frame(game, i):
+    rng = sim.rng
+    for _ in range(20):
+        game.explosions.add(Explosion.spawn(pygame.Vector2(rng.uniform(0, SCREEN_WIDTH),
+                                                     rng.uniform(0, SCREEN_HEIGHT))))
+
+
+SCENARIOS = {
+    "baseline":        (_noop, _noop),
+    "threat_wave":     (_threat_setup, _noop),
+    "nova_storm":      (_noop, _nova_frame),
+    "asteroids_1000":  (_many_asteroids_setup, _noop),
+    "explosion_flood": (_noop, _explosion_frame),
+}
+
+
+# -------------- pomiar --------------
+def _new_game(name: str, seed: int, use_store: bool, use_pools: bool) -> Game:
+    screen = headless.init_display()
+    sim.reset(seed)
+    game = Game(screen, controls=RandomInput(seed), use_store=use_store, use_pools=use_pools)
+    game.player.invulnerability_timer = 1e9   # stałe obciążenie – gracz nie ginie
+    SCENARIOS[name][0](game)
+    return game
+
+
+def _frame(game, screen, dt, timings=None):
+    # jedna klatka w kolejności pętli głównej; opcjonalnie z pomiarem faz
+    clock = time.perf_counter
+    t0 = clock()
+    game.update(dt)
+    t1 = clock()
+    game.collide(dt)
+    t2 = clock()
+    game.explosions.update(dt)
+    t3 = clock()
+    game.draw(screen, 0)
+    t4 = clock()
+    if timings is not None:
+        timings["update"].append((t1 - t0) + (t3 - t2))
+        timings["collision"].append(t2 - t1)
+        timings["draw"].append(t4 - t3)
+
+
+def _summary(samples) -> dict:
+    ms = sorted(s * 1000 for s in samples)
+    q = statistics.quantiles(ms, n=100, method="inclusive")
+    return {
+        "mean": round(statistics.fmean(ms), 4),
+        "p50": round(q[49], 4),
+        "p95": round(q[94], 4),
+        "p99": round(q[98], 4),
+    }
+
+
+def run_scenario(name: str, frames: int = 600, seed: int = 0, dt: float = headless.FIXED_DT,
+                 use_store: bool = ENTITY_STORE, use_pools: bool = OBJECT_POOLS,
+                 alloc_frames: int = 60) -> dict:
+    """Uruchamia scenariusz *name* i zwraca statystyki faz, pamięci i liczby obiektów."""
+    per_frame = SCENARIOS[name][1]
+    screen = headless.init_display()
+
+    # --- przebieg czasowy ---
+    game = _new_game(name, seed, use_store, use_pools)
+    timings = {phase: [] for phase in PHASES}
+    peak_entities = 0
+    gc_before = sum(s["collections"] for s in gc.get_stats())
+    for i in range(frames):
+        per_frame(game, i)
+        _frame(game, screen, dt, timings)
+        peak_entities = max(peak_entities, len(game.updatable) + len(game.explosions))
+    gc_runs = sum(s["collections"] for s in gc.get_stats()) - gc_before
+    pools = {name: pool.stats() for name, pool in game.pools.items()}
+
+    # --- przebieg pamięciowy (tracemalloc mocno spowalnia, więc osobno) ---
+    game = _new_game(name, seed, use_store, use_pools)
+    peaks, retained = [], []
+    tracemalloc.start()
+    for i in range(alloc_frames):
+        per_frame(game, i)
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        _frame(game, screen, dt)
+        used, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+        retained.append(used - base)
+    tracemalloc.stop()
+
+    result = {phase: _summary(timings[phase]) for phase in PHASES}
+    result.update({
+        "frames": frames,
+        "peak_kb_per_frame": round(statistics.fmean(peaks) / 1024, 2),
+        "retained_kb_per_frame": round(statistics.fmean(retained) / 1024, 2),
+        "gc_collections": gc_runs,
+        "peak_entities": peak_entities,
+        "pools": pools,     # m.in. high_water – największa liczba obiektów naraz
+    })
+    return result
+
+
+def entity_memory(count: int = 2000, use_store: bool = ENTITY_STORE) -> dict:
+    """Średnia pamięć [B] jednej asteroidy i jednego pocisku - razem z wpisami w grupach."""
+    game = _new_game("baseline", 0, use_store, use_pools=False)
+    result = {}
+    for cls, args in ((Asteroid, (100, 100, ASTEROID_MIN_RADIUS * 2)), (Shot, (100, 100, 45.0))):
+        cls(*args)      # pierwsze wywołanie – bufory grafik i klas poza pomiarem
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        objects = [cls(*args) for _ in range(count)]
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[cls.__name__] = round((used - base) / count, 1)
+        for obj in objects:
+            obj.kill()
+    game.end()
+    return result
+
+
+def restart_cost(repeats: int = 50, use_store: bool = ENTITY_STORE) -> dict:
+    """Średni czas [ms] restartu gry: nowy obiekt `Game` kontra `Game.reset()`."""
+    screen = headless.init_display()
+    game = _new_game("nova_storm", 0, use_store, OBJECT_POOLS)
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(repeats):
+        Game(screen, use_store=use_store)
+    new_game = (clock() - start) / repeats
+    for _ in range(120):        # plansza pełna obiektów przed każdym resetem
+        game.step(headless.FIXED_DT)
+    reset = 0.0
+    for _ in range(repeats):
+        start = clock()
+        game.reset()
+        reset += clock() - start
+        game.player.fire_nova()
+        game.step(headless.FIXED_DT)
+    return {"new_game_ms": round(new_game * 1000, 3), "reset_ms": round(reset / repeats * 1000, 3)}
+
+
+def parallel_scaling(workers=(1, 2, 4), count: int = 400_000, repeats: int = 20,
+                     seed: int = 0) -> dict:
+    """Czas [ms] kroku `EntityStore` i `cell_spans` dla *count* obiektów przy różnej liczbie wątków."""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    start_pos = rng.uniform(0, (SCREEN_WIDTH, SCREEN_HEIGHT), (count, 2))
+    start_vel = rng.uniform(-300, 300, (count, 2))
+    grid = SpatialHash(COLLISION_CELL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MAX_RADIUS)
+    result = {"count": count, "free_threaded": FREE_THREADED, "workers": {}}
+    reference = None
+    for n in workers:
+        store = EntityStore(count)
+        store.pos[:] = start_pos
+        store.vel[:] = start_vel
+        store.radius[:] = 5.0
+        store.mode[1::2] = CULL        # połowa jak pociski, połowa jak asteroidy
+        store.mode[::2] = WRAP
+        store.alive[:] = True
+        store.size = count
+        pool = ChunkPool(n)
+        store.parallel = pool if n > 1 else None
+        slots, sweep = np.arange(count), np.full(count, headless.FIXED_DT)
+        step_times, bin_times = [], []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            store.step(headless.FIXED_DT)
+            t1 = time.perf_counter()
+            spans = store.cell_spans(slots, sweep, grid)
+            t2 = time.perf_counter()
+            step_times.append(t1 - t0)
+            bin_times.append(t2 - t1)
+        pool.close()
+        state = (store.pos.tobytes(), spans[0].tobytes(), spans[1].tobytes())
+        reference = reference or state
+        result["workers"][n] = {"step_ms": round(statistics.median(step_times) * 1000, 3),
+                                "bin_ms": round(statistics.median(bin_times) * 1000, 3),
+                                "identical": state == reference}
+    return result
+
+
+def _meta(use_store: bool, use_pools: bool) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "entity_store": use_store,
+        "object_pools": use_pools,
+        "startup": headless.startup,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Zwraca listę regresji: faz, których p95 przekracza bazę więcej niż *threshold* razy."""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for phase in PHASES:
+            old, new = base[phase]["p95"], current[phase]["p95"]
+            if old > 0 and new > old * threshold:
+                regressions.append(f"{name}/{phase}: p95 {old:.3f} → {new:.3f} ms ({new / old:.2f}×)")
+    return regressions
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Asteroids – benchmark pętli gry")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help="scenariusze do uruchomienia (domyślnie wszystkie): " + ", ".join(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600, help="liczba mierzonych klatek")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--store", action="store_true", help="włącz EntityStore (numpy)")
+    parser.add_argument("--no-pools", action="store_true", help="wyłącz pule obiektów")
+    parser.add_argument("--output", metavar="PATH", help="zapisz wyniki do pliku JSON")
+    parser.add_argument("--compare", metavar="PATH", help="porównaj z wcześniejszym wynikiem JSON")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="dopuszczalny wzrost p95 względem bazy (domyślnie 1.25×)")
+    parser.add_argument("--scaling", type=int, nargs="+", metavar="N",
+                        help="tylko skalowanie kroku EntityStore dla podanych liczb wątków")
+    args = parser.parse_args(argv)
+    if args.scaling:
+        result = parallel_scaling(tuple(args.scaling))
+        print(f"{result['count']} obiektów, free-threaded: {result['free_threaded']}")
+        base = result["workers"][args.scaling[0]]
+        for n, r in result["workers"].items():
+            print(f"  {n:2d} wątk.  krok {r['step_ms']:.3f} ms ({base['step_ms'] / r['step_ms']:.2f}×)"
+                  f"  komórki {r['bin_ms']:.3f} ms ({base['bin_ms'] / r['bin_ms']:.2f}×)"
+                  f"  {'identyczny' if r['identical'] else 'RÓŻNY'} wynik")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+        return
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"nieznany scenariusz: {name}")
+
+    use_store = args.store or ENTITY_STORE
+    use_pools = OBJECT_POOLS and not args.no_pools
+    results = {"meta": _meta(use_store, use_pools), "scenarios": {},
+               "entity_bytes": entity_memory(use_store=use_store)}
+    print("pamięć encji [B]: " + "  ".join(f"{k} {v:.0f}" for k, v in results["entity_bytes"].items()))
+    results["restart"] = restart_cost(use_store=use_store)
+    print("restart [ms]: nowa gra {new_game_ms:.3f}  reset {reset_ms:.3f}".format(**results["restart"]))
+    for name in args.scenarios or SCENARIOS:
+        stats = run_scenario(name, args.frames, args.seed, use_store=use_store, use_pools=use_pools)
+        results["scenarios"][name] = stats
+        print(f"{name:16s} " + "  ".join(
+            f"{phase} {stats[phase]['mean']:.2f}/{stats[phase]['p95']:.2f}ms" for phase in PHASES
+        ) + f"  szczyt pamięci {stats['peak_kb_per_frame']:.1f} kB/kl.  pule " + " ".join(
+            f"{pool}:{s['high_water']}" for pool, s in stats["pools"].items()))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print("REGRESJA:", line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+build_atlas.py
+
+Budowa atlasu grafik - krok wykonywany offline, przed uruchomieniem gry.
+
+Gra trzyma grafiki w osobnych plikach PNG, a warianty faktycznie
+rysowane (asteroidy przeskalowane do średnicy, pocisk 4r × 1.4r, statek,
+UFO, klatki wybuchu, przycięte i przeskalowane klatki płomienia) wylicza
+przy starcie: wczytuje ~20 plików, skaluje, tnie arkusze i liczy
+bounding‑boxy.
+
+Skrypt tworzy te same warianty tymi samymi ścieżkami kodu co gra
+(konstruktory sprite'ów, skórki `renderer`) na pustym buforze `assets`,
+a następnie pakuje gotowe powierzchnie w jeden obrazek:
+
+    assets/atlas.png   - wszystkie warianty (RGBA, pakowanie półkowe)
+    assets/atlas.json  - indeks: klucz bufora → prostokąty w atlasie
+                         oraz czasy modyfikacji plików źródłowych
+
+Obrazek bazowy trafia do atlasu tylko wtedy, gdy nic z niego nie
+wyprowadzono (np. ikony power-upów); tło (`OPAQUE_IMAGES`) zostaje
+osobnym plikiem. Przy starcie `loader.AssetLoader` czyta więc dwa pliki
+zamiast kilkunastu, a `assets.atlas_index()` odrzuca atlas starszy od
+źródeł - wtedy gra wraca do wczytywania pojedynczych plików.
+
+Przykład::
+
+    python build_atlas.py            # zbuduj atlas
+    python build_atlas.py --check    # kod wyjścia 1, gdy atlas nieaktualny
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from headless import init_display     # najpierw – ustawia sterowniki SDL "dummy"
+import pygame
+import assets
+
+ATLAS_WIDTH = 1024
+PADDING = 1     # odstęp między wariantami w atlasie [px]
+
+
+def collect() -> dict:
+    """Tworzy warianty grafik tak jak gra i zwraca wpisy bufora do spakowania."""
+    from constants import ASTEROID_MIN_RADIUS, SHOT_RADIUS
+    from asteroid import Asteroid
+    from shots import Shot
+    from player import Player
+    from ufo import UFO
+    from powerups import PowerUp
+    from utils import Explosion
+    from renderer import asteroid_skin, shot_skin
+
+    assets.cache.clear()
+    sizes = (Asteroid.SMALL_ASTEROIDS, Asteroid.MEDIUM_ASTEROIDS, Asteroid.LARGE_ASTEROIDS)
+    for generation, kinds in enumerate(sizes, 1):
+        for kind in kinds:
+            asteroid_skin(kind, ASTEROID_MIN_RADIUS * generation, 0)
+    shot_skin(Shot.SPRITE_PATH, SHOT_RADIUS, 0)
+    Player(0, 0, None)
+    UFO(0, 0)
+    for kind in PowerUp.SPRITES:
+        PowerUp(pygame.Vector2(), pygame.Vector2(), kind)
+    Explosion((0, 0))
+
+    entries = assets.cache.entries()
+    derived = {path for path, size, _ in entries if size is not None}
+    return {key: value for key, value in entries.items()
+            if not (key[1] is None and key[0] in derived)}
+
+
+def pack(sizes: list[tuple[int, int]], width: int = ATLAS_WIDTH) -> tuple[list, int]:
+    """Pakowanie półkowe: zwraca pozycje prostokątów (w kolejności wejścia) i wysokość atlasu."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf + PADDING, 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf = max(shelf, h)
+    return positions, y + shelf
+
+
+def build(directory: str = "assets") -> dict:
+    """Buduje atlas i indeks w katalogu *directory*; zwraca statystyki."""
+    init_display()
+    entries = collect()
+
+    surfaces = []       # (indeks wpisu, powierzchnia)
+    for n, frames in enumerate(entries.values()):
+        for surf in frames if isinstance(frames, tuple) else (frames,):
+            surfaces.append((n, surf))
+    widest = max(surf.get_width() for _, surf in surfaces)
+    positions, height = pack([surf.get_size() for _, surf in surfaces], max(ATLAS_WIDTH, widest))
+
+    sheet = pygame.Surface((max(ATLAS_WIDTH, widest), height), pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    rects = [[] for _ in entries]
+    for (n, surf), pos in zip(surfaces, positions):
+        # BLEND_RGBA_MAX na przezroczystym tle kopiuje piksele bez mieszania alfy
+        sheet.blit(surf, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        rects[n].append([*pos, *surf.get_size()])
+
+    index_entries = []
+    for (path, size, flags), entry_rects in zip(entries, rects):
+        entry = {"path": path, "flags": flags, "rects": entry_rects}
+        if isinstance(size, tuple) and size and size[0] == "frames":
+            entry["frames"] = list(size[1:])
+        else:
+            entry["size"] = size and list(size)
+        index_entries.append(entry)
+
+    sources = sorted({entry["path"] for entry in index_entries})
+    index = {
+        "version": assets.ATLAS_VERSION,
+        "sources": {path: os.stat(path).st_mtime_ns for path in sources},
+        "entries": index_entries,
+    }
+    image_path = os.path.join(directory, os.path.basename(assets.ATLAS_IMAGE))
+    index_path = os.path.join(directory, os.path.basename(assets.ATLAS_INDEX))
+    pygame.image.save(sheet, image_path)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+    return {"entries": len(index_entries), "surfaces": len(surfaces),
+            "size": list(sheet.get_size()), "sources": len(sources),
+            "bytes": os.path.getsize(image_path) + os.path.getsize(index_path)}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Asteroids – budowa atlasu grafik")
+    parser.add_argument("--dir", default="assets", help="katalog wynikowy (domyślnie assets)")
+    parser.add_argument("--check", action="store_true",
+                        help="tylko sprawdź, czy atlas istnieje i jest aktualny")
+    args = parser.parse_args(argv)
+    if args.check:
+        fresh = assets.atlas_index(os.path.join(args.dir, os.path.basename(assets.ATLAS_INDEX)))
+        print("atlas aktualny" if fresh else "atlas brakujący lub nieaktualny")
+        sys.exit(0 if fresh else 1)
+    print(json.dumps(build(args.dir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+collisions.py
+
+Szybkie wyszukiwanie kolizji pocisków z asteroidami i UFO.
+
+Pętla główna porównywała dotąd każdą asteroidę z każdym pociskiem
+(*brute force*, O(n·m) wywołań `collides_with`). Po aktywacji Bullet Nova
+w jednej klatce potrafi to oznaczać dziesiątki tysięcy testów. Moduł
+dzieli planszę na jednolitą siatkę komórek (*spatial hash*), do której
+trafiają pociski, a każdą asteroidę porównuje jedynie z pociskami z
+komórek pokrywających jej obrys (broadphase). Dokładny test
+(narrowphase) porównuje kwadraty odległości - bez pierwiastka.
+
+Siatka obejmuje ekran powiększony o margines, w którym obiekty
+"zawijają się" na drugą stronę (`Asteroid.update`, `PowerUp.update`);
+obiekty leżące jeszcze dalej trafiają do skrajnych komórek, więc
+żadna para nie zostanie pominięta.
+
+Test jest ciągły (*swept*): szybki pocisk (`SHOT_RADIUS` 5 px, 500+ px/s)
+mógłby w jednym kroku przeskoczyć małą asteroidę, więc zamiast stanu
+końcowego badany jest cały odcinek przebyty w kroku `dt`. Oba obiekty
+poruszają się w kroku ruchem jednostajnym, a `time_of_impact` wyznacza
+ułamek kroku, w którym okręgi pierwszy raz się zetknęły. Do siatki
+trafiają prostokąty obejmujące cały przebyty odcinek.
+
+Trafienia rozstrzygane są w kolejności chwil zderzenia (przy równych
+chwilach - w kolejności grup, jak w pierwotnej pętli zagnieżdżonej):
+pocisk niszczy najwyżej jeden cel, a cel ginie od najwyżej jednego
+pocisku. `brute_force_hits` - każdy cel z każdym pociskiem - jest
+implementacją referencyjną, z którą testy (`tests/test_collisions.py`)
+porównują wynik siatki.
+"""
+
+from math import sqrt
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MAX_RADIUS, COLLISION_CELL_SIZE
+
+
+def time_of_impact(a, b, dt_a: float, dt_b: float) -> float | None:
+    """Ułamek kroku (0–1), w którym okręgi *a* i *b* pierwszy raz się zetknęły.
+
+    Pozycje są stanem po kroku; *dt_a*, *dt_b* - czas, przez który obiekt
+    poruszał się w tym kroku (0 dla obiektu utworzonego w jego trakcie).
+    Zwraca 0, gdy okręgi stykały się już na początku kroku, i None, gdy
+    w ogóle się nie zetknęły.
+    """
+    pa, pb = a.position, b.position
+    va, vb = a.velocity, b.velocity
+    # względne przesunięcie w kroku i względna pozycja na jego początku
+    wx = va.x * dt_a - vb.x * dt_b
+    wy = va.y * dt_a - vb.y * dt_b
+    dx = pa.x - pb.x - wx
+    dy = pa.y - pb.y - wy
+    r = a.radius + b.radius
+    c = dx * dx + dy * dy - r * r
+    if c <= 0:
+        return 0.0
+    half_b = dx * wx + dy * wy
+    if half_b >= 0:
+        return None         # obiekty się oddalają
+    aa = wx * wx + wy * wy
+    disc = half_b * half_b - aa * c
+    if disc < 0:
+        return None
+    t = (-half_b - sqrt(disc)) / aa
+    return t if t <= 1.0 else None
+
+
+class SpatialHash:
+    """Jednolita siatka komórek o boku *cell_size* pikseli.
+
+    Parametry
+    ---------
+    cell_size : int
+        Bok pojedynczej komórki.
+    width, height : int
+        Rozmiar planszy (domyślnie rozmiar ekranu).
+    margin : int
+        Pas wokół ekranu objęty siatką (strefa zawijania obiektów).
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE, width: int = SCREEN_WIDTH,
+                 height: int = SCREEN_HEIGHT, margin: int = ASTEROID_MAX_RADIUS):
+        self.cell_size = cell_size
+        self.origin = -margin
+        self.cols = (width + 2 * margin) // cell_size + 1
+        self.rows = (height + 2 * margin) // cell_size + 1
+        self._cells: dict[int, list] = {}
+
+    # ------------------------------------------------------------
+    def _span(self, lo: float, hi: float, count: int) -> range:
+        # Zakres indeksów komórek pokrywających przedział [lo, hi] na jednej osi;
+        # wartości spoza siatki są przycinane do skrajnych komórek.
+        size = self.cell_size
+        first = min(max(int((lo - self.origin) // size), 0), count - 1)
+        last = min(max(int((hi - self.origin) // size), 0), count - 1)
+        return range(first, last + 1)
+
+    def _keys(self, obj, dt: float = 0.0):
+        # komórki prostokąta obejmującego okrąg na całym odcinku przebytym w czasie *dt*
+        x, y, r = obj.position.x, obj.position.y, obj.radius
+        x0 = x1 = x
+        y0 = y1 = y
+        if dt:
+            velocity = obj.velocity
+            sx, sy = x - velocity.x * dt, y - velocity.y * dt
+            x0, x1 = min(x, sx), max(x, sx)
+            y0, y1 = min(y, sy), max(y, sy)
+        cols = self.cols
+        for cy in self._span(y0 - r, y1 + r, self.rows):
+            row = cy * cols
+            for cx in self._span(x0 - r, x1 + r, cols):
+                yield row + cx
+
+    # ------------------------------------------------------------
+    def rebuild(self, objects, dt: float = 0.0, fresh=()) -> None:
+        """Buduje siatkę od nowa; kolejność *objects* wyznacza kolejność wyników.
+
+        *dt* - długość kroku; obiekty trafiają do komórek całego odcinka
+        przebytego w kroku, z wyjątkiem utworzonych w jego trakcie (*fresh*)."""
+        cells = self._cells
+        cells.clear()
+        for index, obj in enumerate(objects):
+            entry = (index, obj)
+            sweep = 0.0 if obj in fresh else dt
+            for key in self._keys(obj, sweep):
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild_spans(self, objects, first, last) -> None:
+        """Jak `rebuild`, z zakresami komórek policzonymi wcześniej.
+
+        *first*, *last* - tablice (n, 2) pierwszej i ostatniej (kolumny, wiersza)
+        obiektu, np. z `EntityStore.cell_spans`.
+        """
+        cells = self._cells
+        cells.clear()
+        cols = self.cols
+        columns = (first[:, 0].tolist(), first[:, 1].tolist(), last[:, 0].tolist(), last[:, 1].tolist())
+        for index, (obj, c0, r0, c1, r1) in enumerate(zip(objects, *columns)):
+            entry = (index, obj)
+            for cy in range(r0, r1 + 1):
+                row = cy * cols
+                for key in range(row + c0, row + c1 + 1):
+                    bucket = cells.get(key)
+                    if bucket is None:
+                        cells[key] = [entry]
+                    else:
+                        bucket.append(entry)
+
+    def query(self, obj, dt: float = 0.0) -> list:
+        """Zwraca kandydatów, których komórki pokrywają się z obrysem *obj* (przesuniętym w czasie *dt*)."""
+        cells = self._cells
+        found = {}
+        for key in self._keys(obj, dt):
+            bucket = cells.get(key)
+            if bucket:
+                for index, other in bucket:
+                    found[index] = other
+        return [found[i] for i in sorted(found)]
+
+
+def swept_hits(targets, shots, grid: SpatialHash | None = None, dt: float = 0.0,
+               fresh=()) -> list:
+    """Wszystkie zetknięcia celów z pociskami w ostatnim kroku: lista *(chwila, cel, pocisk)*.
+
+    Lista jest posortowana po chwili zderzenia (ułamek kroku), a przy równych
+    chwilach - po kolejności celów i pocisków w grupach. *fresh* - pociski
+    wystrzelone w trakcie kroku: jeszcze się nie poruszyły, stoją w miejscu
+    wystrzału. *grid* musi być zbudowana z *shots* z tymi samymi *dt* i *fresh*.
+    """
+    if grid is None:
+        grid = SpatialHash()
+        grid.rebuild(shots, dt, fresh)
+    hits = []
+    for index, target in enumerate(targets):
+        for shot in grid.query(target, dt):     # pociski w kolejności grupy
+            t = time_of_impact(target, shot, dt, 0.0 if shot in fresh else dt)
+            if t is not None:
+                hits.append((t, index, target, shot))
+    hits.sort(key=lambda hit: hit[:2])      # sortowanie stabilne – zachowuje kolejność pocisków
+    return [(t, target, shot) for t, _, target, shot in hits]
+
+
+def first_hits(hits):
+    """Rozstrzyga trafienia *(chwila, cel, pocisk)* w kolejności chwil zderzenia.
+
+    Pomija pary, w których cel lub pocisk zostały już zniszczone - wywołujący
+    usuwa (`kill()`) oba obiekty każdej zwróconej pary, więc pocisk niszczy
+    najwyżej jeden cel. Listy kilku grup celów można połączyć i posortować
+    stabilnie po chwili (`sort(key=itemgetter(0))`).
+    """
+    for _, target, shot in hits:
+        if target.alive() and shot.alive():
+            yield target, shot
+
+
+def brute_force_hits(targets, shots, dt: float = 0.0, fresh=()) -> list:
+    """Referencyjna wersja `swept_hits` - każdy cel z każdym pociskiem, bez siatki."""
+    hits = []
+    for target in targets:
+        for shot in shots:
+            t = time_of_impact(target, shot, dt, 0.0 if shot in fresh else dt)
+            if t is not None:
+                hits.append((t, target, shot))
+    hits.sort(key=lambda hit: hit[0])       # stabilnie – w kolejności celów i pocisków
+    return hits
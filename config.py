@@ -0,0 +1,234 @@
+"""
+config.py
+
+Konfiguracja gry zmieniana bez edycji `constants.py` i bez restartu.
+
+Moduły gry importują stałe przez `from constants import *` - każdy ma
+własną kopię nazwy, ustaloną przy imporcie. `Config` jest jedynym
+źródłem wartości i po każdej zmianie przepina te kopie (`apply()`):
+w module `constants` i we wszystkich modułach, które zaimportowały daną
+nazwę. Odczyt w gorących ścieżkach (np. granice zawijania w
+`Asteroid.update`) pozostaje więc zwykłym odczytem zmiennej globalnej
+modułu - tak samo szybkim jak dotąd - zamiast odwołania do atrybutu
+obiektu konfiguracji.
+
+Wartości domyślne i ich typy pochodzą z `constants.py`. Nadpisania:
+
+• plik TOML lub JSON (`load()`; `--config PATH`) - płaskie klucze o nazwach
+  stałych, słowniki (`POWERUP_RARITY`, `PU_DURATION`) jako tabele,
+  w których wystarczy podać zmieniane pozycje,
+• wiersz poleceń (`--set NAZWA=WARTOŚĆ`, wartość w składni Pythona),
+• przeładowanie pliku w trakcie gry (`poll()`, `--watch`) - co
+  `RELOAD_INTERVAL` s sprawdzany jest czas modyfikacji pliku.
+
+Wartości wyliczane (`DERIVED`) są przeliczane automatycznie. Rozmiar
+ekranu i parametry bufora obrotów (`RESTART_ONLY`) obowiązują od startu
+programu - przeładowanie pliku ich nie zmienia.
+
+Przykład pliku `tuning.toml`::
+
+    ASTEROID_SPAWN_RATE = 1.0
+    UFO_MIN_SPAWN_TIME = 5
+
+    [PU_DURATION]
+    shield = 20
+"""
+
+import ast
+import json
+import os
+import sys
+import time
+import tomllib
+from contextlib import contextmanager
+
+import constants
+
+RELOAD_INTERVAL = 0.5   # s – co ile sprawdzany jest plik konfiguracji
+
+# wartości wyliczane z innych stałych (nie można ich ustawić bezpośrednio)
+DERIVED = {
+    "ASTEROID_MAX_RADIUS": lambda v: v["ASTEROID_MIN_RADIUS"] * v["ASTEROID_KINDS"],
+}
+# stałe użyte przy tworzeniu okna i buforów modułów – bez przeładowania w locie
+RESTART_ONLY = frozenset({"SCREEN_WIDTH", "SCREEN_HEIGHT", "ROTATION_STEP", "ROTATION_CACHE_MB"})
+
+_MISSING = object()
+
+
+class Config:
+    """Typowana konfiguracja: nazwa stałej → wartość o typie wartości domyślnej.
+
+    Parametry
+    ---------
+    defaults : moduł, opcjonalny
+        Źródło nazw, typów i wartości domyślnych (domyślnie `constants`).
+    """
+
+    def __init__(self, defaults=constants):
+        self._module = defaults
+        self.defaults = {name: value for name, value in vars(defaults).items()
+                         if name.isupper() and not name.startswith("_")}
+        self.types = {name: type(value) for name, value in self.defaults.items()}
+        self.values = dict(self.defaults)
+        self.path = None
+        self._mtime = None
+        self._next_check = 0.0
+        self._cli: dict = {}        # nadpisania z `--set` – mają pierwszeństwo przed plikiem
+        self._hooks: list = []      # (nazwy, funkcja) – wywoływane po zmianie
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["values"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # ------------------------------------------------------------
+    def coerce(self, name: str, value):
+        """Sprawdza nazwę i zamienia *value* na typ wartości domyślnej."""
+        if name not in self.types:
+            raise ValueError(f"nieznana stała: {name}")
+        if name in DERIVED:
+            raise ValueError(f"{name} jest wyliczana z innych stałych")
+        kind = self.types[name]
+        if kind is bool:
+            if isinstance(value, str):
+                value = value.lower() in ("1", "true", "yes", "tak")
+            return bool(value)
+        if kind is dict:
+            if not isinstance(value, dict):
+                raise ValueError(f"{name}: oczekiwano słownika")
+            unknown = set(value) - set(self.defaults[name])
+            if unknown:
+                raise ValueError(f"{name}: nieznane klucze {sorted(unknown)}")
+            merged = dict(self.values[name])
+            merged.update(value)
+            return merged
+        if kind is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        if kind is int and isinstance(value, float) and value.is_integer():
+            return int(value)
+        if not isinstance(value, kind):
+            raise ValueError(f"{name}: oczekiwano {kind.__name__}, otrzymano {value!r}")
+        return value
+
+    def parse(self, name: str, raw: str):
+        """Wartość z wiersza poleceń (składnia Pythona, w razie błędu – napis)."""
+        try:
+            value = ast.literal_eval(raw)
+        except (ValueError, SyntaxError):
+            value = raw
+        return self.coerce(name, value)
+
+    def parse_setting(self, item: str) -> tuple[str, object]:
+        """Argument `NAZWA=WARTOŚĆ` (`--set`) → (nazwa, wartość po sprawdzeniu typu)."""
+        name, sep, raw = item.partition("=")
+        if not sep:
+            raise ValueError(f"oczekiwano NAZWA=WARTOŚĆ: {item}")
+        return name, self.parse(name, raw)
+
+    def update(self, values: dict, skip=()) -> set[str]:
+        """Ustawia wartości (po sprawdzeniu typów) i zwraca nazwy, które się zmieniły."""
+        new = dict(self.values)
+        for name, value in values.items():
+            if name not in skip:
+                new[name] = self.coerce(name, value)
+        for name, derive in DERIVED.items():
+            new[name] = derive(new)
+        changed = {name for name in new if new[name] != self.values[name]}
+        self.values = new
+        return changed
+
+    # ------------------------------------------------------------
+    def load(self, path: str, skip=()) -> set[str]:
+        """Wczytuje nadpisania z pliku TOML lub JSON; zapamiętuje plik do `poll()`."""
+        self.path = path
+        self._mtime = os.stat(path).st_mtime_ns
+        with open(path, "rb") as f:
+            data = json.load(f) if path.endswith(".json") else tomllib.load(f)
+        return self.update(data, skip)
+
+    def poll(self) -> set[str]:
+        """Przeładowuje plik po jego zmianie (sprawdzenie co `RELOAD_INTERVAL` s).
+
+        Zwraca nazwy zmienionych stałych – już opublikowanych przez `apply()`.
+        Błąd w pliku nie przerywa gry: zostaje wypisany, a wartości się nie zmieniają."""
+        now = time.monotonic()
+        if self.path is None or now < self._next_check:
+            return set()
+        self._next_check = now + RELOAD_INTERVAL
+        try:
+            if os.stat(self.path).st_mtime_ns == self._mtime:
+                return set()
+        except OSError:
+            return set()        # plik chwilowo niedostępny (np. zapis przez edytor)
+
+        previous = self.values
+        # od nowa: domyślne → plik → `--set`; usunięty z pliku klucz wraca do domyślnej
+        self.values = dict(self.defaults)
+        self.values.update({name: previous[name] for name in RESTART_ONLY})
+        try:
+            self.load(self.path, skip=RESTART_ONLY)
+            self.update(self._cli, skip=RESTART_ONLY)
+        except (OSError, ValueError) as exc:
+            self.values = previous
+            print(f"config: {self.path}: {exc}", file=sys.stderr)
+            return set()
+        changed = {name for name in previous if previous[name] != self.values[name]}
+        self.apply(changed)
+        return changed
+
+    # ------------------------------------------------------------
+    def apply(self, names=None) -> None:
+        """Publikuje wartości: w `constants` i w modułach, które zaimportowały te nazwy."""
+        names = self.values.keys() if names is None else names
+        modules = [vars(m) for m in list(sys.modules.values()) if hasattr(m, "__dict__")]
+        published = set()
+        for name in names:
+            value = self.values[name]
+            old = getattr(self._module, name)
+            if value is old:
+                continue
+            published.add(name)
+            for namespace in modules:
+                if namespace.get(name, _MISSING) is old:
+                    namespace[name] = value
+        for watched, hook in self._hooks:
+            if published & watched:
+                hook()
+
+    def on_change(self, names, hook) -> None:
+        """Rejestruje *hook()* wywoływany po opublikowaniu zmiany którejś z *names*."""
+        self._hooks.append((frozenset(names), hook))
+
+    @contextmanager
+    def overridden(self, values: dict):
+        """Tymczasowo ustawia *values* (np. na czas jednej gry w `sweep.py`)."""
+        saved = self.values
+        self.apply(self.update(values))
+        try:
+            yield
+        finally:
+            changed = {name for name in saved if saved[name] != self.values[name]}
+            self.values = saved
+            self.apply(changed)
+
+    # ------------------------------------------------------------
+    def add_arguments(self, parser) -> None:
+        """Dodaje do parsera opcje `--config` i `--set`."""
+        parser.add_argument("--config", metavar="PATH", help="plik konfiguracji (TOML lub JSON)")
+        parser.add_argument("--set", dest="settings", action="append", default=[],
+                            metavar="NAZWA=WARTOŚĆ", help="nadpisanie stałej z constants.py")
+
+    def from_args(self, args) -> None:
+        """Stosuje `--config` i `--set` z argumentów wiersza poleceń (w tej kolejności)."""
+        if args.config:
+            self.load(args.config)
+        values = dict(self.parse_setting(item) for item in args.settings)
+        self._cli = values
+        self.update(values)
+        self.apply()
+
+
+# Wspólna instancja używana przez wszystkie moduły gry.
+config = Config()
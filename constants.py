@@ -25,6 +25,44 @@ ASTEROID_KINDS      = 3           # ile „pokoleń” rozpadu (large→medium
 ASTEROID_SPAWN_RATE = 1.5         # średni odstęp między nowymi asteroidami [s]
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS  # 60 px dla large
 
+# --- KOLIZJE --------------------------------------------------------------- #
+COLLISION_CELL_SIZE = 128         # bok komórki siatki broadphase (≥ średnica asteroidy)
+ENTITY_STORE        = False       # wektorowy backend ruchu (wymaga pakietu numpy)
+PARALLEL_WORKERS    = 0           # wątki liczące krok EntityStore w porcjach (0/1 – szeregowo)
+PARALLEL_MIN_CHUNK  = 16384       # najmniejsza porcja wierszy warta osobnego wątku
+
+# --- GRAFIKA ---------------------------------------------------------------- #
+ROTATION_STEP     = 2     # ° – rozdzielczość kątowa bufora obróconych sprite'ów
+ROTATION_CACHE_MB = 32    # MB – budżet pamięci na obrócone sprite'y
+DIRTY_RECTS       = False # odświeżanie tylko zmienionych fragmentów ekranu
+DIRTY_RECT_MAX_FRACTION = 0.5  # powyżej tej części ekranu – pełny flip()
+
+# --- stały krok symulacji (main.py) ---
+PHYSICS_HZ     = 120    # kroków symulacji na sekundę – niezależnie od FPS wyświetlania
+MAX_SUBSTEPS   = 8      # limit kroków w jednej klatce (ochrona przed "spiralą śmierci")
+MAX_FRAME_TIME = 0.25   # s – dłuższa przerwa (np. przeciąganie okna) liczona jako tyle
+INTERPOLATION_MAX_JUMP = 64  # px – większy skok między krokami rysowany bez interpolacji
+
+# --- dźwięk (audio.py) ---
+SFX_VOICES   = 8     # kanały miksera dla efektów – limit jednocześnie brzmiących głosów
+SFX_MERGE_MS = 40    # ms – kolejne odtworzenie tego samego efektu w tym oknie jest scalane
+MUSIC_CROSSFADE_MS   = 1500  # ms – przenikanie przy zmianie utworu (music.py)
+MUSIC_PREFETCH_DELAY = 1.0   # s – bezczynność wątku muzyki przed dekodowaniem następnego utworu
+
+# --- adaptacyjna jakość (governor.py) ---
+GOVERNOR           = True   # obniżanie jakości efektów przy przekroczeniu budżetu klatki
+GOVERNOR_BUDGET_MS = 16.7   # ms – budżet pracy klatki (60 FPS)
+GOVERNOR_DEGRADE   = 0.9    # × budżetu – powyżej: niższy poziom jakości
+GOVERNOR_RESTORE   = 0.5    # × budżetu – poniżej: wyższy poziom jakości
+GOVERNOR_WINDOW    = 30     # klatek uśredniania przed decyzją
+GOVERNOR_EXPLOSION_CAP = 24 # limit wybuchów na poziomie "limit wybuchów"
+
+# --- pule obiektów (maks. liczba wolnych egzemplarzy w puli) ---
+OBJECT_POOLS       = True
+SHOT_POOL_SIZE      = 512
+ASTEROID_POOL_SIZE  = 256
+EXPLOSION_POOL_SIZE = 128
+
 # --- GRACZ / STATEK --------------------------------------------------------- #
 PLAYER_RADIUS     = 45   # rozmiar okręgu kolizji statku
 PLAYER_TURN_SPEED = 300  # °/s – prędkość obrotu
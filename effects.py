@@ -0,0 +1,121 @@
+"""
+effects.py
+
+Efekty czasowe gracza (buffy) z regułami nakładania.
+
+Dotąd każdy buff miał własne pola w `Player` (`fast_fire_level`
+i `fast_fire_until`, `spread_level`, słownik `buff_until`), a `update`
+i `shoot` w każdej klatce sprawdzały `buff_active` - odczyt zegara
+i przeszukanie słownika dla każdego buffa. `Effects` trzyma poziomy
+wszystkich efektów w jednym słowniku `levels`, zmienianym tylko przy
+zebraniu power-upa i przy wygaśnięciu efektu. Wygaśnięcie jest
+zdarzeniem w kolejce gry (`events.py`), więc biegnie w czasie symulacji
+i stoi podczas pauzy. Każda zmiana poziomu wywołuje *on_change(kind,
+level)* - właściciel przelicza wtedy zależne od niego wartości (np.
+odstęp między strzałami), a gorąca ścieżka czyta już gotowe liczby.
+
+Reguły nakładania (`EFFECT_RULES`, nowe efekty - `register`):
+
+    EXTEND      - każdy stack +1 poziom, wspólny czas wydłużany o pełen
+                  czas trwania (każdy stack dotrwa swój czas), wszystkie
+                  stacki wygasają razem,
+    REFRESH     - każdy stack +1 poziom, wspólny czas liczony od nowa,
+    INDEPENDENT - każdy stack ma własny czas i wygasa osobno.
+
+Limit stacków (0 - bez limitu) obcina poziom; przy INDEPENDENT nowy
+stack ponad limit zastępuje najstarszy.
+"""
+
+from constants import *
+from events import EventQueue
+
+EXTEND = "extend"
+REFRESH = "refresh"
+INDEPENDENT = "independent"
+
+# efekt → (reguła nakładania, limit stacków; 0 – bez limitu)
+EFFECT_RULES = {
+    PU_FAST_FIRE: (EXTEND, 0),
+    PU_SPREAD:    (EXTEND, 0),
+}
+
+
+def register(kind: str, rule: str = EXTEND, max_stacks: int = 0) -> None:
+    """Dodaje (lub zmienia) regułę nakładania efektu *kind*."""
+    if rule not in (EXTEND, REFRESH, INDEPENDENT):
+        raise ValueError(f"nieznana reguła nakładania: {rule}")
+    EFFECT_RULES[kind] = (rule, max_stacks)
+
+
+class Effects:
+    """Aktywne efekty jednego obiektu i ich poziomy.
+
+    Parametry
+    ---------
+    events : EventQueue
+        Kolejka zdarzeń gry, w której planowane są wygaśnięcia.
+    on_change : callable, opcjonalny
+        Wywoływane jako *on_change(kind, level)* po każdej zmianie poziomu.
+    """
+
+    def __init__(self, events: EventQueue, on_change=None):
+        self.events = events
+        self.on_change = on_change
+        self.levels: dict[str, int] = {}        # bieżący poziom (liczba stacków) efektu
+        self._expiry: dict[str, list] = {}      # zaplanowane wygaśnięcia efektu
+
+    def level(self, kind: str) -> int:
+        """Poziom efektu (0 – nieaktywny)."""
+        return self.levels.get(kind, 0)
+
+    def add(self, kind: str, duration: float | None = None) -> int:
+        """Nakłada stack efektu *kind* na *duration* s (domyślnie `PU_DURATION`); zwraca poziom."""
+        rule, cap = EFFECT_RULES[kind]
+        duration = PU_DURATION[kind] if duration is None else duration
+        events = self.events
+        now = events.clock.now()
+        level = self.levels.get(kind, 0)
+        pending = self._expiry.setdefault(kind, [])
+
+        if rule == INDEPENDENT:
+            if cap and level >= cap:
+                events.cancel(pending.pop(0))   # najstarszy stack ustępuje nowemu
+            else:
+                level += 1
+            pending.append(events.at(now + duration, self._expire_stack, kind))
+        else:
+            until = now + duration
+            if rule == EXTEND and pending:
+                until = max(pending[0].time, now) + duration
+            level = min(level + 1, cap) if cap else level + 1
+            for event in pending:
+                events.cancel(event)
+            pending[:] = [events.at(until, self._expire, kind)]
+        self._set(kind, level)
+        return level
+
+    def clear(self) -> None:
+        """Usuwa wszystkie efekty (np. przy restarcie gry)."""
+        for kind, pending in self._expiry.items():
+            for event in pending:
+                self.events.cancel(event)
+            pending.clear()
+        for kind in [kind for kind, level in self.levels.items() if level]:
+            self._set(kind, 0)
+
+    # -------------- wygaśnięcia (zdarzenia kolejki) --------------
+    def _expire(self, kind: str) -> None:
+        self._expiry[kind].clear()
+        self._set(kind, 0)
+
+    def _expire_stack(self, kind: str) -> None:
+        pending = self._expiry[kind]
+        pending[:] = [event for event in pending if event.callback is not None]
+        self._set(kind, len(pending))
+
+    def _set(self, kind: str, level: int) -> None:
+        if self.levels.get(kind, 0) == level:
+            return
+        self.levels[kind] = level
+        if self.on_change is not None:
+            self.on_change(kind, level)
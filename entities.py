@@ -0,0 +1,106 @@
+"""
+entities.py
+
+Lekkie encje symulacji - asteroidy i pociski.
+
+`CircleShape` dziedziczy po `pygame.sprite.Sprite`: każdy obiekt ma
+własny słownik atrybutów, powierzchnię `image`, prostokąt `rect`
+i słownik grup, w których się znajduje. Przy tysiącach asteroid
+i setkach pocisków to większość pamięci i czasu dostępu do pól.
+
+`Entity` przechowuje wyłącznie stan symulacji w `__slots__`:
+
+• `position`, `velocity`, `radius` - ruch i kolizje,
+• `kind`  - rodzaj (wariant grafiki) wybrany przez symulację,
+• `angle` - orientacja (0 dla obiektów bez kierunku).
+
+Nie ma w niej nic do rysowania - powierzchnię dla pary *(rodzaj, rozmiar)*
+dobiera `renderer.EntityRenderer`, współdzieląc ją między wszystkimi
+encjami. Grupy sprite'ów działają bez zmian: encja implementuje ten sam
+protokół co `Sprite` (`add_internal`, `remove_internal`, `kill`, `alive`…),
+ale listę grup trzyma w krotce zamiast w słowniku.
+
+Podobnie jak w `CircleShape`, klasa wskazuje grupy (`containers`),
+opcjonalny `EntityStore` (`store`) i pulę (`pool`) atrybutami klasowymi.
+"""
+
+import pygame
+
+
+class Entity:
+    """Okrągła encja bez `__dict__`, `image` i `rect`."""
+
+    __slots__ = ("position", "velocity", "radius", "kind", "angle",
+                 "_groups", "_store", "_slot")
+
+    containers = ()
+    store = None
+    store_mode = 0
+
+    def __init__(self, x, y, radius, kind=None, angle=0.0):
+        self._groups = ()
+        self.add(*self.containers)
+        self.position = pygame.Vector2(x, y)
+        self.velocity = pygame.Vector2(0, 0)
+        self.radius = radius
+        self.kind = kind
+        self.angle = angle
+
+        if self.store is not None:
+            self.store.adopt(self, self.store_mode)
+
+    def reset(self, x, y, radius, kind=None, angle=0.0):
+        # ponowne użycie encji z puli (`pool.py`) – stan jak po __init__,
+        # ale z zachowaniem istniejących wektorów
+        self.add(*self.containers)
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+        self.kind = kind
+        self.angle = angle
+
+        if self.store is not None:
+            self.store.adopt(self, self.store_mode)
+
+    def collides_with(self, obj2):
+        # porównanie kwadratów odległości – bez kosztownego pierwiastka
+        r = self.radius + obj2.radius
+        return self.position.distance_squared_to(obj2.position) <= r * r
+
+    def update(self, dt):
+        # metoda powinna zostać nadpisana w klasie dziedziczącej
+        pass
+
+    # -------------- protokół pygame.sprite.Sprite --------------
+    def add(self, *groups):
+        for group in groups:
+            if group not in self._groups:
+                group.add_internal(self)
+                self._groups += (group,)
+
+    def remove(self, *groups):
+        for group in groups:
+            if group in self._groups:
+                group.remove_internal(self)
+                self.remove_internal(group)
+
+    def add_internal(self, group):
+        if group not in self._groups:
+            self._groups += (group,)
+
+    def remove_internal(self, group):
+        self._groups = tuple(g for g in self._groups if g is not group)
+
+    def kill(self):
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def alive(self) -> bool:
+        return bool(self._groups)
+
+    def groups(self) -> list:
+        return list(self._groups)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} Entity(in {len(self._groups)} groups)>"
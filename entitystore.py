@@ -0,0 +1,395 @@
+"""
+entitystore.py
+
+Opcjonalny, wektorowy backend ruchu oparty na NumPy (*structure of arrays*).
+
+Zamiast przesuwać każdy `pygame.Vector2` osobno w `update(dt)`, pozycje,
+prędkości i promienie wszystkich zarejestrowanych obiektów trzymane są
+w ciągłych tablicach. Jedno wywołanie `EntityStore.step` wykonuje
+naraz całkowanie ruchu, zawijanie ekranu (asteroidy, power-upy) oraz
+wykrywanie pocisków, które opuściły planszę. `EntityStore.swept_hits`
+liczy chwile zderzeń okrąg-okrąg dla wszystkich par kandydatów z siatki
+kolizji (`collisions.SpatialHash`) jedną operacją wektorową.
+
+Przy dużej liczbie obiektów krok i przydział do komórek siatki kolizji
+(`cell_spans`) mogą być liczone w porcjach na puli wątków
+(`parallel.ChunkPool`, atrybut `parallel`) - z wynikiem identycznym
+jak przy liczeniu szeregowym.
+
+Reszta gry nie musi o tym wiedzieć: sprite'y pozostają zwykłymi
+obiektami `CircleShape`, a ich atrybuty `position` i `velocity` stają
+się widokami na wiersz tablicy: zwracany `Vector2` (`_RowVector`) zapisuje
+każdą zmianę w miejscu (`v.x = …`, `update`, `rotate_ip`, `+=`) z powrotem
+do tablicy. Klasa wskazuje magazyn tak
+samo jak grupy - przez atrybut klasowy (`Asteroid.store = store`).
+
+Moduł działa tylko przy zainstalowanym pakiecie `numpy`;
+bez niego `HAS_NUMPY` ma wartość False, a gra korzysta ze zwykłej ścieżki.
+"""
+
+import pygame
+from collisions import SpatialHash
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:     # NumPy jest zależnością opcjonalną
+    np = None
+
+HAS_NUMPY = np is not None
+
+# --- tryby zachowania na krawędzi ekranu ---------------------------------- #
+WRAP = 0   # wyjście za krawędź → pojawienie się po przeciwnej stronie
+CULL = 1   # wyjście za krawędź → usunięcie obiektu (pociski)
+
+
+class _RowVector(pygame.Vector2):
+    """`Vector2` z wiersza tablicy magazynu; zmiany w miejscu trafiają do tablicy.
+
+    Obiekt jest kopią wiersza z chwili odczytu - zmiany w tablicy (np. w
+    `EntityStore.step`) nie są w nim widoczne, ale każda jego modyfikacja
+    nadpisuje wiersz, dopóki należy on do tego samego obiektu. Wektor
+    zachowany dłużej (np. pozycja zniszczonej asteroidy w wybuchu) nie
+    zmieni wiersza przydzielonego już innemu obiektowi.
+    """
+
+    __slots__ = ("_array", "_slot", "_owner")
+
+    def __init__(self, array, slot: int, owner):
+        x, y = array[slot]
+        super().__init__(x, y)
+        setattr_ = pygame.Vector2.__setattr__
+        setattr_(self, "_array", array)
+        setattr_(self, "_slot", slot)
+        setattr_(self, "_owner", owner)
+
+    def _write(self) -> None:
+        try:
+            owner = self._owner
+        except AttributeError:      # wynik działania (`+`, `copy()`) – bez wiersza
+            return
+        store = getattr(owner, "_store", None)
+        if store is not None and owner._slot == self._slot:
+            self._array[self._slot] = (self.x, self.y)
+
+    def __setattr__(self, name, value):
+        # x, y oraz przypisania przez swizzling (`v.xy = …`)
+        super().__setattr__(name, value)
+        self._write()
+
+
+def _write_through(name: str):
+    method = getattr(pygame.Vector2, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._write()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# metody i operatory zmieniające wektor w miejscu
+for _name in ("update", "scale_to_length", "from_polar", "__setitem__",
+              "normalize_ip", "rotate_ip", "rotate_rad_ip", "reflect_ip",
+              "clamp_magnitude_ip", "move_towards_ip",
+              "__iadd__", "__isub__", "__imul__", "__itruediv__", "__ifloordiv__"):
+    setattr(_RowVector, _name, _write_through(_name))
+
+
+class _StoreView:
+    """Metody podmieniające `position`/`velocity` na widoki wiersza magazynu.
+
+    Nie jest klasą bazową widoku - `EntityStore._view_class` kopiuje je do
+    bezpośredniej podklasy sprite'a. Tylko wtedy zamiana `__class__` działa
+    zarówno dla sprite'ów z `__dict__`, jak i encji z `__slots__`.
+    """
+
+    @property
+    def position(self) -> pygame.Vector2:
+        return _RowVector(self._store.pos, self._slot, self)
+
+    @position.setter
+    def position(self, value):
+        self._store.pos[self._slot] = value
+
+    @property
+    def velocity(self) -> pygame.Vector2:
+        return _RowVector(self._store.vel, self._slot, self)
+
+    @velocity.setter
+    def velocity(self, value):
+        self._store.vel[self._slot] = value
+
+    def update(self, dt):
+        # ruch, zawijanie i usuwanie liczy `EntityStore.step` dla wszystkich naraz
+        pass
+
+    def kill(self):
+        type(self).__base__.kill(self)
+        self._store.release(self)
+
+
+_VIEW_ATTRS = ("position", "velocity", "update", "kill")
+
+
+class EntityStore:
+    """Magazyn pozycji, prędkości i promieni w tablicach NumPy.
+
+    Parametry
+    ---------
+    capacity : int
+        Początkowa liczba wierszy; magazyn podwaja się po wyczerpaniu miejsca.
+    width, height : int
+        Rozmiar planszy używany przy zawijaniu i usuwaniu obiektów.
+    """
+
+    def __init__(self, capacity: int = 1024, width: int = SCREEN_WIDTH,
+                 height: int = SCREEN_HEIGHT):
+        if np is None:
+            raise RuntimeError("EntityStore wymaga pakietu numpy")
+        self.width = width
+        self.height = height
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.radius = np.zeros(capacity)
+        self.mode = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.has_rect = np.zeros(capacity, dtype=bool)   # sprite z `rect` do synchronizacji
+        self.owners: list = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        self._views: dict[type, type] = {}
+        self.size = 0          # najwyższy zajęty indeks + 1
+        self.parallel = None   # opcjonalna `parallel.ChunkPool` – krok liczony w porcjach
+
+    # ------------------------------------------------------------
+    def _grow(self) -> None:
+        old = len(self.alive)
+        new = old * 2
+        for name in ("pos", "vel", "radius", "mode", "alive", "has_rect"):
+            arr = getattr(self, name)
+            grown = np.zeros((new,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, name, grown)
+        self.owners.extend([None] * old)
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def _view_class(self, cls: type) -> type:
+        view = self._views.get(cls)
+        if view is None:
+            namespace = {name: _StoreView.__dict__[name] for name in _VIEW_ATTRS}
+            namespace["__module__"] = cls.__module__
+            if not cls.__dictoffset__:
+                # encja z `__slots__` – widok nie może dodać `__dict__`
+                namespace["__slots__"] = ()
+            view = type(cls.__name__, (cls,), namespace)
+            self._views[cls] = view
+        return view
+
+    def adopt(self, sprite, mode: int) -> None:
+        """Przenosi stan ruchu *sprite* do magazynu i zamienia go w widok."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.pos[slot] = sprite.position
+        self.vel[slot] = sprite.velocity
+        del sprite.position, sprite.velocity    # odtąd – widoki wiersza tablic
+        self.radius[slot] = sprite.radius
+        self.mode[slot] = mode
+        self.alive[slot] = True
+        self.owners[slot] = sprite
+        # encje z `entities.py` nie mają `rect` – rysuje je renderer
+        self.has_rect[slot] = isinstance(sprite, pygame.sprite.Sprite)
+        self.size = max(self.size, slot + 1)
+        sprite._store, sprite._slot = self, slot
+        sprite.__class__ = self._view_class(type(sprite))
+
+    def release(self, sprite) -> None:
+        """Odłącza zniszczony sprite - wraca do zwykłych atrybutów `Vector2`."""
+        slot = sprite._slot
+        # zwykłe wektory – nie zapisują już do zwolnionego wiersza
+        position, velocity = pygame.Vector2(sprite.position), pygame.Vector2(sprite.velocity)
+        sprite.__class__ = type(sprite).__base__   # klasa sprzed `adopt`
+        sprite.position, sprite.velocity = position, velocity
+        del sprite._store, sprite._slot
+        self.alive[slot] = False
+        self.owners[slot] = None
+        self._free.append(slot)
+
+    # ------------------------------------------------------------
+    def step(self, dt: float) -> list:
+        """Przesuwa wszystkie obiekty o `velocity * dt`.
+
+        Zwraca listę sprite'ów w trybie `CULL`, które opuściły planszę -
+        wywołujący powinien je usunąć (`kill()`).
+        """
+        n = self.size
+        if n == 0:
+            return []
+        if self.parallel is None:
+            rects, cull = self._step_rows(0, n, dt)
+        else:
+            parts = self.parallel.map(lambda start, stop: self._step_rows(start, stop, dt), n)
+            rects = np.concatenate([part[0] for part in parts])
+            cull = np.concatenate([part[1] for part in parts])
+
+        self._sync_rects(rects)
+        owners = self.owners
+        return [owners[i] for i in cull.tolist()]
+
+    def _step_rows(self, start: int, stop: int, dt: float):
+        # ruch i krawędzie wierszy [start, stop) – zwraca indeksy sprite'ów
+        # z `rect` do synchronizacji i obiektów `CULL` poza planszą
+        alive = self.alive[start:stop]
+        pos = self.pos[start:stop]
+        pos += self.vel[start:stop] * dt
+        x, y, r = pos[:, 0], pos[:, 1], self.radius[start:stop]
+
+        out_left, out_right = x < -r, x > self.width + r
+        out_top, out_bottom = y < -r, y > self.height + r
+
+        mode = self.mode[start:stop]
+        wrap = alive & (mode == WRAP)
+        m = wrap & out_left
+        x[m] = self.width + r[m]
+        m = wrap & out_right
+        x[m] = -r[m]
+        m = wrap & out_top
+        y[m] = self.height + r[m]
+        m = wrap & out_bottom
+        y[m] = -r[m]
+
+        rects = np.flatnonzero(alive & self.has_rect[start:stop]) + start
+        cull = alive & (mode == CULL) & (out_left | out_right | out_top | out_bottom)
+        return rects, np.flatnonzero(cull) + start
+
+    def _sync_rects(self, slots) -> None:
+        # prostokąty rysowania sprite'ów muszą nadążać za pozycjami w tablicach
+        owners = self.owners
+        xs = self.pos[slots, 0].tolist()
+        ys = self.pos[slots, 1].tolist()
+        for i, x, y in zip(slots.tolist(), xs, ys):
+            owners[i].rect.center = (x, y)
+
+    # ------------------------------------------------------------
+    def cell_spans(self, slots, sweep, grid):
+        """Zakresy komórek siatki *grid* (`collisions.SpatialHash`) dla wierszy *slots*.
+
+        Wektorowy odpowiednik `SpatialHash._keys`: prostokąt obejmuje okrąg
+        na odcinku przebytym w czasie `sweep[i]`. Zwraca tablice (n, 2) -
+        pierwszą i ostatnią (kolumnę, wiersz) - dla `SpatialHash.rebuild_spans`.
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        sweep = np.asarray(sweep, dtype=float)
+        limits = np.array([grid.cols - 1, grid.rows - 1])
+
+        def kernel(start, stop):
+            rows = slots[start:stop]
+            pos, r = self.pos[rows], self.radius[rows, None]
+            moved = pos - self.vel[rows] * sweep[start:stop, None]
+            lo = np.minimum(pos, moved) - r
+            hi = np.maximum(pos, moved) + r
+            first = ((lo - grid.origin) // grid.cell_size).astype(np.intp)
+            last = ((hi - grid.origin) // grid.cell_size).astype(np.intp)
+            return np.clip(first, 0, limits), np.clip(last, 0, limits)
+
+        if self.parallel is None:
+            return kernel(0, len(slots))
+        parts = self.parallel.map(kernel, len(slots))
+        return (np.concatenate([part[0] for part in parts]),
+                np.concatenate([part[1] for part in parts]))
+
+    def impacts(self, slots_a, slots_b, dt: float = 0.0, fresh_b=None):
+        """Chwile zetknięcia okręgów par `slots_a[k]`, `slots_b[k]` w ostatnim kroku.
+
+        Wektorowy odpowiednik `collisions.time_of_impact` dla listy par
+        (np. kandydatów z siatki): zwraca indeksy *k* zetkniętych par
+        i ułamki kroku. *fresh_b* - maska par, w których obiekt *slots_b*
+        utworzono w trakcie kroku (bez ruchu w tym kroku).
+        """
+        slots_a = np.asarray(slots_a, dtype=np.intp)
+        slots_b = np.asarray(slots_b, dtype=np.intp)
+        sweep_b = dt if fresh_b is None else np.where(fresh_b, 0.0, dt)
+        wa = self.vel[slots_a] * dt
+        wb = self.vel[slots_b] * np.reshape(sweep_b, (-1, 1))
+        # względne przesunięcie w kroku i względna pozycja na jego początku
+        w = wa - wb
+        d = self.pos[slots_a] - self.pos[slots_b] - w
+        wx, wy, dx, dy = w[:, 0], w[:, 1], d[:, 0], d[:, 1]
+        r = self.radius[slots_a] + self.radius[slots_b]
+        c = dx * dx + dy * dy - r * r
+        half_b = dx * wx + dy * wy
+        aa = wx * wx + wy * wy
+        disc = half_b * half_b - aa * c
+        touching = c <= 0
+        approaching = ~touching & (half_b < 0) & (disc >= 0)
+        k = np.flatnonzero(touching | approaching)
+        t = np.zeros(len(k))
+        late = approaching[k]
+        rows = k[late]
+        t[late] = (-half_b[rows] - np.sqrt(disc[rows])) / aa[rows]
+        keep = t <= 1.0
+        return k[keep], t[keep]
+
+    def swept_hits(self, targets, shots, grid=None, dt: float = 0.0, fresh=(),
+                   spans=None) -> list:
+        """Odpowiednik `collisions.swept_hits` liczony wektorowo.
+
+        Broadphase to ta sama siatka co `collisions.SpatialHash` (*grid*
+        wyznacza tylko jej geometrię): kandydatami są pary celu i pocisku
+        z co najmniej jedną wspólną komórką (`cell_pairs`), a `impacts`
+        testuje wyłącznie te pary. *spans* - zakresy komórek pocisków
+        z `cell_spans`, jeśli wywołujący już je policzył. Wszystkie obiekty
+        obu grup muszą należeć do magazynu.
+        """
+        targets, shots = list(targets), list(shots)
+        if not targets or not shots:
+            return []
+        if grid is None:
+            grid = SpatialHash()
+        slots_a = np.array([o._slot for o in targets], dtype=np.intp)
+        slots_b = np.array([s._slot for s in shots], dtype=np.intp)
+        fresh_b = np.array([shot in fresh for shot in shots], dtype=bool) if fresh else None
+        if spans is None:
+            spans = self.cell_spans(slots_b, np.where(fresh_b, 0.0, dt) if fresh else
+                                    np.full(len(shots), dt), grid)
+        target_spans = self.cell_spans(slots_a, np.full(len(targets), dt), grid)
+        ii, jj = self.cell_pairs(target_spans, spans, grid.cols)
+        k, t = self.impacts(slots_a[ii], slots_b[jj], dt,
+                            None if fresh_b is None else fresh_b[jj])
+        ii, jj = ii[k], jj[k]
+        # po chwili, dalej w kolejności grup – jak `collisions.swept_hits`
+        order = np.lexsort((jj, ii, t))
+        return [(toi, targets[i], shots[j])
+                for i, j, toi in zip(ii[order].tolist(), jj[order].tolist(), t[order].tolist())]
+
+    @staticmethod
+    def cell_pairs(spans_a, spans_b, cols: int):
+        """Pary (i, j) obiektów, których zakresy komórek (`cell_spans`) mają wspólną komórkę.
+
+        Zwraca dwie tablice indeksów posortowane po *i*, a dalej po *j*, bez powtórzeń.
+        """
+        keys_a, owners_a = _cell_keys(*spans_a, cols)
+        keys_b, owners_b = _cell_keys(*spans_b, cols)
+        order = np.argsort(keys_b, kind="stable")
+        keys_b, owners_b = keys_b[order], owners_b[order]
+        # każda komórka obiektu *a* łączy się ze wszystkimi obiektami *b* z tej komórki
+        lo = np.searchsorted(keys_b, keys_a, "left")
+        counts = np.searchsorted(keys_b, keys_a, "right") - lo
+        rows = np.repeat(np.arange(len(keys_a)), counts)
+        within = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        m = len(spans_b[0])
+        codes = np.unique(owners_a[rows] * m + owners_b[lo[rows] + within])
+        return codes // m, codes % m
+
+
+def _cell_keys(first, last, cols: int):
+    # rozwija zakresy komórek na pary (klucz komórki, indeks obiektu) – jak `SpatialHash._keys`
+    width = last[:, 0] - first[:, 0] + 1
+    counts = width * (last[:, 1] - first[:, 1] + 1)
+    owners = np.repeat(np.arange(len(first)), counts)
+    within = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    cx = first[owners, 0] + within % width[owners]
+    cy = first[owners, 1] + within // width[owners]
+    return cy * cols + cx, owners
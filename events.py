@@ -0,0 +1,99 @@
+"""
+events.py
+
+Zdarzenia zaplanowane w czasie symulacji.
+
+Spawny asteroid, UFO i power-upów oraz koniec efektu Threat były dotąd
+osobnymi licznikami, zmniejszanymi (lub zwiększanymi) w każdej klatce
+i porównywanymi z progiem. Każdy z nich zaokrąglał odstęp do pełnej
+klatki, a licznik spawnu asteroid po przekroczeniu progu był zerowany,
+więc kolejne spawny przesuwały się o resztę z ostatniej klatki.
+
+`EventQueue` trzyma zdarzenia w kopcu uporządkowanym według czasu
+symulacji (`sim.clock`) i kolejności zaplanowania. `run()` w klatce bez
+zaległych zdarzeń kończy się na jednym porównaniu z `next_time`.
+Zdarzenie wywołuje się w pierwszym kroku, w którym zegar osiągnął jego
+czas, a następne planowane jest od czasu poprzedniego, nie od bieżącej
+klatki, więc odstępy się nie sumują. Zegar symulacji stoi podczas pauzy,
+więc zdarzenia stoją razem z nim.
+
+Odwołanie zdarzenia (`cancel`) tylko je oznacza - zostaje usunięte
+z kopca, gdy dotrze na jego szczyt.
+"""
+
+import heapq
+import itertools
+import math
+import sim
+
+
+class Event:
+    """Zaplanowane wywołanie *callback(\\*args)* w chwili *time* [s czasu gry]."""
+
+    __slots__ = ("time", "callback", "args")
+
+    def __init__(self, time: float, callback, args: tuple):
+        self.time = time
+        self.callback = callback    # None – zdarzenie odwołane
+        self.args = args
+
+
+class EventQueue:
+    """Kolejka zdarzeń w czasie symulacji.
+
+    Parametry
+    ---------
+    clock : sim.SimClock, opcjonalny
+        Zegar, według którego wywoływane są zdarzenia (domyślnie `sim.clock`).
+    """
+
+    def __init__(self, clock: sim.SimClock = sim.clock):
+        self.clock = clock
+        self.next_time = math.inf       # czas najbliższego zdarzenia
+        self._heap: list[tuple[float, int, Event]] = []
+        self._order = itertools.count()     # remisy czasu – w kolejności zaplanowania
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def at(self, time: float, callback, *args) -> Event:
+        """Planuje *callback(\\*args)* na chwilę *time* czasu gry."""
+        event = Event(time, callback, args)
+        heapq.heappush(self._heap, (time, next(self._order), event))
+        if time < self.next_time:
+            self.next_time = time
+        return event
+
+    def schedule(self, delay: float, callback, *args) -> Event:
+        """Planuje *callback(\\*args)* za *delay* sekund czasu gry."""
+        return self.at(self.clock.now() + delay, callback, *args)
+
+    def cancel(self, event: Event | None) -> None:
+        """Odwołuje zdarzenie (None – nic nie robi)."""
+        if event is not None:
+            event.callback = None
+
+    def run(self) -> int:
+        """Wywołuje zdarzenia, których czas już minął; zwraca ich liczbę."""
+        now = self.clock.now()
+        if now < self.next_time:
+            return 0
+        heap = self._heap
+        fired = 0
+        # zdarzenie może zaplanować kolejne – także już zaległe
+        while heap and heap[0][0] <= now:
+            event = heapq.heappop(heap)[2]
+            callback = event.callback
+            if callback is not None:
+                event.callback = None
+                callback(*event.args)
+                fired += 1
+        self.next_time = heap[0][0] if heap else math.inf
+        return fired
+
+    def clear(self) -> None:
+        """Usuwa wszystkie zdarzenia (np. przy nowej grze)."""
+        for _, _, event in self._heap:
+            event.callback = None
+        self._heap.clear()
+        self.next_time = math.inf
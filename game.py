@@ -0,0 +1,391 @@
+"""
+game.py
+
+Stan pojedynczej rozgrywki - klasa `Game`.
+
+Zawiera wszystko, co dotąd żyło w lokalnych zmiennych `main.main()`:
+grupy sprite'ów, gracza, pole asteroid, punktację i kolejkę zdarzeń
+czasu gry (`events.py` - spawny, koniec efektów).
+Jedna klatka gry to trzy fazy wywoływane kolejno przez pętlę:
+
+(1) `update(dt)`  - zaległe zdarzenia (spawny asteroid, UFO, power-upów)
+                    i ruch obiektów,
+(2) `collide(dt)` - wszystkie testy kolizji i ich skutki,
+(3) `draw(screen, fps)` - render tła, obiektów, HUD-u i wybuchów.
+
+Klasa nie obsługuje zdarzeń okna ani nie odmierza czasu - robi to
+wywołujący (`main.py` w trybie okienkowym, `headless.py` w trybie
+bez ekranu, ze stałym `dt`). Dzięki temu ta sama logika działa w obu.
+"""
+
+from operator import itemgetter
+import pygame
+import audio
+import assets
+import sim
+from sim import rng
+from constants import *
+from player import Player
+from asteroid import Asteroid
+from asteroidfield import AsteroidField
+from events import EventQueue
+from shots import Shot
+from score import Score
+from utils import Explosion, random_outside_position, random_velocity
+from ufo import UFO
+from powerups import PowerUp
+from collisions import SpatialHash, first_hits, swept_hits
+from entitystore import EntityStore, HAS_NUMPY
+import parallel
+from pool import Pool
+from renderer import EntityRenderer, asteroid_skin, shot_skin
+from profiler import profiler
+from governor import quality
+from loader import AssetLoader
+
+
+def preload_assets() -> dict:
+    """Wczytuje (równolegle, blokująco) cały manifest zasobów - tworzenie
+    obiektów w grze nie sięga potem na dysk. Zwraca statystyki loadera."""
+    return AssetLoader().run()
+
+
+def weighted_choice(d: dict[str, float]) -> str:
+    """Losuje klucz ze słownika *d*, gdzie wartości to wagi prawdopodobieństwa."""
+    r = rng.random()
+    cum = 0
+    for k, w in d.items():
+        cum += w
+        if r < cum:
+            return k
+    return k
+
+
+class Game:
+    """Pojedyncza rozgrywka: obiekty, liczniki i logika jednej klatki.
+
+    Parametry
+    ---------
+    screen : pygame.Surface
+        Powierzchnia ekranu (przekazywana do ekranu końcowego).
+    controls : obiekt z metodą `poll()`, opcjonalny
+        Źródło sterowania statkiem; domyślnie klawiatura.
+    exit_screen : callable(screen, score)
+        Wywoływana, gdy gracz straci ostatnie życie.
+    restart_game : callable()
+        Wywoływana po `exit_screen`; domyślnie tylko ustawia `game_over`.
+    use_store : bool
+        Włącza wektorowy backend ruchu (`EntityStore`, wymaga numpy).
+    use_pools : bool
+        Ponowne użycie pocisków, asteroid i wybuchów (`pool.py`).
+    """
+
+    def __init__(self, screen, controls=None, exit_screen=None, restart_game=None,
+                 use_store: bool | None = None, use_pools: bool | None = None):
+        # domyślne wartości odczytywane przy tworzeniu gry – mogą pochodzić z `config`
+        use_store = ENTITY_STORE if use_store is None else use_store
+        use_pools = OBJECT_POOLS if use_pools is None else use_pools
+        self.screen = screen
+        self.exit_screen = exit_screen or (lambda screen, score: None)
+        self.restart_game = restart_game or self.end
+        self.game_over = False
+        self.background = assets.image("assets/background.png", flags=0)
+
+        # === Sprite groups ===
+        self.updatable = pygame.sprite.Group()      # obiekty z metodą update()
+        self.drawable = pygame.sprite.Group()       # obiekty rysowane co klatkę
+        self.asteroids = pygame.sprite.Group()
+        self.shots = pygame.sprite.Group()
+        self.ufos = pygame.sprite.Group()
+        self.explosions = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+
+        # opcjonalny backend NumPy – ruch asteroid, pocisków i power-upów liczony wektorowo
+        self.store = (EntityStore(width=SCREEN_WIDTH, height=SCREEN_HEIGHT)
+                      if use_store and HAS_NUMPY else None)
+        if self.store is not None and PARALLEL_WORKERS > 1:
+            self.store.parallel = parallel.shared(PARALLEL_WORKERS)   # krok liczony w porcjach
+        # pule obiektów – `Klasa.spawn()` sięga po zwolnione egzemplarze
+        self.pools = {}
+        if use_pools:
+            self.pools = {
+                "shots": Pool(Shot, SHOT_POOL_SIZE),
+                "asteroids": Pool(Asteroid, ASTEROID_POOL_SIZE),
+                "explosions": Pool(Explosion, EXPLOSION_POOL_SIZE),
+            }
+        self.fired: list = []    # pociski wystrzelone w bieżącym kroku (`Shot.fired`)
+        self.events = EventQueue(sim.clock)     # spawny i efekty w czasie gry
+        self._bind()
+
+        self.asteroid_field = AsteroidField()
+        self.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, self.asteroid_field,
+                             controls=controls)
+        self.score = Score()
+        # broadphase pocisków, przebudowywana co klatkę
+        self.shot_grid = SpatialHash(COLLISION_CELL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
+                                     ASTEROID_MAX_RADIUS)
+        self.entity_renderer = EntityRenderer({Asteroid: asteroid_skin, Shot: shot_skin},
+                                              ROTATION_STEP)
+        self._previous: list = []     # pozycje sprzed ostatniego kroku (`snapshot`)
+
+        self._schedule_spawns()
+
+    def _bind(self) -> None:
+        # === Containers binding ===
+        # Każda klasa sprite otrzymuje referencję do grup, do których ma się dodać.
+        # asteroidy i pociski to lekkie encje – rysuje je `EntityRenderer`, nie `drawable`
+        Shot.containers = (self.shots, self.updatable)
+        Asteroid.containers = (self.asteroids, self.updatable)
+        AsteroidField.events = Player.events = self.events
+        UFO.containers = (self.ufos, self.updatable, self.drawable)
+        PowerUp.containers = (self.powerups, self.updatable, self.drawable)
+        Player.containers = (self.drawable, self.updatable)
+        Asteroid.store = Shot.store = PowerUp.store = self.store
+        Shot.pool = self.pools.get("shots")
+        Shot.fired = self.fired
+        Asteroid.pool = self.pools.get("asteroids")
+        Explosion.pool = self.pools.get("explosions")
+
+    def reset(self, controls=None) -> None:
+        """Rozpoczyna nową rozgrywkę w tym samym obiekcie.
+
+        Grupy, pule, magazyn encji, gracz i grafiki są używane ponownie -
+        restart nie alokuje nowego stanu gry. Kolejność losowań `sim.rng`
+        jest taka sama jak przy tworzeniu nowego obiektu `Game`.
+        """
+        self._bind()
+        self.events.clear()
+        for group in (self.asteroids, self.shots, self.ufos, self.powerups, self.explosions):
+            for obj in group:
+                obj.kill()
+        for pool in self.pools.values():
+            pool.recycle()
+
+        self.asteroid_field.reset()
+        self.player.reset(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        if controls is not None:
+            self.player.controls = controls
+        self.score.reset()
+        self.game_over = False
+        self._previous = []
+        self.fired.clear()
+
+        self._schedule_spawns()
+
+    def end(self) -> None:
+        """Domyślna reakcja na koniec gry – zatrzymanie rozgrywki."""
+        self.game_over = True
+
+    # -------------- spawny --------------
+    def _schedule_spawns(self) -> None:
+        # pierwsze spawny UFO i power-upów; kolejne planuje samo zdarzenie,
+        # licząc od swojego czasu (odstępy nie rosną o resztę klatki)
+        now = sim.clock.now()
+        self.events.at(now + POWERUP_SPAWN_INTERVAL, self._powerup_event, now + POWERUP_SPAWN_INTERVAL)
+        due = now + rng.uniform(UFO_MIN_SPAWN_TIME, UFO_MAX_SPAWN_TIME)
+        self.events.at(due, self._ufo_event, due)
+
+    def _powerup_event(self, due: float) -> None:
+        # power-upy pojawiają się co POWERUP_SPAWN_INTERVAL sekund czasu gry
+        due += POWERUP_SPAWN_INTERVAL
+        self.events.at(due, self._powerup_event, due)
+        self.spawn_random_powerup()
+
+    def _ufo_event(self, due: float) -> None:
+        self.spawn_ufo()
+        due += rng.uniform(UFO_MIN_SPAWN_TIME, UFO_MAX_SPAWN_TIME)
+        self.events.at(due, self._ufo_event, due)
+
+    def spawn_random_powerup(self):
+        """Tworzy losowy *power-up* na krawędzi ekranu."""
+        pos  = random_outside_position()     # punkt startu poza ekranem
+        vel  = random_velocity(50, 120)      # prędkość w zakresie 50-120 px/s
+        kind = weighted_choice(POWERUP_RARITY)     # wybór typu wg prawdopodobieństw
+        PowerUp(pos, vel, kind)              # sprite sam dodaje się do grup
+
+    def spawn_ufo(self):
+        direction = rng.choice([-1, 1])
+        y = rng.uniform(50, SCREEN_HEIGHT - 50)
+        if direction == 1:
+            x = -UFO_RADIUS
+            velocity = pygame.Vector2(UFO_SPEED, 0)
+        else:
+            x = SCREEN_WIDTH + UFO_RADIUS
+            velocity = pygame.Vector2(-UFO_SPEED, 0)
+        ufo = UFO(x, y)
+        ufo.velocity = velocity
+
+    # ----------------------------------------------
+    def step(self, dt: float) -> None:
+        """Pełna klatka logiki (bez rysowania)."""
+        with profiler.scope("update"):
+            self.update(dt)
+        with profiler.scope("collision"):
+            self.collide(dt)
+        with profiler.scope("explosions"):
+            self.explosions.update(dt)
+            cap = quality.max_explosions    # limit przy obniżonej jakości (`governor.py`)
+            if cap and len(self.explosions) > cap:
+                for explosion in self.explosions.sprites()[:len(self.explosions) - cap]:
+                    explosion.kill()        # najstarsze wybuchy
+
+    def update(self, dt: float) -> None:
+        sim.clock.advance(dt)     # czas gry – buffy, dryf UFO itp.
+
+        # obiekty zniszczone w poprzedniej klatce wracają do pul
+        for pool in self.pools.values():
+            pool.recycle()
+
+        # spawny, których czas już minął (zwykle żaden – jedno porównanie)
+        self.events.run()
+
+        # aktualizacja wszystkich obiektów; pociski wystrzelone w trakcie
+        # kroku stoją jeszcze w miejscu wystrzału (ważne dla testu ciągłego)
+        self.fired.clear()
+        if self.store is not None:
+            for shot in self.store.step(dt):   # pociski, które opuściły ekran
+                shot.kill()
+        for obj in self.updatable:
+            obj.update(dt)
+
+    def collide(self, dt: float = 0.0) -> None:
+        """Testy kolizji po kroku *dt*; pociski sprawdzane są na całym przebytym odcinku."""
+        player, score = self.player, self.score
+        asteroids, explosions = self.asteroids, self.explosions
+
+        # 1) gracz vs asteroidy
+        with profiler.scope("collision.player_asteroids"):
+            for asteroid in asteroids:
+                if asteroid.collides_with(player):
+                    if player.invulnerability_timer <= 0:
+                        explosions.add(Explosion.spawn(player.position))
+                    player.handle_collision(self.screen, score, self.exit_screen,
+                                            self.restart_game, asteroids, explosions)
+                    break   # przerwij dalsze sprawdzanie – gracz traci życie
+
+        # 2) gracz vs UFO
+        with profiler.scope("collision.player_ufos"):
+            for ufo in self.ufos:
+                if ufo.collides_with(player):
+                    if player.invulnerability_timer <= 0:
+                        explosions.add(Explosion.spawn(player.position))
+                    player.handle_collision(self.screen, score, self.exit_screen,
+                                            self.restart_game, asteroids, explosions)
+                    ufo.kill()
+                    break
+
+        # pociski trafiają do siatki raz na klatkę (prostokąty przebytych odcinków)
+        shots, fresh = self.shots.sprites(), set(self.fired)
+        spans = None
+        with profiler.scope("collision.broadphase"):
+            if self.store is not None:
+                # przydział do komórek liczony wektorowo (i w porcjach, jeśli włączone);
+                # asteroidy łączą się z pociskami po komórkach w `store.swept_hits`,
+                # siatka słowników potrzebna jest tylko dla UFO (spoza magazynu)
+                sweep = [0.0 if shot in fresh else dt for shot in shots]
+                spans = self.store.cell_spans([shot._slot for shot in shots], sweep, self.shot_grid)
+                if self.ufos:
+                    self.shot_grid.rebuild_spans(shots, *spans)
+            else:
+                self.shot_grid.rebuild(shots, dt, fresh)
+
+        # 3) + 4) pociski vs asteroidy i UFO - trafienia obu grup rozstrzygane
+        # razem, w kolejności chwil zderzenia: pocisk niszczy najwyżej jeden cel
+        with profiler.scope("collision.shots"):
+            if self.store is not None:
+                hits = self.store.swept_hits(asteroids, shots, self.shot_grid, dt, fresh, spans)
+            else:
+                hits = swept_hits(asteroids, shots, self.shot_grid, dt, fresh)
+            ufo_hits = swept_hits(self.ufos, shots, self.shot_grid, dt, fresh) if self.ufos else []
+            if ufo_hits:
+                hits += ufo_hits
+                hits.sort(key=itemgetter(0))    # stabilnie – asteroidy przed UFO
+            for target, shot in first_hits(hits):
+                explosions.add(Explosion.spawn(target.position))
+                shot.kill()
+                if isinstance(target, UFO):
+                    target.kill()
+                    if rng.random() < 0.5:      # 50 % szans na drop powerupa
+                        PowerUp(target.position.copy(), random_velocity(80, 120),
+                                weighted_choice(POWERUP_RARITY))
+                else:
+                    target.split()
+                score.add_points(target.get_points())
+
+        # 5) zbieranie power‑upów przez gracza
+        with profiler.scope("collision.powerups"):
+            for pu in pygame.sprite.spritecollide(player, self.powerups, dokill=True):
+                player.apply_powerup(pu.kind)
+                audio.play_sfx("powerup")
+
+    def groups(self) -> dict:
+        """Grupy sprite'ów według nazw – liczniki obiektów dla profilera."""
+        return {
+            "asteroids": self.asteroids,
+            "shots": self.shots,
+            "ufos": self.ufos,
+            "powerups": self.powerups,
+            "explosions": self.explosions,
+        }
+
+    # -------------- interpolacja rysowania --------------
+    def snapshot(self) -> None:
+        """Zapamiętuje pozycje ruchomych obiektów przed ostatnim krokiem symulacji klatki."""
+        self._previous = [(obj, obj.position.x, obj.position.y)
+                          for group in (self.asteroids, self.shots, self.ufos, self.powerups)
+                          for obj in group]
+        self._previous.append((self.player, self.player.position.x, self.player.position.y))
+
+    def _interpolate(self, alpha: float) -> list:
+        # Przesuwa obiekty do pozycji między poprzednim a bieżącym krokiem
+        # symulacji; zwraca dane do przywrócenia stanu (`_restore`).
+        saved = []
+        for obj, x0, y0 in self._previous:
+            if not obj.alive():
+                continue
+            current = obj.position
+            dx, dy = current.x - x0, current.y - y0
+            if abs(dx) > INTERPOLATION_MAX_JUMP or abs(dy) > INTERPOLATION_MAX_JUMP:
+                continue        # zawinięcie przez krawędź lub obiekt ponownie użyty z puli
+            rect = getattr(obj, "rect", None)    # Rect o zerowym rozmiarze też jest fałszywy
+            saved.append((obj, current, rect.center if rect is not None else None))
+            position = pygame.Vector2(x0 + dx * alpha, y0 + dy * alpha)
+            obj.position = position
+            if rect is not None:
+                rect.center = position
+        return saved
+
+    @staticmethod
+    def _restore(saved: list) -> None:
+        for obj, position, center in saved:
+            obj.position = position
+            if center is not None:
+                obj.rect.center = center
+
+    def draw(self, screen: pygame.Surface, fps: float, clear: bool = True,
+             alpha: float = 1.0) -> None:
+        """Rysuje klatkę; `clear=False` pomija tło (odtwarza je `DirtyRenderer`).
+
+        *alpha* (0–1) - położenie chwili wyświetlenia między poprzednim a bieżącym
+        krokiem symulacji (`snapshot`); przy 1 obiekty rysowane są w bieżącej pozycji."""
+        saved = self._interpolate(alpha) if alpha < 1.0 and self._previous else None
+        try:
+            with profiler.scope("draw"):
+                if clear:
+                    screen.blit(self.background, (0, 0))
+
+                self.entity_renderer.frame += 1
+                self.entity_renderer.draw(screen, self.asteroids)
+                self.entity_renderer.draw(screen, self.shots)
+                for obj in self.drawable:
+                    obj.draw(screen)
+
+                self.score.draw(screen)
+                self.player.draw_lives(screen, fps)
+
+                self.explosions.draw(screen)
+        finally:
+            # pozycje (w trybie `EntityStore` – tablice magazynu) wracają do stanu symulacji
+            if saved:
+                self._restore(saved)
+        profiler.draw(screen)
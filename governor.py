@@ -0,0 +1,132 @@
+"""
+governor.py
+
+Adaptacyjna jakość - strażnik budżetu klatki.
+
+Przy skokach liczby obiektów (fala Threat, seria Bullet Nova, dziesiątki
+wybuchów) czas pracy klatki przekracza budżet 60 FPS: `clock.tick(60)`
+nie nadąża, a `dt` kolejnych klatek rośnie. `FrameGovernor` obserwuje
+czasy faz pętli (logika, rysowanie) uśrednione w oknie `GOVERNOR_WINDOW`
+klatek i stopniowo obniża jakość efektów, które nie wpływają na przebieg
+rozgrywki:
+
+    poziom 1 - animacja wybuchów co drugą klatkę (krótsze wybuchy),
+    poziom 2 - limit jednocześnie widocznych wybuchów,
+    poziom 3 - płomień silnika bez animacji,
+    poziom 4 - sprite'y przy krawędziach (w strefie zawijania) rysowane
+               co drugą klatkę.
+
+Gdy średnia praca przekroczy `GOVERNOR_DEGRADE` budżetu, poziom rośnie
+o jeden; gdy spadnie poniżej `GOVERNOR_RESTORE` - maleje o jeden. Różne
+progi i uśrednianie w oknie zapobiegają przełączaniu w każdej klatce.
+Każda zmiana poziomu jest wypisywana i zapamiętywana w `changes`.
+
+Bieżące ustawienia trzyma wspólny obiekt `quality` - czytany przez
+`Explosion`, `Player`, `Game` i `EntityRenderer`. Domyślnie (poziom 0,
+np. w trybie headless) wszystkie efekty działają w pełnej jakości.
+Progi pochodzą z `constants.py`, więc można je zmieniać przez `config`.
+"""
+
+from constants import *
+
+
+class Quality:
+    """Ustawienia jakości efektów odczytywane przez kod animacji i rysowania."""
+
+    DEFAULTS = {
+        "explosion_step": 1,        # o ile klatek animacji przesuwa się wybuch
+        "max_explosions": 0,        # limit żywych wybuchów (0 – bez limitu)
+        "flame_animation": True,    # animacja płomienia silnika
+        "edge_interval": 1,         # co ile klatek rysowane są sprite'y przy krawędziach
+    }
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        for name, value in self.DEFAULTS.items():
+            setattr(self, name, value)
+
+
+# Kolejne poziomy obniżania jakości; ustawienia poziomu obejmują wszystkie poprzednie.
+LEVELS = (
+    ("pełna jakość", lambda: {}),
+    ("pomijanie klatek wybuchów", lambda: {"explosion_step": 2}),
+    ("limit wybuchów", lambda: {"max_explosions": GOVERNOR_EXPLOSION_CAP}),
+    ("płomień bez animacji", lambda: {"flame_animation": False}),
+    ("rzadsze rysowanie przy krawędziach", lambda: {"edge_interval": 2}),
+)
+
+
+class FrameGovernor:
+    """Dobiera poziom jakości do czasu pracy klatki.
+
+    Parametry
+    ---------
+    settings : Quality
+        Modyfikowane ustawienia (domyślnie wspólny obiekt `quality`).
+    verbose : bool
+        Czy wypisywać zmiany poziomu na standardowe wyjście.
+    """
+
+    def __init__(self, settings: Quality | None = None, verbose: bool = True):
+        self.quality = settings if settings is not None else quality
+        self.verbose = verbose
+        self.level = 0
+        self.frames = 0
+        self.changes: list[dict] = []       # dziennik zmian poziomu
+        self._sums: dict[str, float] = {}
+        self._count = 0
+
+    def frame(self, **phases: float) -> None:
+        """Przyjmuje czasy faz zakończonej klatki [ms], np. `frame(update=4.1, draw=6.3)`."""
+        self.frames += 1
+        sums = self._sums
+        for name, ms in phases.items():
+            sums[name] = sums.get(name, 0.0) + ms
+        self._count += 1
+        if self._count >= GOVERNOR_WINDOW:
+            self._decide()
+
+    def _decide(self) -> None:
+        count = self._count
+        averages = {name: total / count for name, total in self._sums.items()}
+        self._sums = {}
+        self._count = 0
+        work = sum(averages.values())
+        if work > GOVERNOR_BUDGET_MS * GOVERNOR_DEGRADE and self.level < len(LEVELS) - 1:
+            self.set_level(self.level + 1, work, averages)
+        elif work < GOVERNOR_BUDGET_MS * GOVERNOR_RESTORE and self.level > 0:
+            self.set_level(self.level - 1, work, averages)
+
+    def set_level(self, level: int, work: float | None = None, averages: dict | None = None) -> None:
+        """Ustawia poziom jakości (z wpisem w dzienniku zmian)."""
+        if level == self.level:
+            return
+        self.level = level
+        self.quality.reset()
+        for _, settings in LEVELS[1:level + 1]:
+            for name, value in settings().items():
+                setattr(self.quality, name, value)
+
+        entry = {"frame": self.frames, "level": level, "name": LEVELS[level][0]}
+        if work is not None:
+            entry["work_ms"] = round(work, 2)
+            entry["phases_ms"] = {name: round(ms, 2) for name, ms in averages.items()}
+        self.changes.append(entry)
+        if self.verbose:
+            detail = ""
+            if work is not None:
+                phases = ", ".join(f"{name} {ms:.1f}" for name, ms in averages.items())
+                detail = f" – praca {work:.1f} ms / budżet {GOVERNOR_BUDGET_MS} ms ({phases})"
+            print(f"governor: poziom {level}/{len(LEVELS) - 1} ({LEVELS[level][0]}){detail}")
+
+    def reset(self) -> None:
+        """Pełna jakość i puste okno pomiaru (np. przy nowej grze)."""
+        self.set_level(0)
+        self._sums = {}
+        self._count = 0
+
+
+# Wspólne ustawienia jakości czytane przez moduły gry.
+quality = Quality()
@@ -0,0 +1,155 @@
+"""
+headless.py
+
+Tryb bez okna i dźwięku: symulacja gry ze stałym krokiem czasu.
+
+Uruchamia tę samą logikę co `main.py` (`game.Game` - pole asteroid,
+gracz, kolizje, punktacja), ale:
+
+• korzysta z "pustych" sterowników SDL (`dummy`) - nie potrzebuje ekranu
+  ani karty dźwiękowej, więc działa na serwerach CI,
+• nie czeka na `clock.tick(60)` - każda klatka przesuwa czas o stałe `dt`,
+  a pętla wykonuje się tak szybko, jak pozwala procesor,
+• statkiem steruje obiekt z `inputs.py` (domyślnie `RandomInput`),
+• ziarno losowania (`--seed`) ustala przebieg rozgrywki.
+
+Przykład::
+
+    python headless.py --seed 7 --minutes 30 --restart
+"""
+
+import os
+
+# sterowniki muszą zostać wybrane przed inicjalizacją SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sim
+import time
+import pygame
+from config import config
+from constants import *
+from game import Game, preload_assets
+from inputs import RandomInput, ScriptedInput
+from replay import Recorder
+from profiler import profiler
+
+FIXED_DT = 1 / 60   # s – krok symulacji (jak przy 60 FPS)
+startup: dict = {}  # statystyki wczytywania zasobów (`loader.AssetLoader`)
+
+
+def init_display() -> pygame.Surface:
+    """Inicjalizuje Pygame i zwraca (niewidoczną) powierzchnię ekranu."""
+    screen = pygame.display.get_surface()
+    if screen is None:
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        startup.update(preload_assets())
+    return screen
+
+
+def run(seed: int = 0, frames: int = 3600, dt: float = FIXED_DT, controls=None,
+        render: bool = False, restart: bool = False, record: str | None = None,
+        trace: str | None = None) -> dict:
+    """Symuluje do *frames* klatek i zwraca podsumowanie przebiegu.
+
+    Parametry
+    ---------
+    seed : int
+        Ziarno generatora `sim.rng` oraz domyślnego `RandomInput`.
+    frames : int
+        Maksymalna liczba klatek symulacji.
+    dt : float
+        Stały krok czasu jednej klatki [s].
+    controls : obiekt z metodą `poll()`, opcjonalny
+        Źródło sterowania; domyślnie `RandomInput(seed)`.
+    render : bool
+        Czy rysować klatki (na niewidoczny ekran) – np. do pomiarów.
+    restart : bool
+        Po utracie wszystkich żyć rozpoczyna nową grę zamiast kończyć.
+    record : str, opcjonalny
+        Ścieżka pliku, do którego zostanie zapisane nagranie (`replay.py`).
+    trace : str, opcjonalny
+        Ścieżka pliku śladu profilera (Chrome Trace / Perfetto).
+    """
+    screen = init_display()
+    sim.reset(seed)
+    if controls is None:
+        controls = RandomInput(seed)
+    if trace:
+        profiler.start_trace()
+    recorder = None
+    if record:
+        recorder = Recorder(record, seed, controls, dt=dt)
+        controls = recorder.controls
+
+    game = Game(screen, controls=controls)
+    scores = []
+    frame = 0
+    start = time.perf_counter()
+    while frame < frames:
+        game.step(dt)
+        if recorder is not None:
+            recorder.frame(dt, game)
+        if render:
+            game.draw(screen, 0)
+        profiler.end_frame(game.groups())
+        frame += 1
+        if game.game_over:
+            scores.append(game.score.get_score())
+            if not restart:
+                break
+            game.reset()    # te same grupy, pule i grafiki – bez nowych alokacji
+    wall = time.perf_counter() - start
+    if recorder is not None:
+        recorder.close()
+    if trace:
+        profiler.export_trace(trace)
+    if not game.game_over:
+        scores.append(game.score.get_score())
+
+    sim_seconds = frame * dt
+    return {
+        "seed": seed,
+        "frames": frame,
+        "sim_seconds": round(sim_seconds, 3),
+        "wall_seconds": round(wall, 3),
+        "speedup": round(sim_seconds / wall, 1) if wall else None,
+        "games": len(scores),
+        "scores": scores,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Asteroids – symulacja bez okna ze stałym krokiem czasu")
+    parser.add_argument("--seed", type=int, default=0, help="ziarno losowania (domyślnie 0)")
+    parser.add_argument("--minutes", type=float, help="czas symulacji w minutach gry")
+    parser.add_argument("--frames", type=int, default=3600, help="liczba klatek (gdy brak --minutes)")
+    parser.add_argument("--dt", type=float, default=FIXED_DT, help="krok czasu klatki [s]")
+    parser.add_argument("--input", choices=("random", "idle"), default="random",
+                        help="źródło sterowania statkiem")
+    parser.add_argument("--render", action="store_true", help="rysuj klatki (niewidoczny ekran)")
+    parser.add_argument("--restart", action="store_true", help="nowa gra po utracie żyć")
+    parser.add_argument("--record", metavar="PATH", help="zapisz nagranie rozgrywki (patrz replay.py)")
+    parser.add_argument("--trace", metavar="PATH", help="zapisz ślad profilera (Chrome Trace / Perfetto)")
+    config.add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        config.from_args(args)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    frames = args.frames
+    if args.minutes is not None:
+        frames = int(args.minutes * 60 / args.dt)
+    controls = RandomInput(args.seed) if args.input == "random" else ScriptedInput(())
+
+    result = run(args.seed, frames, args.dt, controls, render=args.render,
+                 restart=args.restart, record=args.record, trace=args.trace)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+inputs.py
+
+Źródła sterowania statkiem gracza.
+
+`Player.update` nie czyta już klawiatury bezpośrednio - pyta obiekt
+sterujący (`controls.poll()`) o stan pięciu akcji zebranych w krotce
+`Controls`. Dzięki temu tę samą logikę gry można prowadzić:
+
+• `KeyboardInput`  - klawiszami (W/S/A/D/SPACJA), jak dotychczas,
+• `ScriptedInput`  - z gotowej listy stanów (np. z nagrania lub testu),
+• `RandomInput`    - losowo, z własnym ziarnem (testy obciążeniowe),
+• `AimInput`       - prostym botem celującym w najbliższą asteroidę
+                     (przebiegi balansu w `sweep.py`).
+
+Stan sterowania można zakodować na jednym bajcie (`to_bits` / `from_bits`).
+"""
+
+import random
+from typing import NamedTuple
+import pygame
+
+
+class Controls(NamedTuple):
+    thrust: bool = False    # W – ciąg do przodu
+    reverse: bool = False   # S – ciąg wsteczny
+    left: bool = False      # A – obrót w lewo
+    right: bool = False     # D – obrót w prawo
+    fire: bool = False      # SPACJA – strzał
+
+    def to_bits(self) -> int:
+        """Koduje stan akcji jako maskę bitową (bit 0 = thrust … bit 4 = fire)."""
+        bits = 0
+        for i, pressed in enumerate(self):
+            if pressed:
+                bits |= 1 << i
+        return bits
+
+    @classmethod
+    def from_bits(cls, bits: int) -> "Controls":
+        return cls(*(bool(bits >> i & 1) for i in range(len(cls._fields))))
+
+
+IDLE = Controls()
+
+
+class KeyboardInput:
+    """Sterowanie z klawiatury – odczyt `pygame.key.get_pressed()`."""
+
+    def poll(self) -> Controls:
+        keys = pygame.key.get_pressed()
+        return Controls(keys[pygame.K_w], keys[pygame.K_s],
+                        keys[pygame.K_a], keys[pygame.K_d], keys[pygame.K_SPACE])
+
+
+class ScriptedInput:
+    """Odtwarza zadaną sekwencję stanów – po jej końcu zwraca `IDLE`.
+
+    Elementami *frames* mogą być krotki `Controls` lub maski bitowe.
+    """
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def poll(self) -> Controls:
+        frame = next(self._frames, IDLE)
+        return Controls.from_bits(frame) if isinstance(frame, int) else frame
+
+
+class RandomInput:
+    """Losowe sterowanie: co kilka-kilkanaście klatek wybiera nowy zestaw akcji.
+
+    Parametry
+    ---------
+    seed : int | None
+        Ziarno prywatnego generatora (niezależnego od reszty gry).
+    hold : tuple[int, int]
+        Przedział liczby klatek, przez które trzymany jest wybrany stan.
+    """
+
+    def __init__(self, seed: int | None = None, hold: tuple[int, int] = (5, 40)):
+        self._rng = random.Random(seed)
+        self._hold = hold
+        self._left = 0
+        self._state = IDLE
+
+    def poll(self) -> Controls:
+        if self._left <= 0:
+            rng = self._rng
+            self._left = rng.randint(*self._hold)
+            self._state = Controls(
+                thrust=rng.random() < 0.5,
+                reverse=rng.random() < 0.1,
+                left=rng.random() < 0.3,
+                right=rng.random() < 0.3,
+                fire=rng.random() < 0.7,
+            )
+        self._left -= 1
+        return self._state
+
+
+class AimInput:
+    """Prosty bot: obraca statek ku najbliższej asteroidzie i strzela, gdy ją
+    ma na linii; gdy asteroida podejdzie za blisko - cofa się.
+
+    Bot czyta wyłącznie stan gry, więc przebieg zależy tylko od ziarna
+    symulacji. Grę wskazuje atrybut `game`, ustawiany po jej utworzeniu.
+
+    Parametry
+    ---------
+    game : game.Game, opcjonalny
+        Sterowana rozgrywka; bez niej bot stoi w miejscu.
+    tolerance : float
+        Odchyłka kąta [°], przy której bot przestaje obracać statek i strzela.
+    danger : float
+        Odległość [px] od asteroidy, poniżej której bot włącza ciąg wsteczny.
+    """
+
+    def __init__(self, game=None, tolerance: float = 8.0, danger: float = 160.0):
+        self.game = game
+        self.tolerance = tolerance
+        self.danger = danger
+
+    def poll(self) -> Controls:
+        game = self.game
+        if game is None:
+            return IDLE
+        pos = game.player.position
+        target = min(game.asteroids, default=None,
+                     key=lambda a: pos.distance_squared_to(a.position))
+        if target is None:
+            return IDLE
+        offset = target.position - pos
+        # kąt 0 = „w górę”, jak `Player.rotation`
+        diff = (pygame.Vector2(0, -1).angle_to(offset) - game.player.rotation + 180) % 360 - 180
+        tol = self.tolerance
+        return Controls(reverse=offset.length() < self.danger,
+                        left=diff < -tol, right=diff > tol, fire=abs(diff) <= 2 * tol)
@@ -0,0 +1,138 @@
+"""
+loader.py
+
+Równoległe wczytywanie zasobów gry przy starcie.
+
+`AssetLoader` przechodzi manifest - grafiki (`assets.IMAGES`,
+`assets.OPAQUE_IMAGES`), efekty dźwiękowe (`audio.SFX_FILES`) i fonty
+używane przez HUD i ekrany - i zleca dekodowanie plików pulą wątków.
+Wątki robocze tylko czytają i dekodują pliki; konwersja formatu
+powierzchni, wpis do bufora `assets` i tworzenie fontów odbywają się
+na wątku głównym w `poll()`, wywoływanym co klatkę przez ekran
+startowy. Dzięki temu ekran tytułowy pojawia się od razu, a ładowanie
+trwa w tle.
+
+Po `wait()` wszystkie zasoby są w pamięci - pierwsza klatka rozgrywki
+nie sięga na dysk. Jeśli istnieje aktualny atlas (`build_atlas.py`), zamiast
+pojedynczych grafik wczytywany jest tylko on. Loader mierzy dwa czasy liczone od `started`:
+
+• first_frame_ms - do pierwszej wyświetlonej klatki (`mark_first_frame`),
+• playable_ms    - do wczytania całego manifestu.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+import assets
+import audio
+import text
+
+FONT_SIZES = (22, 30, 36, 50, 80, 100, 120)     # profiler, HUD, ekrany
+
+
+class AssetLoader:
+    """Wczytuje manifest zasobów w tle.
+
+    Parametry
+    ---------
+    workers : int
+        Liczba wątków dekodujących pliki.
+    started : float, opcjonalny
+        Chwila startu programu (`time.perf_counter()`) – punkt odniesienia
+        raportowanych czasów; domyślnie moment utworzenia loadera.
+    """
+
+    def __init__(self, workers: int = 4, started: float | None = None):
+        self.workers = workers
+        self.started = time.perf_counter() if started is None else started
+        self._pending: list = []     # (rodzaj, nazwa, flagi lub indeks atlasu, future)
+        self._fonts = list(FONT_SIZES)
+        self.total = 0
+        self.loaded = 0
+        self.atlas = False
+        self.first_frame_ms = None
+        self.playable_ms = None
+
+    # ------------------------------------------------------------
+    def start(self) -> None:
+        """Zleca wczytanie całego manifestu (nie blokuje)."""
+        audio.init()        # dekodowanie dźwięków wymaga działającego miksera
+        # tło ekranu startowego wczytujemy od razu - przed uruchomieniem wątków,
+        # żeby pierwsza klatka nie czekała na nie w kolejce ani nie dzieliła z nimi CPU
+        for path in assets.OPAQUE_IMAGES:
+            assets.image(path, flags=0)
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        index = assets.atlas_index()
+        if index is not None:
+            # aktualny atlas (`build_atlas.py`) – jeden plik zamiast całego manifestu grafik
+            jobs = [("atlas", assets.ATLAS_IMAGE, index, pool.submit(pygame.image.load, assets.ATLAS_IMAGE))]
+        else:
+            jobs = [("image", path, assets.ALPHA, pool.submit(pygame.image.load, path))
+                    for path in assets.IMAGES]
+        self.atlas = index is not None
+        jobs += [("sound", name, 0, pool.submit(audio.load_sfx, name))
+                 for name in audio.SFX_FILES]
+        pool.shutdown(wait=False)    # zadania dokończą się w tle
+        self._pending = jobs
+        self.total = len(jobs) + len(assets.OPAQUE_IMAGES) + len(self._fonts)
+        self.loaded = len(assets.OPAQUE_IMAGES)
+
+    def _finish(self, kind: str, name: str, arg, result) -> None:
+        if kind == "atlas":
+            assets.cache.load_atlas(result, arg)
+        elif kind == "image":
+            assets.store(name, result, arg)
+        else:
+            audio.SFX[name] = result
+        self.loaded += 1
+
+    def poll(self) -> bool:
+        """Przyjmuje gotowe zasoby (wątek główny); zwraca True, gdy wszystko wczytane."""
+        pending = []
+        for job in self._pending:
+            if job[3].done():
+                self._finish(*job[:3], job[3].result())
+            else:
+                pending.append(job)
+        self._pending = pending
+        if self._fonts:
+            # font na klatkę – ekran startowy pozostaje płynny
+            text.font(self._fonts.pop())
+            self.loaded += 1
+        return self._check_done()
+
+    def wait(self) -> None:
+        """Blokuje do wczytania wszystkich zasobów."""
+        for kind, name, arg, future in self._pending:
+            self._finish(kind, name, arg, future.result())
+        self._pending = []
+        while self._fonts:
+            text.font(self._fonts.pop())
+            self.loaded += 1
+        self._check_done()
+
+    def run(self) -> dict:
+        """Wczytuje cały manifest (start + wait) i zwraca statystyki."""
+        self.start()
+        self.wait()
+        return self.stats()
+
+    def _check_done(self) -> bool:
+        done = not self._pending and not self._fonts
+        if done and self.playable_ms is None:
+            self.playable_ms = round((time.perf_counter() - self.started) * 1000, 1)
+        return done
+
+    # ------------------------------------------------------------
+    @property
+    def progress(self) -> float:
+        return self.loaded / self.total if self.total else 1.0
+
+    def mark_first_frame(self) -> None:
+        """Zapisuje czas pierwszej wyświetlonej klatki (tylko za pierwszym razem)."""
+        if self.first_frame_ms is None:
+            self.first_frame_ms = round((time.perf_counter() - self.started) * 1000, 1)
+
+    def stats(self) -> dict:
+        return {"assets": self.total, "atlas": self.atlas, "first_frame_ms": self.first_frame_ms,
+                "playable_ms": self.playable_ms}
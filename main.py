@@ -9,7 +9,14 @@ kolejno
 (2) aktualizuje stan logiczny gry i 
 (3) renderuje klatkę na ekranie. 
 
-Po zamknięciu okna proces się kończy.
+Stan samej rozgrywki i logika pojedynczej klatki znajdują się w `game.py`;
+ten sam kod wykorzystuje tryb bez okna (`headless.py`).
+
+Przejścia między ekranami obsługuje `Session` - prosta maszyna stanów
+(ekran startowy → rozgrywka → koniec gry → ekran startowy…). Restart
+nie wywołuje ponownie `main()`: okno, wczytane zasoby, grupy sprite'ów
+i pule obiektów pozostają te same, a rozgrywka jest zerowana w miejscu
+(`Game.reset`). Po zamknięciu okna proces się kończy.
 
 Plik ten nie implementuje zachowań poszczególnych bytów - za to
 odpowiadają wyspecjalizowane moduły (`player.py`, `asteroid.py`, itd.).
@@ -17,185 +24,237 @@ Z tego względu kod pozostaje przejrzysty i łatwo zorientować się,
 co dzieje się w danym momencie cyklu.
 """
 
+import argparse
+import time
 import pygame
 import audio
-import random
+import sim
+from config import config
 from constants import *
-from player import Player
-from asteroid import Asteroid
-from asteroidfield import AsteroidField
-from shots import Shot
-from score import Score
+from game import Game
+from governor import FrameGovernor
+from inputs import KeyboardInput
+from loader import AssetLoader
+from profiler import profiler
+from renderer import DirtyRenderer
+from replay import Recorder
 from screens import exit_screen, start_screen, pause_screen
-from utils import Explosion, random_outside_position, random_velocity
-from ufo import UFO
-from powerups import PowerUp
+
+# -------------- stany sesji --------------
+START     = "start"         # ekran tytułowy
+PLAYING   = "playing"       # rozgrywka
+GAME_OVER = "game_over"     # ekran końcowy (R – restart, Q – wyjście)
+
+
+class Session:
+    """Sesja gry w jednym oknie - pętla po stanach zamiast rekurencji.
+
+    Parametry
+    ---------
+    screen : pygame.Surface
+        Ekran gry (utworzony raz na całą sesję).
+    record : str, opcjonalny
+        Ścieżka nagrania pierwszej rozgrywki (`replay.py`).
+    trace : str, opcjonalny
+        Ścieżka śladu profilera zapisywanego przy zamknięciu okna.
+    dirty : bool
+        Odświeżanie tylko zmienionych fragmentów ekranu (`DirtyRenderer`).
+    loader : AssetLoader, opcjonalny
+        Wczytywanie zasobów w tle, dokończone na pierwszym ekranie startowym.
+    watch : bool
+        Przeładowywanie pliku konfiguracji w trakcie gry (`config.poll`).
+    """
+
+    def __init__(self, screen: pygame.Surface, record: str | None = None,
+                 trace: str | None = None, dirty: bool = DIRTY_RECTS,
+                 loader: AssetLoader | None = None, watch: bool = False):
+        self.screen = screen
+        self.watch = watch
+        # adaptacyjna jakość efektów przy przekroczeniu budżetu klatki
+        self.governor = FrameGovernor() if GOVERNOR else None
+        self.loader = loader
+        self.record = record
+        self.trace = trace
+        self.dirty = dirty
+        self.clock = pygame.time.Clock()
+        self.keyboard = KeyboardInput()
+        self.recorder = None
+        self.game = None
+        self.renderer = None
+        self.games = 0
+        self._states = {START: self.start, PLAYING: self.play, GAME_OVER: self.game_over}
+
+    def run(self) -> None:
+        """Przechodzi między stanami aż do zamknięcia okna."""
+        state = START
+        try:
+            while state is not None:
+                state = self._states[state]()
+        finally:
+            self.close()    # także po wyjątku – ślad, nagranie i wątek muzyki
+
+    # ----------------------------------------------
+    def start(self) -> str | None:
+        """Ekran tytułowy, a po nim nowa rozgrywka."""
+        audio.intro()         #  <<< startowa muzyczka
+        if not start_screen(self.screen, self.loader):
+            return None         # okno zamknięte na ekranie tytułowym
+        if self.loader is not None:
+            self.loader.wait()     # np. gdy ekran startowy nie odpytywał loadera
+            stats = self.loader.stats()
+            print(f"start: pierwsza klatka {stats['first_frame_ms']} ms, "
+                  f"gotowość {stats['playable_ms']} ms ({stats['assets']} zasobów)")
+            self.loader = None
+
+        # === Ziarno i zegar symulacji (powtarzalność rozgrywki) ===
+        seed = time.time_ns() & 0x7FFF_FFFF
+        sim.reset(seed)
+        controls = self.keyboard
+        if self.record and self.games == 0:
+            # opcjonalne nagranie pierwszej gry – krok symulacji jest stały
+            self.recorder = Recorder(self.record, seed, controls, dt=1 / PHYSICS_HZ)
+            controls = self.recorder.controls
+
+        # === Stan rozgrywki (grupy sprite'ów, gracz, pole asteroid, punktacja) ===
+        if self.game is None:
+            self.game = Game(self.screen, controls=controls)
+            # opcjonalnie: odświeżanie tylko zmienionych fragmentów ekranu
+            if self.dirty:
+                self.renderer = DirtyRenderer(self.screen, self.game.background)
+        else:
+            self.game.reset(controls)   # te same grupy, pule i grafiki
+        if self.governor is not None:
+            self.governor.reset()       # nowa gra zaczyna w pełnej jakości
+        self.games += 1
+        return PLAYING
+
+    def play(self) -> str | None:
+        """Główna pętla gry; kończy się utratą żyć lub zamknięciem okna."""
+        screen, game, renderer, clock = self.screen, self.game, self.renderer, self.clock
+        governor = self.governor
+        if renderer is not None:
+            renderer.invalidate()       # ekran tytułowy zasłonił całą planszę
+
+        # === Timery ===
+        # symulacja idzie stałym krokiem `step`, niezależnie od FPS wyświetlania:
+        # czas klatki trafia do akumulatora, z którego zdejmowane są całe kroki;
+        # reszta (`alpha`) służy do interpolacji pozycji przy rysowaniu
+        step = 1 / PHYSICS_HZ
+        accumulator = 0.0
+        fps = 0
+        clock.tick()
+
+        # ----------------------------------------------
+        # -------------- GŁÓWNA PĘTLA GRY --------------
+        # ----------------------------------------------
+        while True:
+            # ----------- obsługa zdarzeń -----------
+            with profiler.scope("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return None     # zamknięcie okna kończy sesję
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                        if not pause_screen(screen):
+                            return None
+                        if renderer is not None:
+                            renderer.invalidate()   # nakładka pauzy zasłoniła cały ekran
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle()
+            if self.watch:
+                changed = config.poll()     # plik sprawdzany co kilka klatek
+                if changed:
+                    print("config:", ", ".join(f"{n}={config.values[n]}" for n in sorted(changed)))
+
+            # ----------- logika gry i kolizje (stały krok) -----------
+            t0 = time.perf_counter()
+            steps = min(int(accumulator / step), MAX_SUBSTEPS)
+            for n in range(steps):
+                if n == steps - 1:
+                    game.snapshot()     # punkt wyjścia interpolacji
+                game.step(step)
+                if self.recorder is not None:
+                    self.recorder.frame(step, game)
+                if game.game_over:
+                    return GAME_OVER
+            accumulator -= steps * step
+            if steps == MAX_SUBSTEPS:
+                accumulator = min(accumulator, step)    # zaległości nie do nadrobienia – porzucamy
+            alpha = accumulator / step
+            t1 = time.perf_counter()
+
+            # ----------- rysowanie -----------
+            if renderer is None:
+                game.draw(screen, fps, alpha=alpha)
+                with profiler.scope("present"):
+                    pygame.display.flip() # update ekranu
+            else:
+                game.draw(renderer.begin(), fps, clear=False, alpha=alpha)
+                with profiler.scope("present"):
+                    renderer.present()
+            with profiler.scope("audio"):
+                audio.update()          # dźwięki zgłoszone w tej klatce
+            profiler.end_frame(game.groups())
+            if governor is not None:
+                t2 = time.perf_counter()
+                governor.frame(update=(t1 - t0) * 1000, draw=(t2 - t1) * 1000)
+
+            # limitujemy klatki do 60 FPS
+            accumulator += min(clock.tick(60) / 1000, MAX_FRAME_TIME)
+            fps = clock.get_fps()
+
+    def game_over(self) -> str | None:
+        """Ekran końcowy; R wraca do ekranu tytułowego (Q zamyka grę)."""
+        if self.recorder is not None:
+            self.recorder.close()    # nagranie obejmuje jedną rozgrywkę
+            self.recorder = None
+        if not exit_screen(self.screen, self.game.score.get_score()):
+            return None
+        return START
+
+    def close(self) -> None:
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.trace:
+            profiler.export_trace(self.trace)
+        audio.shutdown()        # wątek muzyki przed zamknięciem miksera
+
 
 # -------------- punkt wejścia gry --------------
 
-def main():
+def main(record: str | None = None, trace: str | None = None, dirty: bool = DIRTY_RECTS,
+         watch: bool = False):
+    started = time.perf_counter()
     # === Inicjalizacja Pygame ===
     pygame.init()
     pygame.display.set_caption("Asteroids")
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
     # === Ładowanie zasobów ===
-    audio.intro()         #  <<< startowa muzyczka
-    clock = pygame.time.Clock()
-    background = pygame.image.load("assets/background.png").convert()
-
-    POWERUP_EVENT = pygame.USEREVENT + 1
-    pygame.time.set_timer(POWERUP_EVENT, int(POWERUP_SPAWN_INTERVAL * 1000))
-
-    # === Start screen ===
-    start_screen(screen)
-
-    # === Sprite groups ===
-    updatable = pygame.sprite.Group()      # obiekty z metodą update()
-    drawable = pygame.sprite.Group()       # obiekty rysowane co klatkę
-    asteroids = pygame.sprite.Group()
-    shots = pygame.sprite.Group()
-    ufos = pygame.sprite.Group()
-    explosions = pygame.sprite.Group()
-    powerup_group = pygame.sprite.Group()
-
-    # === Containers binding ===
-    # Każda klasa sprite otrzymuje referencję do grup, do których ma się dodać.
-    Shot.containers = (shots, updatable, drawable)
-    Asteroid.containers = (asteroids, updatable, drawable)
-    AsteroidField.containers = (updatable,)
-    UFO.containers = (ufos, updatable, drawable)
-    asteroid_field = AsteroidField()
-
-    Player.containers = (drawable, updatable)
-    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, asteroid_field)
-
-    PowerUp.containers = (powerup_group, updatable, drawable)
-
-    score = Score()
-
-    # === Timery ===
-    dt = 0
-    fps = 0
-    ufo_spawn_timer = random.uniform(UFO_MIN_SPAWN_TIME, UFO_MAX_SPAWN_TIME)
-
-
-    # -------------- powerups helper --------------
-    def weighted_choice(d: dict[str, float]) -> str:
-        """Losuje klucz ze słownika *d*, gdzie wartości to wagi prawdopodobieństwa."""
-        r = random.random()
-        cum = 0
-        for k, w in d.items():
-            cum += w
-            if r < cum:
-                return k
-        return k
-
-    def spawn_random_powerup():
-        """Tworzy losowy *power-up* na krawędzi ekranu."""
-        pos  = random_outside_position()     # punkt startu poza ekranem
-        vel  = random_velocity(50, 120)      # prędkość w zakresie 50-120 px/s
-        kind = weighted_choice(POWERUP_RARITY)     # wybór typu wg prawdopodobieństw
-        powerup_group.add(PowerUp(pos, vel, kind)) # dodajemy sprite do grupy
+    # manifest wczytywany w tle, gdy wyświetla się już ekran startowy –
+    # tworzenie sprite'ów w trakcie gry nie sięga na dysk
+    loader = AssetLoader(started=started)
+    loader.start()
+    audio.music.verbose = True     # czasy przełączeń muzyki na standardowe wyjście
 
-    # ----------------------------------------------
-    # -------------- GŁÓWNA PĘTLA GRY --------------
-    # ----------------------------------------------
-    while True:
-        # ----------- obsługa zdarzeń -----------
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return  # zamknięcie okna kończy funkcję main()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                pause_screen(screen)
-            if event.type == POWERUP_EVENT:
-                spawn_random_powerup()
-
-
-        # ----------- logika gry -----------
-        # kontrola czasu – odliczanie do pojawienia się UFO
-        ufo_spawn_timer -= dt
-        if ufo_spawn_timer <= 0:
-            direction = random.choice([-1, 1])
-            y = random.uniform(50, SCREEN_HEIGHT - 50)
-            if direction == 1:
-                x = -UFO_RADIUS
-                velocity = pygame.Vector2(UFO_SPEED, 0)
-            else:
-                x = SCREEN_WIDTH + UFO_RADIUS
-                velocity = pygame.Vector2(-UFO_SPEED, 0)
-            ufo = UFO(x, y)
-            ufo.velocity = velocity
-            ufo_spawn_timer = random.uniform(UFO_MIN_SPAWN_TIME, UFO_MAX_SPAWN_TIME)
-
-        # aktualizacja wszystkich obiektów
-        for obj in updatable:
-            obj.update(dt)
-
-        # ----------- kolizje -----------
-        # 1) gracz vs asteroidy
-        for asteroid in asteroids:
-            if asteroid.collides_with(player):
-                if player.invulnerability_timer <= 0:
-                    explosions.add(Explosion(player.position))
-                player.handle_collision(screen, score, exit_screen, main, asteroids, explosions)
-                break   # przerwij dalsze sprawdzanie – gracz traci życie
-
-        # 2) gracz vs UFO
-        for ufo in ufos:
-            if ufo.collides_with(player):
-                if player.invulnerability_timer <= 0:
-                    explosions.add(Explosion(player.position))
-                player.handle_collision(screen, score, exit_screen, main, asteroids, explosions)
-                ufo.kill()
-                break
-      
-        # 3) pociski vs asteroidy
-        for asteroid in asteroids:
-            for shot in shots:
-                if asteroid.collides_with(shot):
-                    explosions.add(Explosion(asteroid.position))
-                    asteroid.split()
-                    shot.kill()
-                    score.add_points(asteroid.get_points())
-
-        # 4) pociski vs UFO
-        for ufo in ufos:
-            for shot in shots:
-                if ufo.collides_with(shot):
-                    explosions.add(Explosion(ufo.position))
-                    shot.kill()
-                    ufo.kill()
-                    if random.random() < 0.5:      # 50 % szans na drop powerupa
-                        powerup_group.add(
-                            PowerUp(ufo.position.copy(), random_velocity(80, 120),
-                                    weighted_choice(POWERUP_RARITY))
-                        )
-                    score.add_points(ufo.get_points())
-
-        # 5) zbieranie power‑upów przez gracza
-        for pu in pygame.sprite.spritecollide(player, powerup_group, dokill=True):
-            player.apply_powerup(pu.kind)
-            audio.play_sfx("powerup")
-
-        # ----------- rysowanie -----------
-        screen.blit(background, (0, 0))
-
-        for obj in drawable:
-            obj.draw(screen)
-
-        score.draw(screen)
-        player.draw_lives(screen, fps)
-
-        explosions.update(dt)
-        explosions.draw(screen)
-
-        pygame.display.flip() # update ekranu
-
-        # limitujemy klatki do 60 FPS
-        dt = clock.tick(60) / 1000
-        fps = clock.get_fps()
+    # === Profiler (F3 – nakładka z czasami faz, --trace – zapis śladu) ===
+    if trace:
+        profiler.start_trace()
+
+    Session(screen, record, trace, dirty, loader, watch).run()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument("--record", metavar="PATH", help="zapisz nagranie rozgrywki (patrz replay.py)")
+    parser.add_argument("--trace", metavar="PATH", help="zapisz ślad profilera (Chrome Trace / Perfetto)")
+    parser.add_argument("--dirty", action="store_true",
+                        help="odświeżaj tylko zmienione fragmenty ekranu (dirty rects)")
+    config.add_arguments(parser)
+    parser.add_argument("--watch", action="store_true",
+                        help="przeładowuj plik --config po każdej zmianie (strojenie w trakcie gry)")
+    args = parser.parse_args()
+    try:
+        config.from_args(args)      # przed utworzeniem okna – także rozmiar ekranu
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    main(args.record, args.trace, args.dirty or DIRTY_RECTS, args.watch)
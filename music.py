@@ -0,0 +1,180 @@
+"""
+music.py
+
+Muzyka w tle obsługiwana przez osobny wątek.
+
+Przełączenie utworu (`pygame.mixer.music.stop/load/play`) otwiera plik
+i uruchamia dekoder MP3 - na wątku gry wstrzymywało to klatkę ekranu
+startowego lub końcowego. `MusicWorker` przyjmuje polecenia przez kolejkę
+(`play`, `stop`, `prefetch`) i wykonuje je na własnym wątku, więc
+wywołujący nie czeka na dysk ani dekoder.
+
+Utwór startujący po ciszy jest strumieniowany przez `pygame.mixer.music`
+(bez dekodowania całości). Gdy inny utwór już gra, nowy wchodzi przez
+przenikanie (`MUSIC_CROSSFADE_MS`): stary wycisza się, a nowy -
+zdekodowany do `pygame.mixer.Sound` - narasta na jednym z kanałów
+zarezerwowanych dla muzyki (`MUSIC_CHANNELS`). Dekodowanie całego
+utworu trwa kilkaset ms, dlatego wątek wykonuje je z wyprzedzeniem
+(*prefetch*): następny utwór wskazany przy `play` jest dekodowany, gdy
+kolejka przez `MUSIC_PREFETCH_DELAY` s pozostaje pusta - już po
+starcie gry, a nie w trakcie wczytywania zasobów. Dekoder `Sound` nie
+zwalnia przy tym GIL-a na całą pracę, więc wątek gry nie czeka na jego
+wynik, ale może zostać przez niego spowolniony (zmierzone: łącznie
+~60 ms wstrzymania wątku gry w trakcie ~580 ms dekodowania `theme.mp3`).
+
+Czasy wczytania i startu każdego przełączenia trafiają do `timings`.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+import pygame
+from constants import MUSIC_CROSSFADE_MS, MUSIC_PREFETCH_DELAY
+
+MUSIC_CHANNELS = 2      # kanały miksera zarezerwowane dla muzyki (dwa utwory przy przenikaniu)
+
+
+class MusicWorker:
+    """Wątek muzyki sterowany kolejką poleceń.
+
+    Parametry
+    ---------
+    volume : float
+        Głośność muzyki (0.0 – 1.0).
+    verbose : bool
+        Czy wypisywać czasy każdego przełączenia utworu.
+    """
+
+    def __init__(self, volume: float = 1.0, verbose: bool = False):
+        self.volume = volume
+        self.verbose = verbose
+        self.timings: list[dict] = []       # czasy przełączeń (wypełnia wątek muzyki)
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._tracks: dict[str, pygame.mixer.Sound] = {}    # zdekodowane utwory
+        self._current = None        # (ścieżka, numer kanału lub None – strumień `mixer.music`)
+        self._prefetch = None       # utwór do zdekodowania w wolnej chwili
+
+    # ------------------------------------------------------------
+    def play(self, path: str, prefetch: str | None = None) -> None:
+        """Przełącza na utwór *path* (w pętli); *prefetch* - utwór, który zagra następny."""
+        self._submit("play", path, prefetch)
+
+    def stop(self) -> None:
+        """Zatrzymuje muzykę."""
+        self._submit("stop")
+
+    def prefetch(self, path: str) -> None:
+        """Dekoduje utwór z wyprzedzeniem (kolejne przenikanie nie czeka na dekoder)."""
+        self._submit("load", path)
+
+    def wait(self) -> None:
+        """Blokuje do wykonania wszystkich zleconych poleceń."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Kończy wątek muzyki (przed zamknięciem miksera)."""
+        if self._thread is not None:
+            self._queue.put(("quit",))
+            self._thread.join(timeout)
+            self._thread = None
+        # zdekodowane utwory należą do zamykanego miksera
+        self._tracks.clear()
+        self._current = self._prefetch = None
+
+    def _submit(self, *command) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="music", daemon=True)
+            self._thread.start()
+        self._queue.put(command)
+
+    # -------------- wątek muzyki --------------
+    def _run(self) -> None:
+        while True:
+            try:
+                # bez poleceń przez chwilę – czas na dekodowanie następnego utworu
+                command = self._queue.get(timeout=MUSIC_PREFETCH_DELAY if self._prefetch else None)
+            except queue.Empty:
+                path, self._prefetch = self._prefetch, None
+                self._run_command(("load", path))
+                continue
+            try:
+                if command[0] == "quit":
+                    return
+                self._run_command(command)
+            finally:
+                self._queue.task_done()
+
+    def _run_command(self, command) -> None:
+        name, *args = command
+        try:
+            getattr(self, "_" + name)(*args)
+        except pygame.error as exc:     # brak pliku, mikser zamknięty itp. – gra działa dalej
+            print(f"music: {exc}", file=sys.stderr)
+
+    def _load(self, path: str) -> pygame.mixer.Sound:
+        sound = self._tracks.get(path)
+        if sound is None:
+            sound = self._tracks[path] = pygame.mixer.Sound(path)
+            sound.set_volume(self.volume)
+        return sound
+
+    def _play(self, path: str, prefetch: str | None) -> None:
+        if self._current is not None and self._current[0] == path:
+            return
+        fade = MUSIC_CROSSFADE_MS if self._current is not None else 0
+        t0 = time.perf_counter()
+        if not fade:
+            # start po ciszy – strumień, bez dekodowania całego pliku
+            pygame.mixer.music.load(path)
+            t1 = time.perf_counter()
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(-1)
+            channel, mode = None, "stream"
+        else:
+            sound = self._load(path)
+            t1 = time.perf_counter()
+            channel = self._free_channel()
+            self._fade_out(fade)
+            pygame.mixer.Channel(channel).play(sound, loops=-1, fade_ms=fade)
+            mode = "crossfade"
+        t2 = time.perf_counter()
+        self._current = (path, channel)
+        self._prefetch = prefetch if prefetch and prefetch not in self._tracks else None
+
+        entry = {"track": os.path.basename(path), "mode": mode,
+                 "load_ms": round((t1 - t0) * 1000, 2), "start_ms": round((t2 - t1) * 1000, 2)}
+        self.timings.append(entry)
+        if self.verbose:
+            print(f"music: {entry['track']} ({mode}) – wczytanie {entry['load_ms']} ms, "
+                  f"start {entry['start_ms']} ms")
+
+    def _stop(self) -> None:
+        self._fade_out(0)
+
+    def _fade_out(self, ms: int) -> None:
+        # wycisza bieżący utwór (0 – zatrzymuje od razu)
+        if self._current is None:
+            return
+        _, channel = self._current
+        self._current = None
+        if channel is None:
+            if ms:
+                pygame.mixer.music.fadeout(ms)
+            else:
+                pygame.mixer.music.stop()
+        elif ms:
+            pygame.mixer.Channel(channel).fadeout(ms)
+        else:
+            pygame.mixer.Channel(channel).stop()
+
+    def _free_channel(self) -> int:
+        # numer kanału muzyki innego niż bieżący utwór (drugi może jeszcze wygasać);
+        # porównujemy numery - `mixer.Channel(i)` to za każdym razem nowy obiekt
+        current = self._current[1] if self._current is not None else None
+        channels = [i for i in range(MUSIC_CHANNELS) if i != current]
+        idle = [i for i in channels if not pygame.mixer.Channel(i).get_busy()]
+        return (idle + channels)[0]
@@ -0,0 +1,74 @@
+"""
+parallel.py
+
+Równoległe przetwarzanie tablic `EntityStore` w porcjach.
+
+Czysto obliczeniowe fragmenty klatki - całkowanie ruchu, zawijanie na
+krawędziach ekranu, wykrywanie pocisków poza planszą i przydział do
+komórek siatki kolizji - działają na wierszach tablic NumPy niezależnie
+od siebie. `ChunkPool` dzieli zakres wierszy na ciągłe porcje i liczy je
+na puli wątków. Operacje NumPy na dużych tablicach zwalniają GIL, więc
+porcje rzeczywiście liczą się równolegle; w CPython bez GIL
+(*free-threaded*, `FREE_THREADED`) dotyczy to także kodu Pythona.
+
+Wynik nie zależy od liczby wątków: każdy wiersz liczony jest tymi samymi
+operacjami co w przebiegu szeregowym, porcje nie nachodzą na siebie,
+a ich wyniki łączone są w kolejności wierszy. Poniżej `PARALLEL_MIN_CHUNK`
+wierszy na porcję narzut wątków przewyższa zysk - wtedy całość liczona
+jest od razu na wątku wywołującym.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from constants import PARALLEL_MIN_CHUNK
+
+# interpreter bez GIL (Python 3.13t+); w zwykłym CPythonie – False
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class ChunkPool:
+    """Pula wątków liczących porcje zakresu wierszy.
+
+    Parametry
+    ---------
+    workers : int
+        Liczba wątków (1 – przebieg szeregowy, bez puli).
+    min_chunk : int, opcjonalny
+        Najmniejsza porcja wierszy warta osobnego wątku
+        (domyślnie `PARALLEL_MIN_CHUNK`).
+    """
+
+    def __init__(self, workers: int, min_chunk: int | None = None):
+        self.workers = max(1, workers)
+        self.min_chunk = PARALLEL_MIN_CHUNK if min_chunk is None else min_chunk
+        self._executor = (ThreadPoolExecutor(self.workers, thread_name_prefix="chunks")
+                          if self.workers > 1 else None)
+
+    def chunks(self, n: int) -> list[tuple[int, int]]:
+        """Podział zakresu [0, n) na ciągłe porcje (start, stop)."""
+        count = max(1, min(self.workers, n // max(1, self.min_chunk)))
+        bounds = [n * i // count for i in range(count + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def map(self, kernel, n: int) -> list:
+        """Wywołuje *kernel(start, stop)* dla porcji [0, n); wyniki w kolejności porcji."""
+        chunks = self.chunks(n)
+        if self._executor is None or len(chunks) == 1:
+            return [kernel(start, stop) for start, stop in chunks]
+        return list(self._executor.map(lambda chunk: kernel(*chunk), chunks))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+_pools: dict[int, ChunkPool] = {}
+
+
+def shared(workers: int) -> ChunkPool:
+    """Wspólna pula o *workers* wątkach - kolejne gry (`Game`) nie tworzą nowych wątków."""
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ChunkPool(workers)
+    return pool
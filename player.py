@@ -13,11 +13,15 @@ Zawiera logikę:
 
 import pygame
 import audio
-from typing import List
+import assets
+import text
 from constants import *
 from utils import CircleShape, Explosion
 from shots import Shot
 from asteroidfield import AsteroidField
+from effects import Effects
+from governor import quality
+from inputs import KeyboardInput
 
 
 class Player(CircleShape):
@@ -26,13 +30,18 @@ class Player(CircleShape):
     Dziedziczy po `CircleShape`, aby korzystać ze wspólnej kolizyjnej
     geometrii (promień, pozycja jako `Vector2`).  Oprócz cech bazowych
     przechowuje również indywidualne parametry ruchu, animację płomienia
-    oraz buffy wzmacniające.
+    oraz buffy wzmacniające (`effects`, wygasające w kolejce zdarzeń gry
+    `events`, przypisywanej przez `Game._bind`).
     """
+    events = None
 
     # -------- wstępnie zdefiniowane skale dla płomienia --------
     _FLAME_SCALES = (0.8, 1.0, 1.2, 1.4, 1.6)
+    _FLAME_SHEET = "assets/thruster_flame_sheet.png"
+    _FLAME_FRAMES = 4           # klatki ułożone w poziomie, rozmiar wynika z arkusza
 
-    def __init__(self, x: float, y: float, asteroid_field: AsteroidField, lives: int = 3):
+    def __init__(self, x: float, y: float, asteroid_field: AsteroidField, lives: int = 3,
+                 controls=None):
         """Inicjalizacja statku.
 
         Parametry
@@ -43,13 +52,12 @@ class Player(CircleShape):
             Referencja do pola asteroid, aby móc generować wybuchy i buffy.
         lives : int, default 3
             Liczba żyć na start.
+        controls : obiekt z metodą `poll()`, default `KeyboardInput()`
+            Źródło sterowania (klawiatura, skrypt, losowe – patrz `inputs.py`).
         """
         super().__init__(x, y, PLAYER_RADIUS)
         self.asteroid_field = asteroid_field
-
-        # --- zmienne szybkostrzelności -------------
-        self.fast_fire_level = 0        # ile stacków
-        self.fast_fire_until = 0.0      # wspólny timer
+        self.controls = controls if controls is not None else KeyboardInput()
 
         # ---------------- parametry ruchu ----------------
         self.rotation: float = 0.0      # w stopniach, 0 znaczy „w górę”
@@ -62,43 +70,46 @@ class Player(CircleShape):
         self.lives: int = lives
 
         # ---------------- grafika statku ----------------
-        self.image = pygame.image.load("assets/player.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.radius * 2, self.radius * 2))
+        self.image = assets.image("assets/player.png", (self.radius * 2, self.radius * 2))
         self.rect = self.image.get_rect(center=(x, y))
 
-        # ---------------- płomienie ----------------
-        sheet = pygame.image.load("assets/thruster_flame_sheet.png").convert_alpha()
-        fw, fh = sheet.get_width() // 4, sheet.get_height()
-
         # --- buffy ---
-        self.buff_until: dict[str, float] = {}
+        # wartości zależne od buffów – przeliczane tylko przy zmianie poziomu
+        self.fire_rate = 1.0    # mnożnik szybkostrzelności (Fast Fire)
         self.spread_level = 0   # ile dodat. par pocisków
+        self.effects = Effects(self.events, self._effect_changed)
 
     # =============================================================
     # Naprawa artefaktów płomieni (usunięcie białych boxów animacji)                            
     # =============================================================
 
-        # 1) wycinamy bounding‑box dla każdej klatki (usuwa pustą ramkę)
-        trimmed_frames: List[pygame.Surface] = []
-        for i in range(4):
-            raw = sheet.subsurface(pygame.Rect(i * fw, 0, fw, fh))
-            bbox = raw.get_bounding_rect(min_alpha=50)
-            trimmed = raw.subsurface(bbox).copy()
-            trimmed_frames.append(trimmed.convert_alpha())
-
-        # 2) przygotowujemy 5 zestawów rozmiarów – bez skalowania w runtime
-        self.flame_frames_by_scale: List[List[pygame.Surface]] = []  # 5 poziomów × 4 klatki
-        for s in self._FLAME_SCALES:
-            scaled_frames = [
-                pygame.transform.scale(f, (int(f.get_width() * s), int(f.get_height() * s))).convert_alpha()
-                for f in trimmed_frames
-            ]
-            self.flame_frames_by_scale.append(scaled_frames)
+        # klatki przycięte do bounding‑boxa (usuwa pustą ramkę) w 5 rozmiarach –
+        # bez skalowania w runtime; bufor `assets` (lub atlas) przygotowuje je raz
+        self.flame_frames_by_scale: list[tuple] = [    # 5 poziomów × 4 klatki
+            assets.frames(self._FLAME_SHEET, None, self._FLAME_FRAMES, trim=50, scale=s)
+            for s in self._FLAME_SCALES
+        ]
 
         # animacyjny stan wewnętrzny płomienia
         self._flame_i = 0
         self._flame_timer = 0.0
 
+    def reset(self, x: float, y: float, lives: int = 3):
+        """Przywraca stan startowy statku (restart gry) bez ponownego
+        przygotowywania grafik i klatek płomienia."""
+        self.add(self.containers)
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        self.rect.center = (x, y)
+        self.rotation = 0.0
+        self.speed = 0.0
+        self.shoot_timer = 0.0
+        self.invulnerability_timer = 0.0
+        self.lives = lives
+        self.effects.clear()
+        self._flame_i = 0
+        self._flame_timer = 0.0
+
     # =============================================================
     #                            UPDATE                            
     # =============================================================
@@ -106,28 +117,25 @@ class Player(CircleShape):
         """Aktualizuj logikę statku.
         Wywoływana co klatkę przez pętlę główną - `dt` (delta time) to odstęp czasu w sekundach.
         """
-        if self.spread_level and not self.buff_active(PU_SPREAD):
-            self.spread_level = 0
-        
+        controls = self.controls.poll()
+
         # ---------- strzelanie ----------
         self.shoot_timer -= dt
-        if keys[pygame.K_SPACE]:
+        if controls.fire:
             self.shoot()
 
         # ---------- tarcza ----------
         if self.invulnerability_timer > 0:
             self.invulnerability_timer -= dt
 
-        keys = pygame.key.get_pressed()
-
         # ---------- obrót ----------
-        if keys[pygame.K_a]:
+        if controls.left:
             self.rotate(-dt)
-        if keys[pygame.K_d]:
+        if controls.right:
             self.rotate(dt)
 
         # ---------- akceleracja ----------
-        thrust_forward, thrust_back = keys[pygame.K_w], keys[pygame.K_s]
+        thrust_forward, thrust_back = controls.thrust, controls.reverse
         if thrust_forward:
             self.speed = min(self.speed + self._ACCEL * dt, PLAYER_SPEED)
         elif thrust_back:
@@ -156,10 +164,12 @@ class Player(CircleShape):
 
         # ---------- animacja płomienia ----------
         speed_ratio = abs(self.speed) / PLAYER_SPEED  # 0‑1
-        if speed_ratio > 0.05:  # mały próg, by wyłączyć płomień przy znikomej prędkości
+        # mały próg, by wyłączyć płomień przy znikomej prędkości; bez animacji przy
+        # obniżonej jakości (`governor.py`) – płomień pokazuje pierwszą klatkę
+        if speed_ratio > 0.05 and quality.flame_animation:
             self._flame_timer += dt * (8 + 12 * speed_ratio)
             if self._flame_timer >= 1:
-                self._flame_timer, self._flame_i = 0, (self._flame_i + 1) % 4
+                self._flame_timer, self._flame_i = 0, (self._flame_i + 1) % self._FLAME_FRAMES
         else:
             self._flame_timer, self._flame_i = 0, 0
 
@@ -169,7 +179,8 @@ class Player(CircleShape):
     # =============================================================
     def draw(self, screen: pygame.Surface):
         """Renderuj statek i płomienie na podanym ekranie Pygame."""
-        rotated_ship = pygame.transform.rotate(self.image, -self.rotation)
+        # obrócone wersje statku i płomieni pochodzą z bufora (kąt co ROTATION_STEP°)
+        rotated_ship = assets.rotated(self.image, -self.rotation)
         ship_rect = rotated_ship.get_rect(center=self.position)
 
         # --------- płomień ---------
@@ -182,7 +193,7 @@ class Player(CircleShape):
             # dopasuj pozycję tak, by płomień „wyrastał” zza dyszy
             offset = back_vec * self.radius * 0.9 * self._FLAME_SCALES[scale_idx]
             flame_pos = self.position + offset
-            flame_rotated = pygame.transform.rotate(flame_surf, -self.rotation)
+            flame_rotated = assets.rotated(flame_surf, -self.rotation)
             screen.blit(flame_rotated, flame_rotated.get_rect(center=flame_pos))
 
         # --------- tarcza niewrażliwości ---------
@@ -205,13 +216,11 @@ class Player(CircleShape):
         """Stwórz pociski w aktualnym kierunku - uwzględnia buffy."""
         if self.shoot_timer > 0:
             return
-        level = self.buff_active(PU_FAST_FIRE, level=True)
-        mult  = FAST_FIRE_MULT ** level if level else 1
-        self.shoot_timer = PLAYER_SHOOT_COOLDOWN / mult
+        self.shoot_timer = PLAYER_SHOOT_COOLDOWN / self.fire_rate
 
         # główny pocisk
         direction = pygame.Vector2(0, -1).rotate(self.rotation)     # ← DODAJ
-        shot = Shot(self.position.x, self.position.y, self.rotation)
+        shot = Shot.spawn(self.position.x, self.position.y, self.rotation)
         shot.velocity = direction * PLAYER_SHOOT_SPEED
 
         # dodatkowe pociski dla power-upa Spread
@@ -219,7 +228,7 @@ class Player(CircleShape):
             angle_offset = SPREAD_ANGLE * (i + 1)
             for sign in (-1, 1):
                 dir2 = direction.rotate(sign * angle_offset)
-                extra = Shot(self.position.x, self.position.y, self.rotation + sign * angle_offset)
+                extra = Shot.spawn(self.position.x, self.position.y, self.rotation + sign * angle_offset)
                 extra.velocity = dir2 * PLAYER_SHOOT_SPEED
 
         audio.play_sfx("laser")
@@ -227,7 +236,7 @@ class Player(CircleShape):
     def fire_nova(self):
         for angle in range(0, 360, 360 // 100):
             dir_vec = pygame.Vector2(1, 0).rotate(angle)
-            nova_shot = Shot(self.position.x, self.position.y, angle)
+            nova_shot = Shot.spawn(self.position.x, self.position.y, angle)
             nova_shot.velocity = dir_vec * PLAYER_SHOOT_SPEED
         audio.play_sfx("laser")
 
@@ -239,7 +248,7 @@ class Player(CircleShape):
         self.invulnerability_timer = 2
         for asteroid in asteroids:
             if self.position.distance_to(asteroid.position) <= 3 * self.radius:
-                explosions.add(Explosion(asteroid.position))
+                explosions.add(Explosion.spawn(asteroid.position))
                 asteroid.kill()
                 score.add_points(asteroid.get_points())
         if self.lives <= 0:
@@ -249,37 +258,20 @@ class Player(CircleShape):
 
     def draw_lives(self, screen: pygame.Surface, fps: float):
         """Rysuje FPS oraz liczbę żyć w prawym górnym rogu, zawsze mieszcząc się w ekranie."""
-        text = f"FPS: {int(fps):>3} | LIVES: {self.lives}"
-        surf = pygame.font.Font(None, 36).render(text, True, (255, 255, 255))
+        # napis z bufora `text` – rasteryzowany tylko, gdy FPS lub liczba żyć się zmieni
+        surf = text.render(f"FPS: {int(fps):>3} | LIVES: {self.lives}", 36)
         # odsuwamy 10 px od prawej krawędzi niezależnie od szerokości napisu
         screen.blit(surf, (SCREEN_WIDTH - surf.get_width() - 10, 10))
 
     # POWER-UP: Tarcza
-    def add_shield(self, extra: float = PU_DURATION[PU_SHIELD]) -> None:
-        self.invulnerability_timer += extra
+    def add_shield(self, extra: float | None = None) -> None:
+        self.invulnerability_timer += PU_DURATION[PU_SHIELD] if extra is None else extra
 
     # ---------------- Power-up API ---------------- #
     def apply_powerup(self, kind: str):
-        now = pygame.time.get_ticks() / 1000
-        dur = PU_DURATION[kind]
-
-        if kind == PU_FAST_FIRE:
-            self.fast_fire_level += 1
-            # przedłuż tyle, by KAŻDY stack dotrwał pełen czas
-            self.fast_fire_until = max(self.fast_fire_until, now) + dur
-            return
-
         # power-up natychmiastowy
         if kind == PU_NOVA:
             self.fire_nova()
-            return
-        
-        # zapis/odświeżenie timera buffa
-        dur = PU_DURATION[kind]
-        self.buff_until[kind] = self.buff_until.get(kind, now) + dur
-
-        if kind == PU_SPREAD:
-            self.spread_level += 1
 
         elif kind == PU_SHIELD:
             self.add_shield()
@@ -287,8 +279,12 @@ class Player(CircleShape):
         elif kind == PU_THREAT:
             self.asteroid_field.trigger_threat()
 
-    def buff_active(self, kind: str, *, level: bool=False):
-        now = pygame.time.get_ticks() / 1000
-        if kind == PU_FAST_FIRE and level:
-            return self.fast_fire_level if now < self.fast_fire_until else 0
-        return now < self.buff_until.get(kind, 0)
+        else:
+            # buff – poziom i czas trwania wg reguły nakładania (`effects.py`)
+            self.effects.add(kind)
+
+    def _effect_changed(self, kind: str, level: int) -> None:
+        if kind == PU_FAST_FIRE:
+            self.fire_rate = FAST_FIRE_MULT ** level
+        elif kind == PU_SPREAD:
+            self.spread_level = level
@@ -0,0 +1,107 @@
+"""
+pool.py
+
+Pule obiektów wielokrotnego użytku dla pocisków, asteroid i wybuchów.
+
+Każdy strzał, odłamek asteroidy czy wybuch był dotąd nowym obiektem
+Pythona, dodawanym do kilku grup sprite'ów i porzucanym po `kill()`.
+Przy serii Bullet Nova i stackowanym Fast Fire daje to setki alokacji
+na sekundę i częste przebiegi GC.
+
+Klasa z domieszką `Pooled` tworzy obiekty przez `Klasa.spawn(...)`:
+
+• jeśli w puli jest wolny obiekt, jest on przywracany metodą `reset()`
+  (pozycja, prędkość, grafika, członkostwo w grupach, `EntityStore`),
+• w przeciwnym razie powstaje nowy obiekt,
+• `kill()` oddaje obiekt do puli.
+
+Zwolnione obiekty wracają do użytku dopiero po `recycle()` - na początku
+następnej klatki. Kod kolizji nadal odczytuje pola obiektu tuż po jego
+`kill()` (np. `Asteroid.split`, drop power-upa z pozycji UFO), więc obiekt
+nie może zostać podmieniony w trakcie tej samej klatki.
+
+Pulę wskazuje atrybut klasowy `pool` - ustawiany przez `Game` tak samo
+jak `containers`; bez niego `spawn()` po prostu tworzy nowy obiekt.
+"""
+
+
+class Pool:
+    """Pula obiektów klasy *cls* o ograniczonej liczbie wolnych egzemplarzy.
+
+    Parametry
+    ---------
+    cls : type
+        Klasa obiektów; musi udostępniać `reset(*args)` o tej samej
+        sygnaturze co konstruktor.
+    capacity : int
+        Maksymalna liczba przechowywanych wolnych obiektów; nadmiarowe
+        zwolnione obiekty są porzucane (zbiera je GC).
+    """
+
+    def __init__(self, cls: type, capacity: int):
+        self.cls = cls
+        self.capacity = capacity
+        self._free: list = []
+        self._released: list = []
+        self.live = 0           # obiekty aktualnie w grze
+        self.high_water = 0     # największa liczba obiektów w grze naraz
+        self.created = 0
+        self.reused = 0
+        self.dropped = 0
+
+    def acquire(self, *args):
+        """Zwraca obiekt zainicjalizowany argumentami *args* (z puli lub nowy)."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            self.created += 1
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj) -> None:
+        """Przyjmuje zniszczony obiekt; wróci do użytku po `recycle()`."""
+        self.live -= 1
+        self._released.append(obj)
+
+    def recycle(self) -> None:
+        """Przenosi obiekty zwolnione w poprzedniej klatce do puli wolnych."""
+        released = self._released
+        if not released:
+            return
+        room = self.capacity - len(self._free)
+        if len(released) > room:
+            self.dropped += len(released) - room
+            del released[room:]
+        self._free.extend(released)
+        released.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"live": self.live, "high_water": self.high_water, "free": len(self._free),
+                "created": self.created, "reused": self.reused, "dropped": self.dropped}
+
+
+class Pooled:
+    """Domieszka dla sprite'ów tworzonych przez `spawn()` i oddawanych do puli w `kill()`."""
+
+    __slots__ = ()
+    pool = None
+
+    @classmethod
+    def spawn(cls, *args):
+        """Tworzy obiekt - z puli klasy, jeśli jest ustawiona."""
+        if cls.pool is None:
+            return cls(*args)
+        return cls.pool.acquire(*args)
+
+    def kill(self):
+        # do puli trafia tylko obiekt, który faktycznie był w grze
+        # (ponowne `kill()` tego samego obiektu nic nie robi)
+        alive = self.alive()
+        super().kill()
+        if alive and self.pool is not None:
+            self.pool.release(self)
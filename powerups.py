@@ -24,6 +24,7 @@ efekt po zebraniu) obsługują zewnętrzne systemy (`AsteroidField`,
 """
 
 import random, math, pygame
+import assets
 from constants import *
 from utils import CircleShape
 
@@ -47,9 +48,9 @@ class PowerUp(CircleShape):
         # Zachowaj wektor prędkości do przyszłych obliczeń ruchu
         self.velocity = velocity
         self.kind  = kind
-        # Ładowanie odpowiedniej grafiki; metoda `convert_alpha()`
-        # przyspiesza późniejsze blit‑owanie
-        self.image = pygame.image.load(self.SPRITES[kind]).convert_alpha()
+        # Grafika ze wspólnego bufora (wczytana i przekonwertowana
+        # `convert_alpha()` tylko raz na cały przebieg gry)
+        self.image = assets.image(self.SPRITES[kind])
         # Obliczamy prostokąt kolizyjny/graficzny z pozycją w środku
         self.rect  = self.image.get_rect(center = self.position)
 
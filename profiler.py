@@ -0,0 +1,149 @@
+"""
+profiler.py
+
+Wbudowany profiler klatki: pomiar czasu faz pętli gry, nakładka
+z wykresem słupkowym oraz eksport śladu w formacie Chrome Trace.
+
+Kod gry oznacza fazy blokami::
+
+    with profiler.scope("collision"):
+        ...
+
+Gdy profiler jest wyłączony, `scope()` zwraca współdzielony, pusty
+kontekst - koszt sprowadza się do jednego wywołania metody.
+Po włączeniu (klawisz F3 w grze lub `--trace` z linii poleceń):
+
+• czasy faz są uśredniane i rysowane w lewym dolnym rogu ekranu
+  razem z liczbą obiektów w grupach sprite'ów,
+• przy aktywnym nagrywaniu śladu każdy blok staje się zdarzeniem
+  "X" w pliku JSON, który można otworzyć w chrome://tracing lub
+  https://ui.perfetto.dev.
+"""
+
+import json
+import os
+import threading
+import time
+import pygame
+import text
+
+
+class _NullScope:
+    # Pusty kontekst zwracany przy wyłączonym profilerze.
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Profiler:
+    """Zbiera czasy nazwanych bloków kodu w obrębie klatki.
+
+    Parametry
+    ---------
+    smoothing : float
+        Waga nowej próbki w średniej kroczącej wyświetlanej na nakładce.
+    """
+
+    BAR_SCALE = 200 / 16.7      # px na ms – pełny budżet klatki 60 FPS = 200 px
+    COLORS = ((90, 200, 255), (255, 200, 80), (255, 110, 110), (140, 230, 120),
+              (200, 140, 255), (240, 240, 240))
+
+    def __init__(self, smoothing: float = 0.1):
+        self.enabled = False        # pomiar czasów (nakładka lub nagrywanie śladu)
+        self.overlay = False        # rysowanie nakładki
+        self.smoothing = smoothing
+        self.averages: dict[str, float] = {}    # nazwa → średni czas [ms]
+        self.counts: dict[str, int] = {}        # nazwa grupy → liczba obiektów
+        self._frame: dict[str, float] = {}
+        self._trace: list | None = None
+
+    # ------------------------------------------------------------
+    def scope(self, name: str):
+        """Kontekst mierzący czas bloku *name* (pusty, gdy profiler wyłączony)."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def _record(self, name: str, start: int, end: int) -> None:
+        self._frame[name] = self._frame.get(name, 0.0) + (end - start) / 1e6
+        if self._trace is not None:
+            self._trace.append((name, start, end - start, threading.get_ident()))
+
+    def end_frame(self, groups: dict | None = None) -> None:
+        """Zamyka klatkę: uaktualnia średnie i liczniki obiektów."""
+        if not self.enabled:
+            return
+        a = self.smoothing
+        averages = self.averages
+        for name, ms in self._frame.items():
+            averages[name] = averages.get(name, ms) * (1 - a) + ms * a
+        self._frame.clear()
+        if groups:
+            self.counts = {name: len(group) for name, group in groups.items()}
+
+    def toggle(self) -> None:
+        """Włącza/wyłącza nakładkę (pomiar trwa dalej, jeśli nagrywany jest ślad)."""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or self._trace is not None
+        self.averages.clear()
+        self._frame.clear()
+
+    # ------------------------------------------------------------
+    def start_trace(self) -> None:
+        """Włącza profiler i rozpoczyna zbieranie zdarzeń do śladu."""
+        self.enabled = True
+        self._trace = []
+
+    def export_trace(self, path: str) -> None:
+        """Zapisuje zebrane zdarzenia w formacie Chrome Trace / Perfetto (JSON)."""
+        events = [
+            {"name": name, "ph": "X", "ts": start / 1000, "dur": dur / 1000,
+             "pid": os.getpid(), "tid": tid}
+            for name, start, dur, tid in self._trace or ()
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    # ------------------------------------------------------------
+    def draw(self, screen: pygame.Surface) -> None:
+        """Rysuje wykres czasów faz i liczniki obiektów w lewym dolnym rogu."""
+        if not self.overlay:
+            return
+        # tylko fazy najwyższego poziomu (bez podfaz "faza.część")
+        phases = [(n, ms) for n, ms in self.averages.items() if "." not in n]
+        lines = len(phases) + 1
+        x, y = 10, screen.get_height() - 10 - lines * 18
+        for i, (name, ms) in enumerate(phases):
+            color = self.COLORS[i % len(self.COLORS)]
+            screen.fill(color, (x + 110, y + 4, max(1, int(ms * self.BAR_SCALE)), 10))
+            screen.blit(text.render(f"{name} {ms:5.2f}", 22, color), (x, y))
+            y += 18
+        counts = "  ".join(f"{name}: {n}" for name, n in self.counts.items())
+        screen.blit(text.render(counts, 22), (x, y))
+
+
+# Wspólna instancja używana przez pętlę gry.
+profiler = Profiler()
@@ -0,0 +1,180 @@
+"""
+renderer.py
+
+Warstwa rysowania: lekkie encje (`EntityRenderer`) oraz odświeżanie
+ekranu metodą "brudnych prostokątów" (`DirtyRenderer`).
+
+Encje z `entities.py` (asteroidy, pociski) nie mają własnych `image`
+ani `rect`. `EntityRenderer` dobiera dla nich współdzieloną powierzchnię
+po kluczu *(klasa, rodzaj, rozmiar, kąt)* i rysuje całą grupę jednym
+wywołaniem `Surface.blits`. Sposób budowania powierzchni dla danej
+klasy opisują funkcje "skórek" (`asteroid_skin`, `shot_skin`).
+
+Standardowo każda klatka kopiuje na ekran całe tło 1280×768 i wywołuje
+`pygame.display.flip()`. Na słabszych maszynach to kopiowanie pikseli
+dominuje czas klatki, choć zmienia się tylko niewielka część ekranu.
+
+`DirtyRenderer`:
+
+• zapamiętuje prostokąty wszystkich `blit`/`fill` wykonanych w klatce
+  (rysowanie odbywa się na pośredniku `TrackingSurface`),
+• w kolejnej klatce odtwarza tło wyłącznie w tych miejscach,
+• przekazuje do `pygame.display.update(rects)` stare i nowe prostokąty,
+• wraca do pełnego `flip()`, gdy brudny obszar przekroczy zadany ułamek
+  ekranu lub gdy ekran został zasłonięty (pauza, ekran końcowy) -
+  wtedy wywołujący zgłasza to przez `invalidate()`.
+"""
+
+import pygame
+import assets
+from governor import quality
+from constants import DIRTY_RECT_MAX_FRACTION, ROTATION_STEP
+
+
+# -------------- skórki encji: (rodzaj, promień, kąt) → powierzchnia --------------
+def asteroid_skin(kind: str, radius: float, angle: float) -> pygame.Surface:
+    # rodzaj asteroidy to ścieżka wariantu grafiki, skalowanej do średnicy
+    return assets.image(kind, (radius * 2, radius * 2))
+
+
+def shot_skin(kind: str, radius: float, angle: float) -> pygame.Surface:
+    # laser: prostokąt 4r × 1.4r obrócony do kierunku lotu
+    base = assets.image(kind, (int(radius * 4), int(radius * 1.4)), assets.ALPHA | assets.SMOOTH)
+    return assets.rotated(base, -angle)
+
+
+class EntityRenderer:
+    """Rysuje encje bez `image`/`rect` ze współdzielonych powierzchni.
+
+    Parametry
+    ---------
+    skins : dict[type, callable]
+        Klasa encji → funkcja `skin(kind, radius, angle)` zwracająca powierzchnię.
+    step : float
+        Rozdzielczość kątowa [°] – kąty encji są do niej zaokrąglane.
+    """
+
+    def __init__(self, skins: dict, step: float = ROTATION_STEP):
+        self.skins = dict(skins)
+        self.step = step
+        self.steps = max(1, round(360 / step))
+        # klucz → (powierzchnia, połowa szerokości, połowa wysokości)
+        self._sprites: dict[tuple, tuple] = {}
+        self.frame = 0      # licznik klatek – rzadsze rysowanie przy krawędziach
+
+    def _sprite(self, key: tuple) -> tuple:
+        cls, kind, radius, index = key
+        # klasa encji może być widokiem `EntityStore` – skórka należy do klasy bazowej
+        skin = next(self.skins[c] for c in cls.__mro__ if c in self.skins)
+        surface = skin(kind, radius, index * self.step)
+        w, h = surface.get_size()
+        sprite = self._sprites[key] = (surface, w // 2, h // 2)
+        return sprite
+
+    def _batch(self, entities):
+        # generator par (powierzchnia, pozycja) – `blits` zużywa je na bieżąco,
+        # bez budowania listy dla tysięcy encji
+        sprites = self._sprites
+        step, steps = self.step, self.steps
+        for e in entities:
+            key = (e.__class__, e.kind, e.radius, round(e.angle / step) % steps)
+            surface, dx, dy = sprites.get(key) or self._sprite(key)
+            pos = e.position
+            yield surface, (int(pos.x) - dx, int(pos.y) - dy)
+
+    def _inside(self, entities, width: int, height: int):
+        # tylko encje w całości na ekranie – bez tych w strefie zawijania
+        for e in entities:
+            pos, r = e.position, e.radius
+            if r <= pos.x <= width - r and r <= pos.y <= height - r:
+                yield e
+
+    def draw(self, screen: pygame.Surface, entities) -> None:
+        """Rysuje wszystkie *entities* (np. grupę asteroid) jednym `blits`.
+
+        Przy obniżonej jakości (`governor.quality.edge_interval`) encje
+        przecinające krawędź ekranu rysowane są tylko co kilka klatek."""
+        interval = quality.edge_interval
+        if interval > 1 and self.frame % interval:
+            entities = self._inside(entities, *screen.get_size())
+        screen.blits(self._batch(entities), doreturn=False)
+
+
+class TrackingSurface:
+    """Pośrednik powierzchni zapisujący prostokąty wszystkich operacji rysowania."""
+
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.rects: list[pygame.Rect] = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = self.surface.blits(blit_sequence, doreturn=True)
+        self.rects.extend(rects)
+        return rects
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = self.surface.fill(color, rect, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def __getattr__(self, name):
+        # pozostałe metody (get_width, get_rect…) – bezpośrednio z ekranu
+        return getattr(self.surface, name)
+
+
+class DirtyRenderer:
+    """Odświeża tylko zmienione fragmenty ekranu.
+
+    Parametry
+    ---------
+    screen : pygame.Surface
+        Powierzchnia wyświetlacza.
+    background : pygame.Surface
+        Tło, którym zamalowywane są poprzednie pozycje sprite'ów.
+    max_fraction : float
+        Ułamek powierzchni ekranu, powyżej którego wykonywany jest pełny `flip()`.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface,
+                 max_fraction: float = DIRTY_RECT_MAX_FRACTION):
+        self.screen = screen
+        self.background = background
+        self.max_area = max_fraction * screen.get_width() * screen.get_height()
+        self._target = TrackingSurface(screen)
+        self._previous: list[pygame.Rect] = []
+        self._full = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self) -> None:
+        """Wymusza pełne odświeżenie w następnej klatce (np. po pauzie)."""
+        self._full = True
+
+    def begin(self) -> TrackingSurface:
+        """Czyści poprzednie pozycje sprite'ów i zwraca powierzchnię do rysowania."""
+        screen, background = self.screen, self.background
+        if self._full:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in self._previous:
+                screen.blit(background, rect, rect)
+        self._target.rects = []
+        return self._target
+
+    def present(self) -> None:
+        """Wysyła na ekran zmienione obszary (lub całą klatkę)."""
+        drawn = self._target.rects
+        dirty = self._previous + drawn
+        self._previous = drawn
+        if self._full or sum(r.width * r.height for r in dirty) > self.max_area:
+            pygame.display.flip()
+            self._full = False
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
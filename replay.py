@@ -0,0 +1,196 @@
+"""
+replay.py
+
+Nagrywanie i odtwarzanie rozgrywki z kontrolą sum stanu.
+
+Dzięki wspólnemu generatorowi i zegarowi symulacji (`sim.py`) przebieg
+gry zależy wyłącznie od ziarna, kolejnych stanów sterowania i długości
+klatek. Plik nagrania zawiera więc tylko te dane - w zwartej, binarnej
+postaci:
+
+    nagłówek   : magic "ASTR", wersja, ziarno, stałe dt (0 → zmienne), co ile klatek suma
+    klatka     : 1 bajt maski sterowania (`Controls.to_bits`) [+ 8 bajtów dt, jeśli zmienne]
+    co N klatek: 8 bajtów kroczącej sumy stanu (`state_digest`)
+
+Odtworzenie (`replay`) przechodzi nagranie bez okna, tak szybko jak
+pozwala procesor, i porównuje sumy stanu - pierwsza rozbieżność
+przerywa przebieg wyjątkiem `ReplayMismatch`. Nagranie z sesji sprzed
+refaktoryzacji pozwala w ten sposób wychwycić każdą zmianę rozgrywki.
+
+Przykład::
+
+    python headless.py --seed 3 --minutes 30 --record sesja.rec
+    python replay.py sesja.rec
+"""
+
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import time
+from array import array
+
+import sim
+from inputs import ScriptedInput
+
+MAGIC = b"ASTR"
+VERSION = 4                 # rośnie także przy zmianie reguł symulacji (np. kolizji)
+CHECKSUM_INTERVAL = 60      # klatek między kolejnymi sumami stanu
+
+_HEADER = struct.Struct("<4sHqdH")
+_DT = struct.Struct("<d")
+_DIGEST_SIZE = 8
+
+
+class ReplayMismatch(Exception):
+    """Stan gry w odtworzeniu różni się od nagranego."""
+
+
+def state_digest(game, previous: bytes = b"") -> bytes:
+    """Krocząca suma stanu gry: skrót poprzedniej sumy i bieżącego stanu obiektów."""
+    h = hashlib.blake2b(previous, digest_size=_DIGEST_SIZE)
+    p = game.player
+    h.update(struct.pack("<6d2q", p.position.x, p.position.y, p.rotation, p.speed,
+                         p.shoot_timer, p.invulnerability_timer,
+                         p.lives, game.score.get_score()))
+    for group in (game.asteroids, game.shots, game.ufos, game.powerups):
+        coords = array("d")
+        for obj in group:
+            pos = obj.position
+            coords.extend((pos.x, pos.y, obj.radius))
+        h.update(len(coords).to_bytes(4, "little"))
+        h.update(coords.tobytes())
+    return h.digest()
+
+
+class RecordingInput:
+    """Przepuszcza stan z innego źródła sterowania i zapamiętuje ostatni odczyt."""
+
+    def __init__(self, source):
+        self.source = source
+        self.last = None
+
+    def poll(self):
+        self.last = self.source.poll()
+        return self.last
+
+
+class Recorder:
+    """Zapisuje kolejne klatki rozgrywki do pliku nagrania.
+
+    Parametry
+    ---------
+    path : str
+        Ścieżka pliku wynikowego.
+    seed : int
+        Ziarno, od którego wystartowała symulacja (`sim.reset(seed)`).
+    source : obiekt z metodą `poll()`
+        Właściwe źródło sterowania – nagrywane są jego odczyty.
+    dt : float
+        Stały krok czasu lub 0, gdy długość każdej klatki ma być zapisana.
+    interval : int
+        Co ile klatek zapisywana jest suma stanu.
+    """
+
+    def __init__(self, path: str, seed: int, source, dt: float = 0.0,
+                 interval: int = CHECKSUM_INTERVAL):
+        self.controls = RecordingInput(source)
+        self.dt = dt
+        self.interval = interval
+        self.frames = 0
+        self._digest = b""
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed, dt, interval))
+
+    def frame(self, dt: float, game) -> None:
+        """Zapisuje klatkę, która właśnie została zasymulowana."""
+        write = self._file.write
+        write(bytes((self.controls.last.to_bits(),)))
+        if not self.dt:
+            write(_DT.pack(dt))
+        self.frames += 1
+        if self.frames % self.interval == 0:
+            self._digest = state_digest(game, self._digest)
+            write(self._digest)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read(path: str):
+    """Wczytuje nagranie: (nagłówek, lista (maska, dt), {nr klatki: suma})."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, seed, dt, interval = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: nieobsługiwany format nagrania")
+    header = {"seed": seed, "dt": dt, "interval": interval}
+
+    frames, checkpoints = [], {}
+    offset = _HEADER.size
+    while offset < len(data):
+        bits = data[offset]
+        offset += 1
+        frame_dt = dt
+        if not dt:
+            (frame_dt,) = _DT.unpack_from(data, offset)
+            offset += _DT.size
+        frames.append((bits, frame_dt))
+        if len(frames) % interval == 0:
+            checkpoints[len(frames)] = data[offset:offset + _DIGEST_SIZE]
+            offset += _DIGEST_SIZE
+    return header, frames, checkpoints
+
+
+def replay(path: str, render: bool = False) -> dict:
+    """Odtwarza nagranie bez okna i sprawdza sumy stanu.
+
+    Po utracie wszystkich żyć rozpoczyna nową grę - tak samo jak
+    `headless.run(..., restart=True)`, którym mogło powstać nagranie.
+    """
+    from headless import init_display     # najpierw – ustawia sterowniki SDL "dummy"
+    from game import Game
+
+    header, frames, checkpoints = read(path)
+    screen = init_display()
+    sim.reset(header["seed"])
+    controls = ScriptedInput([bits for bits, _ in frames])
+
+    game = Game(screen, controls=controls)
+    digest = b""
+    start = time.perf_counter()
+    for i, (_, dt) in enumerate(frames, 1):
+        game.step(dt)
+        if render:
+            game.draw(screen, 0)
+        if i in checkpoints:
+            digest = state_digest(game, digest)
+            if digest != checkpoints[i]:
+                raise ReplayMismatch(f"{path}: stan gry różni się od nagrania w klatce {i}")
+        if game.game_over and i < len(frames):
+            game.reset()
+
+    return {
+        "frames": len(frames),
+        "checkpoints": len(checkpoints),
+        "sim_seconds": round(sum(dt for _, dt in frames), 3),
+        "wall_seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Asteroids – odtworzenie nagrania z kontrolą stanu")
+    parser.add_argument("path", help="plik nagrania (.rec)")
+    parser.add_argument("--render", action="store_true", help="rysuj klatki (niewidoczny ekran)")
+    args = parser.parse_args(argv)
+    try:
+        result = replay(args.path, render=args.render)
+    except ReplayMismatch as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,14 +14,18 @@ Zakres odpowiedzialności
 """
 
 import pygame
+import text
 
 class Score:
     def __init__(self, font_size=30, color=(255, 255, 255)):
         # Inicjalizacja fontu i ustawienie początkowego wyniku
         self.points = 0
         # `None` → wbudowany font Pygame; brak zależności od plików .ttf
-        self.font = pygame.font.Font(None, font_size)
+        self.font = text.font(font_size)
         self.color = color
+        # ostatnio wyrenderowany napis – odświeżany tylko przy zmianie wyniku
+        self._surface = None
+        self._rendered_points = None
 
     # Dodawanie punktów
     def add_points(self, amount):
@@ -31,10 +35,13 @@ class Score:
     def reset(self):
         self.points = 0
 
-    # Renderuje tekst z wynikiem i rysuje go w lewym górnym rogu ekranu
+    # Rysuje wynik w lewym górnym rogu ekranu; napis renderowany jest
+    # ponownie tylko wtedy, gdy liczba punktów się zmieniła
     def draw(self, screen, position=(10, 10)):
-        score_surface = self.font.render(f"Score: {self.points}", True, self.color)
-        screen.blit(score_surface, position)
+        if self._rendered_points != self.points:
+            self._surface = self.font.render(f"Score: {self.points}", True, self.color)
+            self._rendered_points = self.points
+        screen.blit(self._surface, position)
 
     # Udostępnienie aktualnego wyniku
     def get_score(self):
@@ -4,18 +4,23 @@ screens.py
 Moduł odpowiedzialny za **ekrany interfejsu** gry:
 
 • `start_screen`      - ekran tytułowy, wyświetlany przed rozpoczęciem rozgrywki;  
-  zatrzymuje się, dopóki gracz nie naciśnie **SPACE** lub **ENTER**.  
+  zatrzymuje się, dopóki gracz nie naciśnie **SPACE** lub **ENTER**;  
+  w tym czasie w tle wczytywane są zasoby gry (`loader.AssetLoader`).  
 • `pause_screen`      - pół-transparentna plansza pauzy; wraca do gry po **ESC**, 
 • `game_over_screen`  - podsumowanie wyniku i opcja restartu (**R**) lub wyjścia (**Q**).
 
 Każda funkcja jest *blokująca* - zatrzymuje główną pętlę gry,
-dopóki użytkownik nie wybierze jednej z dozwolonych akcji.
+dopóki użytkownik nie wybierze jednej z dozwolonych akcji. Zwraca
+True, gdy gra ma trwać dalej, a False, gdy gracz zamknął okno lub
+wybrał wyjście - sprzątanie (ślad profilera, nagranie, wątek muzyki)
+należy wtedy do wywołującego (`main.Session`).
 """
 
-import sys
 import pygame
 from constants import *
 import audio
+import assets
+import text
 
 
 def _blit_center(screen, surf, y):
@@ -24,89 +29,105 @@ def _blit_center(screen, surf, y):
     screen.blit(surf, rect)
 
 
-def start_screen(screen):
-    """Ekran tytułowy - czeka na SPACE / ENTER."""
+def start_screen(screen, loader=None):
+    """Ekran tytułowy - czeka na SPACE / ENTER (False - zamknięcie okna).
+
+    Jeśli podano `loader`, w każdej klatce przyjmuje wczytane w tle zasoby,
+    a przed powrotem czeka na resztę - rozgrywka startuje z kompletem w pamięci.
+    """
     # Przygotowanie zasobów
     clock = pygame.time.Clock()
-    background = pygame.image.load("assets/background.png").convert()
-    title_f  = pygame.font.Font(None, 120)  # duży, nagłówkowy font
-    info_f   = pygame.font.Font(None, 50)   # mniejszy font dla podpowiedzi
+    background = assets.image("assets/background.png", flags=0)
+    # napisy statyczne – renderowane raz (bufor `text`), a nie w każdej klatce
+    title = text.render("ASTEROIDS", 120)                    # duży, nagłówkowy font
+    info  = text.render("Press SPACE / ENTER to play", 50)   # mniejszy font dla podpowiedzi
+    ready = loader is None
 
     # Główna pętla ekranu tytułowego
     while True:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:       # zamknięcie okna
-                pygame.quit(); sys.exit()
+                return False
             if e.type == pygame.KEYDOWN and e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                audio.theme()   # zatrzyma intro i puści theme.mp3 w pętli
-                return          # ← start gry
+                if loader is not None:
+                    loader.wait()   # dokończ wczytywanie (zwykle już gotowe)
+                audio.theme()   # intro przechodzi w theme.mp3 (przenikanie w wątku muzyki)
+                return True     # ← start gry
+
+        if not ready:
+            ready = loader.poll()
 
         # Rysowanie tła i tekstów
         screen.blit(background, (0, 0))
-        _blit_center(screen, title_f.render("ASTEROIDS", True, (255, 255, 255)),
-                     SCREEN_HEIGHT // 2 - 80)
-        _blit_center(screen, info_f.render("Press SPACE / ENTER to play", True, (255, 255, 255)),
-                     SCREEN_HEIGHT // 2 + 20)
+        _blit_center(screen, title, SCREEN_HEIGHT // 2 - 80)
+        if ready:
+            _blit_center(screen, info, SCREEN_HEIGHT // 2 + 20)
+        else:
+            _blit_center(screen, text.render(f"Loading... {loader.progress:.0%}", 50),
+                         SCREEN_HEIGHT // 2 + 20)
         pygame.display.flip()
+        audio.update()
+        if loader is not None:
+            loader.mark_first_frame()
         clock.tick(60)
 
 
 def pause_screen(screen):
-    """Przyciemnia ekran i czeka na ESC, by wrócić do gry."""
+    """Przyciemnia ekran i czeka na ESC, by wrócić do gry (False - zamknięcie okna)."""
     clock = pygame.time.Clock()
     overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     overlay.fill((0, 0, 0)); overlay.set_alpha(150)     # delikatne ściemnienie
 
-    pause_f = pygame.font.Font(None, 100)
-    info_f  = pygame.font.Font(None, 50)
+    paused = text.render("PAUSED", 100)
+    info   = text.render("Press ESC to resume", 50)
+    # kopia ostatniej klatki – nakładka nie ciemnieje z każdą iteracją pętli
+    frame  = screen.copy()
 
 
     while True:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:       # wyjście z gry
-                pygame.quit(); sys.exit()
+                return False
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
-                return          # ← kontynuacja gry
+                return True     # ← kontynuacja gry
 
+        screen.blit(frame, (0, 0))
         screen.blit(overlay, (0, 0))
-        _blit_center(screen, pause_f.render("PAUSED", True, (255, 255, 255)),
-                     SCREEN_HEIGHT // 2 - 40)
-        _blit_center(screen, info_f.render("Press ESC to resume", True, (255, 255, 255)),
-                     SCREEN_HEIGHT // 2 + 60)
+        _blit_center(screen, paused, SCREEN_HEIGHT // 2 - 40)
+        _blit_center(screen, info, SCREEN_HEIGHT // 2 + 60)
         pygame.display.flip()
+        audio.update()
         clock.tick(60)
 
 
 def exit_screen(screen, score_value):
     audio.stop_music()        # zatrzymaj theme
     audio.play_sfx("game_over")
-    """GAME OVER - R restart, Q quit."""
+    """GAME OVER - R restart (True), Q quit (False)."""
     clock = pygame.time.Clock()
     overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     overlay.fill((0, 0, 0)); overlay.set_alpha(150)
 
-    big_f  = pygame.font.Font(None, 80)
-    small_f = pygame.font.Font(None, 50)
-
-    game_over = big_f.render("GAME OVER", True, (255, 255, 255))
-    score_txt = big_f.render(f"Final Score: {score_value}", True, (255, 255, 255))
-    opts      = small_f.render("Press R to Restart or Q to Quit", True, (255, 255, 255))
+    game_over = text.render("GAME OVER", 80)
+    score_txt = text.render(f"Final Score: {score_value}", 80)
+    opts      = text.render("Press R to Restart or Q to Quit", 50)
+    frame     = screen.copy()
 
     while True:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
+                return False
             if e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_q:
-                    audio.stop_music()
-                    pygame.mixer.quit()
-                    pygame.quit(); sys.exit()
+                    return False
                 if e.key == pygame.K_r:
-                    return      # ← restart
+                    return True     # ← restart
 
+        screen.blit(frame, (0, 0))
         screen.blit(overlay, (0, 0))
         _blit_center(screen, game_over, SCREEN_HEIGHT // 2 - 100)
         _blit_center(screen, score_txt, SCREEN_HEIGHT // 2)
         _blit_center(screen, opts,      SCREEN_HEIGHT // 2 + 100)
         pygame.display.flip()
+        audio.update()
         clock.tick(60)
@@ -0,0 +1,43 @@
+"""
+sim.py
+
+Wspólne źródła losowości i czasu symulacji.
+
+Aby rozgrywkę dało się odtworzyć klatka po klatce (nagrania, testy
+regresji, tryb headless), żaden moduł logiki gry nie korzysta
+z globalnego modułu `random` ani z zegara ściennego
+(`pygame.time.get_ticks()`). Zamiast tego:
+
+• `rng`   - generator `random.Random`, ziarno ustawia `reset(seed)`,
+• `clock` - zegar symulacji przesuwany przez `Game.update(dt)`;
+  stoi w miejscu podczas pauzy i biegnie szybciej w trybie headless.
+"""
+
+import random
+
+
+class SimClock:
+    """Czas gry w sekundach, przesuwany wyłącznie jawnie (`advance`)."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def advance(self, dt: float) -> None:
+        self.time += dt
+
+    def now(self) -> float:
+        return self.time
+
+    def reset(self) -> None:
+        self.time = 0.0
+
+
+rng = random.Random()
+clock = SimClock()
+
+
+def reset(seed: int | None = None) -> None:
+    """Zeruje zegar symulacji i (opcjonalnie) ustawia ziarno generatora."""
+    clock.reset()
+    if seed is not None:
+        rng.seed(seed)
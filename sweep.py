@@ -0,0 +1,229 @@
+"""
+sweep.py
+
+Wsadowe przebiegi symulacji - strojenie balansu i testy obciążeniowe.
+
+Wartości w `constants.py` (np. `ASTEROID_SPAWN_RATE`, `ASTEROID_SPAWN_BOOST`,
+`POWERUP_RARITY`, `UFO_MIN_SPAWN_TIME`) dobierane były ręcznie. Ten moduł
+rozgrywa wiele gier bez okna - po jednym procesie na rdzeń
+(`ProcessPoolExecutor`) - dla każdej kombinacji:
+
+• ziarna (`--seeds`),
+• polityki sterowania (`--policy`: random, idle, aim - patrz `inputs.py`),
+• zestawu nadpisanych stałych (`--set NAZWA=WARTOŚĆ`, powtórzenie tej samej
+  nazwy dodaje kolejną wartość do siatki; wartości w składni Pythona).
+
+Każda gra trwa do utraty wszystkich żyć lub limitu czasu. Wyniki
+(czas przeżycia, punkty, szczytowe liczby obiektów w grupach, koszt
+klatki) trafiają na bieżąco do pliku JSON Lines - po jednym wierszu na
+grę. Ponowne uruchomienie z tym samym plikiem pomija gry już zapisane,
+więc przerwany przebieg można wznowić. Klucz gry obejmuje też ustawienia
+przebiegu (wartości z `--config`, limit klatek, `--dt`, `--render`) -
+po ich zmianie gry rozgrywane są od nowa, a nie pomijane.
+
+Nadpisania obowiązują na czas jednej gry (`config.Config.overridden`)
+i nakładane są na wspólny plik `--config`, jeśli go podano.
+
+Przykład::
+
+    python sweep.py --seeds 0-49 --policy random aim --minutes 5 \\
+        --set ASTEROID_SPAWN_RATE=1.0 --set ASTEROID_SPAWN_RATE=1.5 \\
+        --output sweep.jsonl
+"""
+
+import headless     # najpierw – ustawia sterowniki SDL "dummy"
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import sim
+from config import Config, config
+from game import Game
+from inputs import AimInput, RandomInput, ScriptedInput
+
+POLICIES = {
+    "random": lambda seed: RandomInput(seed),
+    "idle":   lambda seed: ScriptedInput(()),
+    "aim":    lambda seed: AimInput(),
+}
+
+
+def job_key(seed: int, policy: str, overrides: dict, settings: dict) -> str:
+    """Jednoznaczny klucz gry w pliku wyników (do wznawiania).
+
+    *settings* - ustawienia wspólne dla całego przebiegu (`run_settings`)."""
+    return json.dumps([policy, seed, overrides, settings], sort_keys=True)
+
+
+def run_settings(frames: int, dt: float, render: bool, config_path: str | None) -> dict:
+    """Ustawienia przebiegu wpływające na wyniki gier – część klucza `job_key`.
+
+    Z pliku konfiguracji brane są wczytane wartości, nie ścieżka: zmiana
+    zawartości pliku też unieważnia zapisane gry."""
+    base = {}
+    if config_path:
+        scratch = Config()
+        base = {name: scratch.values[name] for name in sorted(scratch.load(config_path))}
+    return {"config": base, "frames": frames, "dt": dt, "render": render}
+
+
+def play(seed: int, policy: str, overrides: dict, frames: int,
+         dt: float = headless.FIXED_DT, render: bool = False) -> dict:
+    """Rozgrywa jedną grę (do utraty żyć lub *frames* klatek) i zwraca jej metryki."""
+    screen = headless.init_display()
+    with config.overridden(overrides):
+        sim.reset(seed)
+        controls = POLICIES[policy](seed)
+        game = Game(screen, controls=controls)
+        if isinstance(controls, AimInput):
+            controls.game = game
+        groups = game.groups()
+        peak = dict.fromkeys(groups, 0)
+        costs = []
+        clock = time.perf_counter
+        frame = 0
+        start = clock()
+        while frame < frames and not game.game_over:
+            t0 = clock()
+            game.step(dt)
+            if render:
+                game.draw(screen, 0)
+            costs.append(clock() - t0)
+            frame += 1
+            for name, group in groups.items():
+                if len(group) > peak[name]:
+                    peak[name] = len(group)
+        wall = clock() - start
+
+    costs.sort()
+    return {
+        "seed": seed,
+        "policy": policy,
+        "overrides": overrides,
+        "frames": frame,
+        "survival_s": round(frame * dt, 3),
+        "game_over": game.game_over,
+        "score": game.score.get_score(),
+        "peak": peak,
+        "frame_ms": round(statistics.fmean(costs) * 1000, 4) if costs else None,
+        "frame_p95_ms": round(costs[int(len(costs) * 0.95)] * 1000, 4) if costs else None,
+        "wall_s": round(wall, 3),
+    }
+
+
+# -------------- wyniki i wznawianie --------------
+def completed(path: str) -> set[str]:
+    """Klucze gier zapisanych w pliku wyników; ucina niedokończony ostatni wiersz."""
+    if not os.path.exists(path):
+        return set()
+    keys, valid = set(), []
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    for line in lines:
+        try:
+            keys.add(json.loads(line)["key"])
+            valid.append(line if line.endswith("\n") else line + "\n")
+        except (ValueError, KeyError):
+            pass        # wiersz urwany przy przerwaniu przebiegu
+    if valid != lines:
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(valid)
+    return keys
+
+
+def grid(settings: list[str]) -> list[dict]:
+    """Zamienia argumenty `NAZWA=WARTOŚĆ` na listę zestawów nadpisań (iloczyn kartezjański)."""
+    values: dict[str, list] = {}
+    for item in settings:
+        name, value = config.parse_setting(item)     # jak `--set` w pozostałych programach
+        values.setdefault(name, []).append(value)
+    names = sorted(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(values[n] for n in names))]
+
+
+def parse_seeds(spec: str) -> list[int]:
+    """'0-9,20,30-31' → [0, 1, …, 9, 20, 30, 31]"""
+    seeds = []
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        seeds.extend(range(int(first), int(last or first) + 1))
+    return seeds
+
+
+def _cores() -> int:
+    # rdzenie dostępne dla procesu (z uwzględnieniem ograniczeń CPU affinity)
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _init_worker(config_path: str | None) -> None:
+    if config_path:
+        config.load(config_path)
+        config.apply()
+    headless.init_display()     # pygame i zasoby – raz na proces
+
+
+def sweep(jobs: list[tuple], output: str, frames: int, dt: float = headless.FIXED_DT,
+          workers: int | None = None, render: bool = False,
+          config_path: str | None = None) -> dict:
+    """Rozgrywa gry *jobs* (ziarno, polityka, nadpisania) równolegle i dopisuje wyniki do *output*.
+
+    *config_path* - wspólny plik konfiguracji (`config.py`), na który nakładane są nadpisania gier."""
+    settings = run_settings(frames, dt, render, config_path)
+    done = completed(output)
+    todo = [job for job in jobs if job_key(*job, settings) not in done]
+    start = time.perf_counter()
+    with open(output, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers or _cores(),
+                                initializer=_init_worker, initargs=(config_path,)) as pool:
+        futures = {pool.submit(play, *job, frames, dt, render): job_key(*job, settings)
+                   for job in todo}
+        for future in as_completed(futures):
+            out.write(json.dumps({"key": futures[future], **future.result()}) + "\n")
+            out.flush()     # przerwany przebieg zachowuje gotowe wyniki
+    wall = time.perf_counter() - start
+    return {
+        "games": len(todo),
+        "skipped": len(jobs) - len(todo),
+        "wall_seconds": round(wall, 3),
+        "games_per_second": round(len(todo) / wall, 2) if wall and todo else None,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Asteroids – wsadowe przebiegi balansu i obciążenia")
+    parser.add_argument("--seeds", default="0-9", help="ziarna, np. 0-99 lub 1,5,7 (domyślnie 0-9)")
+    parser.add_argument("--policy", nargs="+", choices=sorted(POLICIES), default=["random"],
+                        help="polityki sterowania statkiem")
+    parser.add_argument("--set", dest="settings", action="append", default=[], metavar="NAZWA=WARTOŚĆ",
+                        help="nadpisanie stałej z constants.py (można powtarzać)")
+    parser.add_argument("--config", metavar="PATH", help="wspólny plik konfiguracji (TOML lub JSON)")
+    parser.add_argument("--minutes", type=float, default=5.0, help="limit czasu gry [min gry]")
+    parser.add_argument("--dt", type=float, default=headless.FIXED_DT, help="krok czasu klatki [s]")
+    parser.add_argument("--workers", type=int, help="liczba procesów (domyślnie liczba rdzeni)")
+    parser.add_argument("--render", action="store_true", help="rysuj klatki (koszt klatki z renderem)")
+    parser.add_argument("--output", default="sweep.jsonl", metavar="PATH",
+                        help="plik wyników JSON Lines (istniejący jest wznawiany)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.config:
+            config.load(args.config)    # sprawdzenie pliku przed startem procesów
+        overrides = grid(args.settings)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    jobs = [(seed, policy, values)
+            for values in overrides for policy in args.policy for seed in parse_seeds(args.seeds)]
+    frames = int(args.minutes * 60 / args.dt)
+    result = sweep(jobs, args.output, frames, args.dt, args.workers, args.render, args.config)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# moduły gry leżą płasko w katalogu głównym repozytorium
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# bez okna i dźwięku (jak `headless.py`)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,111 @@
+"""Broadphase siatki (`SpatialHash`) kontra referencyjny test każdy-z-każdym."""
+
+import random
+
+import pygame
+import pytest
+
+from collisions import SpatialHash, brute_force_hits, first_hits, swept_hits
+from constants import *
+
+
+class Body:
+    """Minimalny obiekt kolizyjny: pozycja po kroku, prędkość, promień."""
+
+    def __init__(self, x, y, vx, vy, radius):
+        self.position = pygame.Vector2(x, y)
+        self.velocity = pygame.Vector2(vx, vy)
+        self.radius = radius
+        self.dead = False
+
+    def alive(self):
+        return not self.dead
+
+
+def random_scene(rng: random.Random):
+    """Asteroidy i pociski na ekranie i w pasie zawijania, część pocisków
+    wystrzelona w trakcie kroku (*fresh*), część celów i pocisków zniszczona."""
+    margin = ASTEROID_MAX_RADIUS * 1.5      # także poza siatką – skrajne komórki
+
+    def position():
+        return (rng.uniform(-margin, SCREEN_WIDTH + margin),
+                rng.uniform(-margin, SCREEN_HEIGHT + margin))
+
+    targets = []
+    for _ in range(rng.randint(1, 40)):
+        velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+        radius = ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+        targets.append(Body(*position(), velocity.x, velocity.y, radius))
+
+    shots = []
+    for _ in range(rng.randint(1, 200)):
+        if rng.random() < 0.5:
+            x, y = position()
+        else:   # w pobliżu celu – dużo trafień
+            near = rng.choice(targets).position
+            x, y = near.x + rng.uniform(-80, 80), near.y + rng.uniform(-80, 80)
+        velocity = pygame.Vector2(0, -PLAYER_SHOOT_SPEED).rotate(rng.uniform(0, 360))
+        shots.append(Body(x, y, velocity.x, velocity.y, SHOT_RADIUS))
+
+    fresh = {shot for shot in shots if rng.random() < 0.1}
+    for body in rng.sample(targets, len(targets) // 10) + rng.sample(shots, len(shots) // 10):
+        body.dead = True
+    return targets, shots, fresh
+
+
+SCENES = [(seed, dt) for seed in range(40) for dt in (0.0, 1 / PHYSICS_HZ, 1 / 60, 0.1)]
+
+
+@pytest.mark.parametrize("seed, dt", SCENES)
+def test_grid_matches_brute_force(seed, dt):
+    targets, shots, fresh = random_scene(random.Random(seed))
+    grid = SpatialHash()
+    grid.rebuild(shots, dt, fresh)
+
+    expected = brute_force_hits(targets, shots, dt, fresh)
+    assert swept_hits(targets, shots, grid, dt, fresh) == expected
+    assert list(first_hits(swept_hits(targets, shots, grid, dt, fresh))) == list(first_hits(expected))
+
+
+def test_scenes_hit_something():
+    # losowe sceny faktycznie sprawdzają trafienia (także zniszczone obiekty i *fresh*)
+    hits = 0
+    for seed, dt in SCENES:
+        targets, shots, fresh = random_scene(random.Random(seed))
+        hits += len(brute_force_hits(targets, shots, dt, fresh))
+    assert hits > len(SCENES)
+
+
+def test_fast_shot_does_not_tunnel():
+    # pocisk przelatuje przez małą asteroidę w jednym kroku – trafienie w połowie kroku
+    target = Body(300, 300, 0, 0, ASTEROID_MIN_RADIUS)
+    shot = Body(300, 300 - 100, 0, -2000, SHOT_RADIUS)
+    dt = 0.1    # początek kroku: y = 400
+    hits = swept_hits([target], [shot], dt=dt)
+    assert [(target, shot)] == [(a, b) for _, a, b in hits]
+    assert hits[0][0] == pytest.approx((100 - ASTEROID_MIN_RADIUS - SHOT_RADIUS) / 200)
+
+
+@pytest.mark.parametrize("seed, dt", SCENES)
+def test_store_matches_grid_and_brute_force(seed, dt):
+    pytest.importorskip("numpy")
+    from entitystore import CULL, WRAP, EntityStore
+
+    targets, shots, fresh = random_scene(random.Random(seed))
+    grid = SpatialHash()
+    grid.rebuild(shots, dt, fresh)
+    expected = swept_hits(targets, shots, grid, dt, fresh)
+    assert expected == brute_force_hits(targets, shots, dt, fresh)
+
+    store = EntityStore(16)
+    for target in targets:
+        store.adopt(target, WRAP)
+    for shot in shots:
+        store.adopt(shot, CULL)
+    assert store.swept_hits(targets, shots, grid, dt, fresh) == expected
+    # zakresy komórek pocisków policzone wcześniej – jak w `Game.collide`
+    spans = store.cell_spans([shot._slot for shot in shots],
+                             [0.0 if shot in fresh else dt for shot in shots], grid)
+    hits = store.swept_hits(targets, shots, grid, dt, fresh, spans)
+    assert hits == expected
+    assert list(first_hits(hits)) == list(first_hits(expected))
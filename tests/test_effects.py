@@ -0,0 +1,128 @@
+"""Reguły nakładania efektów (`effects.py`) i ich skutki w `Player`."""
+
+import pytest
+
+import effects
+import sim
+from constants import *
+from effects import EXTEND, INDEPENDENT, REFRESH, Effects, register
+from events import EventQueue
+
+
+@pytest.fixture
+def clock():
+    return sim.SimClock()
+
+
+@pytest.fixture
+def rules(monkeypatch):
+    # `register` w testach nie zmienia reguł gry
+    monkeypatch.setattr(effects, "EFFECT_RULES", dict(effects.EFFECT_RULES))
+
+
+def advance(clock, queue, seconds, dt=0.01):
+    for _ in range(round(seconds / dt)):
+        clock.advance(dt)
+        queue.run()
+
+
+def make(clock):
+    queue = EventQueue(clock)
+    changes = []
+    return queue, Effects(queue, lambda kind, level: changes.append((kind, level))), changes
+
+
+def test_extend_stacks_share_extended_timer(clock, rules):
+    register("boost", EXTEND)
+    queue, fx, changes = make(clock)
+    fx.add("boost", 5)
+    advance(clock, queue, 2)
+    assert fx.add("boost", 5) == 2      # wspólny czas: 5 + 5 s od pierwszego stacku
+    advance(clock, queue, 7.5)
+    assert fx.level("boost") == 2
+    advance(clock, queue, 1)
+    assert fx.level("boost") == 0
+    assert changes == [("boost", 1), ("boost", 2), ("boost", 0)]
+
+
+def test_extend_after_expiry_starts_from_now(clock, rules):
+    register("boost", EXTEND)
+    queue, fx, _ = make(clock)
+    fx.add("boost", 1)
+    advance(clock, queue, 3)
+    fx.add("boost", 5)      # nie od dawno minionego końca poprzedniego stacku
+    advance(clock, queue, 4.5)
+    assert fx.level("boost") == 1
+
+
+def test_refresh_restarts_timer_and_caps_level(clock, rules):
+    register("glow", REFRESH, max_stacks=2)
+    queue, fx, _ = make(clock)
+    fx.add("glow", 3)
+    advance(clock, queue, 2)
+    fx.add("glow", 3)
+    assert fx.add("glow", 3) == 2       # limit stacków
+    advance(clock, queue, 2.5)          # 4.5 s od startu – czas liczony od ostatniego stacku
+    assert fx.level("glow") == 2
+    advance(clock, queue, 1)
+    assert fx.level("glow") == 0
+
+
+def test_independent_stacks_expire_separately(clock, rules):
+    register("charge", INDEPENDENT, max_stacks=2)
+    queue, fx, changes = make(clock)
+    fx.add("charge", 3)                 # t = 0, koniec 3
+    advance(clock, queue, 1)
+    fx.add("charge", 3)                 # t = 1, koniec 4
+    advance(clock, queue, 1)
+    assert fx.add("charge", 3) == 2     # t = 2 – zastępuje najstarszy stack, koniec 5
+    advance(clock, queue, 1.5)          # t = 3.5 – zastąpiony stack już nie wygasa
+    assert fx.level("charge") == 2
+    advance(clock, queue, 1)            # t = 4.5
+    assert fx.level("charge") == 1
+    advance(clock, queue, 1)            # t = 5.5
+    assert fx.level("charge") == 0
+    assert changes == [("charge", 1), ("charge", 2), ("charge", 1), ("charge", 0)]
+
+
+def test_register_rejects_unknown_rule(rules):
+    with pytest.raises(ValueError):
+        register("odd", "sometimes")
+
+
+def test_clear_resets_levels_and_cancels_expiry(clock, rules):
+    register("boost", EXTEND)
+    queue, fx, changes = make(clock)
+    fx.add("boost", 1)
+    fx.clear()
+    assert fx.level("boost") == 0
+    advance(clock, queue, 2)
+    assert changes == [("boost", 1), ("boost", 0)]
+
+
+def test_player_recomputes_fire_rate_and_spread_on_expiry():
+    import headless
+    from game import Game
+    from inputs import ScriptedInput
+
+    screen = headless.init_display()
+    sim.reset(0)
+    game = Game(screen, controls=ScriptedInput(()))
+    player, queue = game.player, game.events
+
+    player.apply_powerup(PU_FAST_FIRE)
+    player.apply_powerup(PU_FAST_FIRE)
+    assert player.fire_rate == FAST_FIRE_MULT ** 2
+    advance(sim.clock, queue, PU_DURATION[PU_FAST_FIRE] * 2 - 1)
+    player.apply_powerup(PU_SPREAD)
+    assert player.spread_level == 1 and player.fire_rate == FAST_FIRE_MULT ** 2
+
+    advance(sim.clock, queue, 1.1)      # oba stacki Fast Fire wygasają razem
+    assert player.fire_rate == 1.0
+    assert player.spread_level == 1
+    advance(sim.clock, queue, PU_DURATION[PU_SPREAD])
+    assert player.spread_level == 0
+
+    player.apply_powerup(PU_SPREAD)
+    game.reset()
+    assert player.spread_level == 0 and player.fire_rate == 1.0
@@ -0,0 +1,56 @@
+"""Widoki `position`/`velocity` obiektów w `EntityStore`."""
+
+import pygame
+import pytest
+
+pytest.importorskip("numpy")
+
+from entitystore import CULL, WRAP, EntityStore
+
+
+class Body:
+    def __init__(self, x, y):
+        self.position = pygame.Vector2(x, y)
+        self.velocity = pygame.Vector2(10, 0)
+        self.radius = 5
+
+
+def test_in_place_changes_write_through():
+    store = EntityStore(4)
+    body = Body(1, 2)
+    store.adopt(body, WRAP)
+    slot = body._slot
+
+    body.position.x = 10
+    assert tuple(store.pos[slot]) == (10, 2)
+    body.position.update(5, 6)
+    assert tuple(store.pos[slot]) == (5, 6)
+    body.position += (1, 1)
+    assert tuple(store.pos[slot]) == (6, 7)
+    position = body.position
+    position.xy = (7, 8)
+    position[1] = 9
+    assert tuple(store.pos[slot]) == (7, 9)
+    body.velocity.rotate_ip(90)
+    assert store.vel[slot] == pytest.approx((0, 10))
+
+    # wynik działania jest zwykłą kopią
+    copy = body.position * 2
+    copy.update(0, 0)
+    assert tuple(store.pos[slot]) == (7, 9)
+
+
+def test_stale_vector_does_not_write_to_reused_slot():
+    store = EntityStore(1)
+    first = Body(1, 2)
+    store.adopt(first, CULL)
+    kept = first.position       # np. pozycja w wybuchu
+    store.release(first)
+    second = Body(50, 60)
+    store.adopt(second, CULL)
+    assert second._slot == 0
+
+    kept.update(0, 0)
+    first.position.update(3, 4)     # obiekt z puli – już zwykły wektor
+    assert tuple(store.pos[0]) == (50, 60)
+    assert type(first.position) is pygame.Vector2
@@ -0,0 +1,54 @@
+"""Interpolacja pozycji przy rysowaniu (`Game.draw`)."""
+
+import pygame
+import pytest
+
+import headless
+import sim
+from game import Game
+
+
+@pytest.fixture
+def game():
+    screen = headless.init_display()
+    sim.reset(3)
+    game = Game(screen)
+    for _ in range(120):
+        game.step(headless.FIXED_DT)
+    game.snapshot()
+    game.step(headless.FIXED_DT)
+    return game
+
+
+def positions(game):
+    return [(tuple(obj.position), getattr(obj, "rect", None) and tuple(obj.rect))
+            for group in game.groups().values() for obj in group]
+
+
+def test_draw_restores_positions(game):
+    before = positions(game)
+    game.draw(game.screen, 0, alpha=0.5)
+    assert positions(game) == before
+
+
+def test_failed_draw_restores_positions(game, monkeypatch):
+    before = positions(game)
+
+    def broken(screen):
+        raise RuntimeError("draw")
+
+    monkeypatch.setattr(game.score, "draw", broken)
+    with pytest.raises(RuntimeError):
+        game.draw(game.screen, 0, alpha=0.5)
+    assert positions(game) == before
+
+
+def test_zero_size_rect_is_interpolated(game):
+    player = game.player
+    player.rect = pygame.Rect(player.position.x, player.position.y, 0, 0)
+    x0 = player.position.x
+    game._previous = [(player, x0 - 10, player.position.y)]
+    saved = game._interpolate(0.5)
+    assert player.rect.centerx == int(x0 - 5)
+    game._restore(saved)
+    assert player.rect.centerx == int(x0)
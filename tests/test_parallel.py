@@ -0,0 +1,72 @@
+"""Porcjowane obliczenia `EntityStore` (`parallel.ChunkPool`) kontra przebieg szeregowy."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from collisions import SpatialHash
+from constants import *
+from entitystore import CULL, WRAP, EntityStore
+from parallel import ChunkPool
+
+COUNT = 5000
+STEPS = 20
+DT = 1 / PHYSICS_HZ
+
+
+def seeded_store(seed: int = 0) -> EntityStore:
+    """Magazyn z losowymi obiektami - część poza ekranem (zawijanie i usuwanie)."""
+    rng = np.random.default_rng(seed)
+    store = EntityStore(COUNT)
+    store.pos[:] = rng.uniform((-100, -100), (SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100), (COUNT, 2))
+    store.vel[:] = rng.uniform(-600, 600, (COUNT, 2))
+    store.radius[:] = rng.choice([SHOT_RADIUS, ASTEROID_MIN_RADIUS, ASTEROID_MAX_RADIUS], COUNT)
+    store.mode[:] = np.where(rng.random(COUNT) < 0.5, CULL, WRAP)
+    store.alive[:] = rng.random(COUNT) < 0.9
+    store.owners[:] = range(COUNT)      # `step` zwraca właścicieli usuwanych wierszy
+    store.size = COUNT
+    return store
+
+
+def run(store: EntityStore):
+    grid = SpatialHash()
+    slots = np.flatnonzero(store.alive[:COUNT])
+    sweep = np.where(store.mode[slots] == CULL, 0.0, DT)
+    culled, spans = [], []
+    for _ in range(STEPS):
+        culled.append(store.step(DT))
+        spans.append(store.cell_spans(slots, sweep, grid))
+    return culled, spans
+
+
+def test_chunked_step_and_spans_are_bit_identical():
+    serial = seeded_store()
+    expected_culled, expected_spans = run(serial)
+
+    chunked = seeded_store()
+    chunked.parallel = pool = ChunkPool(workers=4, min_chunk=1)
+    try:
+        assert len(pool.chunks(COUNT)) == 4
+        culled, spans = run(chunked)
+    finally:
+        pool.close()
+
+    assert culled == expected_culled
+    assert any(culled)      # scena faktycznie usuwa obiekty
+    assert chunked.pos.tobytes() == serial.pos.tobytes()
+    for (first, last), (first0, last0) in zip(spans, expected_spans):
+        assert first.tobytes() == first0.tobytes()
+        assert last.tobytes() == last0.tobytes()
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 4, 17, 1000])
+def test_chunks_cover_range_in_order(n):
+    pool = ChunkPool(workers=4, min_chunk=1)
+    try:
+        chunks = pool.chunks(n)
+        assert chunks[0][0] == 0 and chunks[-1][1] == n
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+        assert pool.map(lambda start, stop: list(range(start, stop)), n) == [
+            list(range(start, stop)) for start, stop in chunks]
+    finally:
+        pool.close()
@@ -0,0 +1,73 @@
+"""
+text.py
+
+Bufor renderowania tekstu (HUD, ekrany start/pauza/koniec, profiler).
+
+Tworzenie obiektu `pygame.font.Font` oraz rasteryzacja napisu to jedne
+z droższych operacji w klatce, a większość napisów w grze nie zmienia
+się przez wiele klatek ("Score: 150", "PAUSED"…). Moduł:
+
+• tworzy każdy font (rozmiar, plik) tylko raz,
+• przechowuje wyrenderowane powierzchnie pod kluczem
+  *(font, tekst, kolor)* z ograniczeniem liczby wpisów (LRU).
+
+Zwracane powierzchnie są współdzielone - wolno je jedynie blit-ować.
+"""
+
+from collections import OrderedDict
+import pygame
+
+WHITE = (255, 255, 255)
+
+
+class TextCache:
+    """Fonty i wyrenderowane napisy z limitem wpisów.
+
+    Parametry
+    ---------
+    max_entries : int
+        Maksymalna liczba przechowywanych napisów (najdawniej użyte są usuwane).
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._fonts: dict[tuple, pygame.font.Font] = {}
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        """Zwraca font o danym rozmiarze; `None` → wbudowany font Pygame."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, text: str, size: int, color=WHITE, name: str | None = None) -> pygame.Surface:
+        """Zwraca napis *text* wyrenderowany (z antyaliasingiem) danym fontem i kolorem."""
+        key = (name, size, text, tuple(color))
+        surfaces = self._surfaces
+        surf = surfaces.get(key)
+        if surf is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = surfaces[key] = self.font(size, name).render(text, True, color)
+        if len(surfaces) > self.max_entries:
+            surfaces.popitem(last=False)
+        return surf
+
+    def stats(self) -> dict[str, int]:
+        return {"fonts": len(self._fonts), "entries": len(self._surfaces),
+                "hits": self.hits, "misses": self.misses}
+
+
+# Wspólna instancja używana przez wszystkie moduły gry.
+cache = TextCache()
+
+# Skróty dla najczęstszych wywołań
+font = cache.font
+render = cache.render
@@ -1,6 +1,7 @@
 import pygame
 import math
-import random
+import sim
+import assets
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, UFO_RADIUS
 from utils import CircleShape
 
@@ -8,11 +9,13 @@ class UFO(CircleShape):
     """Rzadko pojawiający się statek, który przelatuje w poprzek ekranu.
     Można go zestrzelić dla dodatkowych punktów.
     """
-    def __init__(self, x, y, radius=UFO_RADIUS):
-        super().__init__(x, y, radius)
+    SPRITE_PATH = "assets/ufo.png"
 
-        self.image = pygame.image.load("assets/ufo.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.radius * 2, self.radius * 1.3))
+    def __init__(self, x, y, radius=None):
+        # promień odczytywany przy tworzeniu – wartość może zmienić `config`
+        super().__init__(x, y, UFO_RADIUS if radius is None else radius)
+
+        self.image = assets.image(self.SPRITE_PATH, (self.radius * 2, self.radius * 1.3))
 
         self.rect = self.image.get_rect(center=(x, y))
 
@@ -21,7 +24,7 @@ class UFO(CircleShape):
         self.position += self.velocity * dt
 
         # Prosty sinusoidalny dryf w pionie
-        self.position.y += math.sin(pygame.time.get_ticks() * 0.002) * 0.3
+        self.position.y += math.sin(sim.clock.now() * 2.0) * 0.3
 
         # Po opuszczeniu ekranu – usuń obiekt
         if self.position.x < -self.radius or self.position.x > SCREEN_WIDTH + self.radius:
@@ -1,6 +1,9 @@
 import pygame
 import audio
-import random
+import assets
+from governor import quality
+from pool import Pooled
+from sim import rng
 
 # ------------------------------------------------------------
 #  Klasa bazowa dla sprite'ów o kolistym kształcie
@@ -12,6 +15,12 @@ class CircleShape(pygame.sprite.Sprite):
     Dostarcza wspólną obsługę pozycji, prędkości, promienia i kolizji
     dla asteroid, pocisków, statku gracza czy UFO.
     """
+    # Opcjonalny `EntityStore` (wektorowy backend ruchu) – ustawiany w pętli
+    # głównej tak samo jak `containers`; `store_mode` określa zachowanie
+    # obiektu na krawędzi ekranu (WRAP / CULL).
+    store = None
+    store_mode = 0
+
     def __init__(self, x, y, radius):
         # ten atrybut pozwala klasom potomnym wskazać grupy sprite'ów
         # (poprzez zmienną klasową `containers`), do których obiekt ma
@@ -25,9 +34,25 @@ class CircleShape(pygame.sprite.Sprite):
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
+        if self.store is not None:
+            self.store.adopt(self, self.store_mode)
+
+    def reset(self, x, y, radius):
+        # ponowne użycie obiektu z puli (`pool.py`) – stan jak po __init__,
+        # ale z zachowaniem istniejących wektorów i słownika atrybutów
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+
+        if self.store is not None:
+            self.store.adopt(self, self.store_mode)
+
     def collides_with(self, obj2):
-        distance = self.position.distance_to(obj2.position)
-        return distance <= (self.radius + obj2.radius)
+        # porównanie kwadratów odległości – bez kosztownego pierwiastka
+        r = self.radius + obj2.radius
+        return self.position.distance_squared_to(obj2.position) <= r * r
         # zwraca True lub False
 
     def draw(self, screen):
@@ -39,19 +64,19 @@ class CircleShape(pygame.sprite.Sprite):
         pass
 
 
-class Explosion(pygame.sprite.Sprite):
+class Explosion(Pooled, pygame.sprite.Sprite):
     """
     Animowany sprite wybuchu, który po odtworzeniu wszystkich klatek
     usuwa się automatycznie z grup sprite'ów i odtwarza efekt dźwiękowy.
     """
+    SPRITE_SHEET = "assets/explosion_sprite_sheet_fixed.png"
+    FRAME_SIZE   = (128, 128)
+    FRAME_COUNT  = 6   # 6 klatek animacji
+
     def __init__(self, position):
         super().__init__()
-        self.spritesheet = pygame.image.load("assets/explosion_sprite_sheet_fixed.png").convert_alpha()
-        self.frames = []
-        frame_width, frame_height = 128, 128
-        for i in range(6):  # 6 klatek animacji
-            frame = self.spritesheet.subsurface((i * frame_width, 0, frame_width, frame_height))
-            self.frames.append(frame)
+        # klatki są wycinane z arkusza tylko raz i współdzielone przez wszystkie wybuchy
+        self.frames = assets.frames(self.SPRITE_SHEET, self.FRAME_SIZE, self.FRAME_COUNT)
 
         self.current_frame = 0
         self.position = position
@@ -60,11 +85,20 @@ class Explosion(pygame.sprite.Sprite):
         self.animation_speed = 0.1  # odstęp czasu między klatkami (sekundy)
         self.timer = 0
 
+    def reset(self, position):
+        # ponowne użycie wybuchu z puli – animacja od pierwszej klatki
+        self.current_frame = 0
+        self.position = position
+        self.image = self.frames[0]
+        self.rect.center = position
+        self.timer = 0
+
     def update(self, dt):
         self.timer += dt
         if self.timer >= self.animation_speed:
             self.timer = 0
-            self.current_frame += 1
+            # przy obniżonej jakości (`governor.py`) animacja przeskakuje klatki
+            self.current_frame += quality.explosion_step
             if self.current_frame >= len(self.frames):
                 audio.play_sfx("explosion")
                 self.kill()  # Usunięcie obiektu po zakończeniu animacji
@@ -74,8 +108,8 @@ class Explosion(pygame.sprite.Sprite):
     
 def random_velocity(min_speed: float, max_speed: float) -> pygame.Vector2:
     """ Zwraca wektor `pygame.Vector2` o losowym kierunku i prędkości z podanego zakresu. """
-    angle  = random.uniform(0, 360)
-    speed  = random.uniform(min_speed, max_speed)
+    angle  = rng.uniform(0, 360)
+    speed  = rng.uniform(min_speed, max_speed)
     return pygame.Vector2(speed, 0).rotate(angle)
 
 
@@ -87,15 +121,15 @@ def random_outside_position(margin: int = 50) -> pygame.Vector2:
         Liczba pikseli określająca odległość od krawędzi (domyślnie 50).
     """
     screen = pygame.display.get_surface().get_rect()
-    side   = random.choice(("top", "bottom", "left", "right"))
+    side   = rng.choice(("top", "bottom", "left", "right"))
 
     if side == "top":
-        x, y = random.uniform(0, screen.width), -margin
+        x, y = rng.uniform(0, screen.width), -margin
     elif side == "bottom":
-        x, y = random.uniform(0, screen.width), screen.height + margin
+        x, y = rng.uniform(0, screen.width), screen.height + margin
     elif side == "left":
-        x, y = -margin, random.uniform(0, screen.height)
+        x, y = -margin, rng.uniform(0, screen.height)
     else:  # right
-        x, y = screen.width + margin, random.uniform(0, screen.height)
+        x, y = screen.width + margin, rng.uniform(0, screen.height)
 
     return pygame.Vector2(x, y)
\ No newline at end of file